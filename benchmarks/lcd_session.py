@@ -0,0 +1,91 @@
+"""Compares request latency of the pooled LCDClient session against opening a new
+``aiohttp.ClientSession`` for every request, as LCDClient used to.
+
+Usage::
+
+    python benchmarks/lcd_session.py                      # local stub LCD server
+    python benchmarks/lcd_session.py --url https://phoenix-lcd.terra.dev -n 50
+
+Without ``--url`` a stub LCD server is started on localhost, which measures TCP
+connection setup only. Point it to a real HTTPS endpoint to include TLS handshakes.
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+from aiohttp import ClientSession, web
+
+from terra_sdk.client.lcd import LCDClient
+from terra_sdk.util.url import urljoin
+
+NODE_INFO = "/cosmos/base/tendermint/v1beta1/node_info"
+
+
+def start_stub_server(port: int) -> str:
+    async def node_info(request):
+        return web.json_response(
+            {"default_node_info": {"network": "localterra"}, "application_version": {}}
+        )
+
+    app = web.Application()
+    app.router.add_get(NODE_INFO, node_info)
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return f"http://127.0.0.1:{port}"
+
+
+def report(name: str, samples: list):
+    samples = sorted(samples)
+    print(
+        f"{name:<20} mean {statistics.mean(samples) * 1000:8.2f} ms"
+        f"   p50 {samples[len(samples) // 2] * 1000:8.2f} ms"
+        f"   p99 {samples[int(len(samples) * 0.99)] * 1000:8.2f} ms"
+    )
+
+
+def bench_session_per_request(url: str, n: int) -> list:
+    async def request():
+        async with ClientSession(headers={"Accept": "application/json"}) as session:
+            async with session.get(urljoin(url, NODE_INFO)) as response:
+                await response.json(content_type=None)
+
+    loop = asyncio.new_event_loop()
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        loop.run_until_complete(request())
+        samples.append(time.perf_counter() - start)
+    loop.close()
+    return samples
+
+
+def bench_pooled_session(url: str, n: int) -> list:
+    samples = []
+    with LCDClient(url=url, chain_id="localterra") as terra:
+        for _ in range(n):
+            start = time.perf_counter()
+            terra.tendermint.node_info()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="LCD endpoint (default: local stub server)")
+    parser.add_argument("-n", "--requests", type=int, default=200)
+    parser.add_argument("--port", type=int, default=18317)
+    args = parser.parse_args()
+
+    url = args.url or start_stub_server(args.port)
+    report("session per request", bench_session_per_request(url, args.requests))
+    report("pooled session", bench_pooled_session(url, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Compares building and signing transactions without copying their messages against
+deep-copying the options, sign doc and JSON data along the way, as the SDK used to.
+
+Usage::
+
+    python benchmarks/tx_construction.py
+    python benchmarks/tx_construction.py -n 2000 --orders 5000
+
+Two workloads are measured: a contract execution carrying a large execute message
+(``--orders`` entries), and many small ``MsgSend`` transactions. Every step runs
+offline: fees, sequences and public keys are given, so no LCD is queried. Time is
+reported per transaction, memory as the peak traced by ``tracemalloc`` while building
+one transaction. For small transactions the secp256k1 signature dominates the time, so
+expect the difference to show mostly in the allocations.
+"""
+
+import argparse
+import copy
+import statistics
+import time
+import tracemalloc
+
+from terra_sdk.client.lcd import LCDClient
+from terra_sdk.client.lcd.api.tx import CreateTxOptions, SignerOptions
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.fee import Fee
+from terra_sdk.core.tx import AuthInfo, SignMode, Tx, TxBody
+from terra_sdk.core.wasm import MsgExecuteContract
+from terra_sdk.key.key import SignOptions
+from terra_sdk.key.mnemonic import MnemonicKey
+from terra_sdk.util.json import dict_to_data
+
+CONTRACT = "terra1nc5tatafv6eyq7llkr2gv50ff9e22mnf70qgjlv737ktmt4eswrquka9l6"
+SIGN_OPTIONS = SignOptions(
+    account_number=1,
+    sequence=0,
+    chain_id="pisco-1",
+    sign_mode=SignMode.SIGN_MODE_DIRECT,
+)
+
+
+def report(name: str, samples: list, peak: int):
+    samples = sorted(samples)
+    print(
+        f"{name:<28} mean {statistics.mean(samples) * 1e6:9.1f} us"
+        f"   p50 {samples[len(samples) // 2] * 1e6:9.1f} us"
+        f"   p99 {samples[int(len(samples) * 0.99)] * 1e6:9.1f} us"
+        f"   peak {peak / 1024:9.1f} KiB"
+    )
+
+
+def build(terra: LCDClient, key: MnemonicKey, options: CreateTxOptions) -> dict:
+    signer = SignerOptions(key.acc_address, sequence=0, public_key=key.public_key)
+    tx = terra.tx.create([signer], options)
+    signed = key.sign_tx(tx, SIGN_OPTIONS)
+    return signed.to_data()
+
+
+def build_with_copies(terra: LCDClient, key: MnemonicKey, options: CreateTxOptions):
+    # the deep copies taken by AsyncTxAPI.create, Key.create_signature and
+    # JSONSerializable.to_data before they were removed
+    opt = copy.deepcopy(options)
+    tx = Tx(TxBody(opt.msgs, opt.memo or "", 0), AuthInfo([], opt.fee), [])
+    signed = key.sign_tx(tx, SIGN_OPTIONS)
+    copy.deepcopy(signed.auth_info.signer_infos)
+    return dict_to_data(copy.deepcopy(signed.__dict__))
+
+
+def measure(fn, options_list: list) -> tuple:
+    samples = []
+    for options in options_list:
+        start = time.perf_counter()
+        fn(options)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(options_list[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return samples, peak
+
+
+def compare(terra: LCDClient, key: MnemonicKey, title: str, options_list: list):
+    print(title)
+    samples, peak = measure(lambda o: build_with_copies(terra, key, o), options_list)
+    report("  deep copies", samples, peak)
+    samples, peak = measure(lambda o: build(terra, key, o), options_list)
+    report("  shared messages", samples, peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--transactions", type=int, default=1000)
+    parser.add_argument("--orders", type=int, default=2000)
+    args = parser.parse_args()
+
+    key = MnemonicKey()
+    fee = Fee(200000, Coins(uluna=30000))
+    orders = [
+        {"id": str(i), "offer": {"native_token": {"denom": "uluna"}}, "amount": "1"}
+        for i in range(args.orders)
+    ]
+
+    with LCDClient(url="http://127.0.0.1:1317", chain_id="pisco-1") as terra:
+        compare(
+            terra,
+            key,
+            f"large execute message ({args.orders} orders)",
+            [
+                CreateTxOptions(
+                    msgs=[
+                        MsgExecuteContract(
+                            key.acc_address, CONTRACT, {"batch": {"orders": orders}}
+                        )
+                    ],
+                    fee=fee,
+                )
+                for _ in range(max(args.transactions // 100, 10))
+            ],
+        )
+        compare(
+            terra,
+            key,
+            f"small transactions ({args.transactions} MsgSend)",
+            [
+                CreateTxOptions(
+                    msgs=[MsgSend(key.acc_address, CONTRACT, Coins(uluna=i + 1))],
+                    fee=fee,
+                    memo=str(i),
+                )
+                for i in range(args.transactions)
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
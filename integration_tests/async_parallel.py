@@ -3,28 +3,24 @@ import asyncio
 import uvloop
 
 from terra_sdk.client.lcd import AsyncLCDClient
-
-
-async def with_sem(aw, sem):
-    async with sem:
-        print(sem)
-        return await aw
+from terra_sdk.client.lcd.ratelimit import RateLimiter
 
 
 async def main():
-    terra = AsyncLCDClient(url="https://pisco-lcd.terra.dev", chain_id="pisco-1")
+    terra = AsyncLCDClient(
+        url="https://pisco-lcd.terra.dev",
+        chain_id="pisco-1",
+        # 2 continuous connections, at most 10 requests per second
+        rate_limit=RateLimiter(max_in_flight=2, requests_per_second=10),
+    )
     validators, _ = await terra.staking.validators()
     validator_addresses = [v.operator_address for v in validators]
 
-    sem = asyncio.Semaphore(2)  # 2 continuous connections
     result = await asyncio.gather(
-        *[
-            with_sem(terra.oracle.misses(address), sem)
-            for address in validator_addresses
-        ]
+        *[terra.oracle.misses(address) for address in validator_addresses]
     )
 
-    await terra.session.close()
+    await terra.close()
     print(result)
 
 
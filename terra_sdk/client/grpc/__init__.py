@@ -0,0 +1,3 @@
+from .grpcclient import AsyncGrpcClient, GrpcClient
+
+__all__ = ["AsyncGrpcClient", "GrpcClient"]
@@ -0,0 +1,54 @@
+from typing import Union
+
+from terra_proto.cosmos.auth.v1beta1 import QueryAccountRequest, QueryStub
+
+from terra_sdk.core import AccAddress
+from terra_sdk.core.auth import (
+    Account,
+    BaseAccount,
+    ContinuousVestingAccount,
+    DelayedVestingAccount,
+    PeriodicVestingAccount,
+)
+
+from ...lcd.api._base import BaseAsyncAPI, sync_bind
+
+__all__ = ["AsyncAuthAPI", "AuthAPI"]
+
+
+class AsyncAuthAPI(BaseAsyncAPI):
+    async def account_info(
+        self, address: AccAddress
+    ) -> Union[
+        BaseAccount,
+        ContinuousVestingAccount,
+        DelayedVestingAccount,
+        PeriodicVestingAccount,
+    ]:
+        """Fetches the account information.
+
+        Args:
+            address (AccAddress): account address
+
+        Returns:
+            Union[BaseAccount, ContinuousVestingAccount, DelayedVestingAccount, PeriodicVestingAccount]: account information
+        """
+        res = await self._c._stub(QueryStub).account(
+            QueryAccountRequest(address=address)
+        )
+        return Account.from_proto(res.account)
+
+
+class AuthAPI(AsyncAuthAPI):
+    @sync_bind(AsyncAuthAPI.account_info)
+    def account_info(
+        self, address: AccAddress
+    ) -> Union[
+        BaseAccount,
+        ContinuousVestingAccount,
+        DelayedVestingAccount,
+        PeriodicVestingAccount,
+    ]:
+        pass
+
+    account_info.__doc__ = AsyncAuthAPI.account_info.__doc__
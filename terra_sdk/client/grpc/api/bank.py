@@ -0,0 +1,93 @@
+from typing import Optional
+
+from terra_proto.cosmos.bank.v1beta1 import (
+    QueryAllBalancesRequest,
+    QuerySpendableBalancesRequest,
+    QueryStub,
+    QueryTotalSupplyRequest,
+)
+
+from terra_sdk.core import AccAddress, Coins
+
+from ...lcd.api._base import BaseAsyncAPI, sync_bind
+from ...lcd.params import PaginationOptions
+from ..pagination import from_page_response, to_page_request
+
+__all__ = ["AsyncBankAPI", "BankAPI"]
+
+
+class AsyncBankAPI(BaseAsyncAPI):
+    async def balance(
+        self, address: AccAddress, params: Optional[PaginationOptions] = None
+    ) -> (Coins, dict):
+        """Fetches an account's current balance.
+
+        Args:
+            address (AccAddress): account address
+            params (PaginationOptions, optional): pagination options
+
+        Returns:
+            Coins: balance
+            Pagination: pagination info
+        """
+        res = await self._c._stub(QueryStub).all_balances(
+            QueryAllBalancesRequest(address=address, pagination=to_page_request(params))
+        )
+        return Coins.from_proto(res.balances), from_page_response(res.pagination)
+
+    async def total(self, params: Optional[PaginationOptions] = None) -> (Coins, dict):
+        """Fetches the current total supply of all tokens.
+
+        Args:
+            params (PaginationOptions, optional): pagination options
+
+        Returns:
+            Coins: total supply
+            Pagination: pagination info
+        """
+        res = await self._c._stub(QueryStub).total_supply(
+            QueryTotalSupplyRequest(pagination=to_page_request(params))
+        )
+        return Coins.from_proto(res.supply), from_page_response(res.pagination)
+
+    async def spendable_balances(
+        self, address: AccAddress, params: Optional[PaginationOptions] = None
+    ) -> (Coins, dict):
+        """Queries the spendable balance of all coins for a single account.
+
+        Args:
+            address (AccAddress): account address
+            params (PaginationOptions, optional): pagination options
+
+        Returns:
+            Coins: spendable balance
+            Pagination: pagination info
+        """
+        res = await self._c._stub(QueryStub).spendable_balances(
+            QuerySpendableBalancesRequest(
+                address=address, pagination=to_page_request(params)
+            )
+        )
+        return Coins.from_proto(res.balances), from_page_response(res.pagination)
+
+
+class BankAPI(AsyncBankAPI):
+    @sync_bind(AsyncBankAPI.balance)
+    def balance(
+        self, address: AccAddress, params: Optional[PaginationOptions] = None
+    ) -> (Coins, dict):
+        pass
+
+    @sync_bind(AsyncBankAPI.total)
+    def total(self, params: Optional[PaginationOptions] = None) -> (Coins, dict):
+        pass
+
+    @sync_bind(AsyncBankAPI.spendable_balances)
+    def spendable_balances(
+        self, address: AccAddress, params: Optional[PaginationOptions] = None
+    ) -> (Coins, dict):
+        pass
+
+    balance.__doc__ = AsyncBankAPI.balance.__doc__
+    total.__doc__ = AsyncBankAPI.total.__doc__
+    spendable_balances.__doc__ = AsyncBankAPI.spendable_balances.__doc__
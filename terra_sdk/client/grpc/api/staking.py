@@ -0,0 +1,125 @@
+from typing import List, Optional
+
+from terra_proto.cosmos.staking.v1beta1 import (
+    QueryDelegationRequest,
+    QueryDelegatorDelegationsRequest,
+    QueryStub,
+    QueryValidatorDelegationsRequest,
+    QueryValidatorRequest,
+    QueryValidatorsRequest,
+)
+
+from terra_sdk.core import AccAddress, ValAddress
+from terra_sdk.core.staking import Delegation, Validator
+
+from ...lcd.api._base import BaseAsyncAPI, sync_bind
+from ...lcd.params import PaginationOptions
+from ..pagination import from_page_response, to_page_request
+
+__all__ = ["AsyncStakingAPI", "StakingAPI"]
+
+
+class AsyncStakingAPI(BaseAsyncAPI):
+    async def delegations(
+        self,
+        delegator: Optional[AccAddress] = None,
+        validator: Optional[ValAddress] = None,
+        params: Optional[PaginationOptions] = None,
+    ) -> (List[Delegation], dict):
+        """Fetches current delegations, filtering by delegator, validator, or both.
+
+        Args:
+            delegator (Optional[AccAddress], optional): delegator account address.
+            validator (Optional[ValAddress], optional): validator operator address.
+            params (PaginationOptions, optional): pagination options
+
+        Raises:
+            TypeError: if both ``delegator`` and ``validator`` are ``None``.
+
+        Returns:
+            List[Delegation]: delegations
+            dict: pagination info
+        """
+        stub = self._c._stub(QueryStub)
+        if delegator is not None and validator is not None:
+            res = await stub.delegation(
+                QueryDelegationRequest(
+                    delegator_addr=delegator, validator_addr=validator
+                )
+            )
+            return [Delegation.from_proto(res.delegation_response)], None
+        elif delegator is not None:
+            res = await stub.delegator_delegations(
+                QueryDelegatorDelegationsRequest(
+                    delegator_addr=delegator, pagination=to_page_request(params)
+                )
+            )
+        elif validator is not None:
+            res = await stub.validator_delegations(
+                QueryValidatorDelegationsRequest(
+                    validator_addr=validator, pagination=to_page_request(params)
+                )
+            )
+        else:
+            raise TypeError("arguments delegator and validator cannot both be None")
+        return [
+            Delegation.from_proto(d) for d in res.delegation_responses
+        ], from_page_response(res.pagination)
+
+    async def validators(
+        self, params: Optional[PaginationOptions] = None
+    ) -> (List[Validator], dict):
+        """Fetch information of all validators.
+
+        Args:
+            params (PaginationOptions, optional): pagination options
+
+        Returns:
+            List[Validator]: validator informations
+            dict: pagination info
+        """
+        res = await self._c._stub(QueryStub).validators(
+            QueryValidatorsRequest(pagination=to_page_request(params))
+        )
+        return [Validator.from_proto(v) for v in res.validators], from_page_response(
+            res.pagination
+        )
+
+    async def validator(self, validator: ValAddress) -> Validator:
+        """Fetch information about a single validator.
+
+        Args:
+            validator (ValAddress): validator operator address
+
+        Returns:
+            Validator: validator information
+        """
+        res = await self._c._stub(QueryStub).validator(
+            QueryValidatorRequest(validator_addr=validator)
+        )
+        return Validator.from_proto(res.validator)
+
+
+class StakingAPI(AsyncStakingAPI):
+    @sync_bind(AsyncStakingAPI.delegations)
+    def delegations(
+        self,
+        delegator: Optional[AccAddress] = None,
+        validator: Optional[ValAddress] = None,
+        params: Optional[PaginationOptions] = None,
+    ) -> (List[Delegation], dict):
+        pass
+
+    @sync_bind(AsyncStakingAPI.validators)
+    def validators(
+        self, params: Optional[PaginationOptions] = None
+    ) -> (List[Validator], dict):
+        pass
+
+    @sync_bind(AsyncStakingAPI.validator)
+    def validator(self, validator: ValAddress) -> Validator:
+        pass
+
+    delegations.__doc__ = AsyncStakingAPI.delegations.__doc__
+    validators.__doc__ = AsyncStakingAPI.validators.__doc__
+    validator.__doc__ = AsyncStakingAPI.validator.__doc__
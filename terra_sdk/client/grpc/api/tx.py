@@ -0,0 +1,110 @@
+from terra_proto.cosmos.tx.v1beta1 import (
+    BroadcastMode,
+    BroadcastTxRequest,
+    GetTxRequest,
+    ServiceStub,
+)
+
+from terra_sdk.core.broadcast import (
+    AsyncTxBroadcastResult,
+    BlockTxBroadcastResult,
+    SyncTxBroadcastResult,
+)
+from terra_sdk.core.tx import Tx, TxInfo
+
+from ...lcd.api._base import BaseAsyncAPI, sync_bind
+
+__all__ = ["AsyncTxAPI", "TxAPI"]
+
+
+class AsyncTxAPI(BaseAsyncAPI):
+    async def tx_info(self, tx_hash: str) -> TxInfo:
+        """Fetches information for an included transaction given a tx hash.
+
+        Args:
+            tx_hash (str): hash of transaction to lookup
+
+        Returns:
+            TxInfo: transaction info
+        """
+        res = await self._c._stub(ServiceStub).get_tx(GetTxRequest(hash=tx_hash))
+        return TxInfo.from_proto(res.tx_response)
+
+    async def _broadcast(self, tx: Tx, mode: BroadcastMode):
+        res = await self._c._stub(ServiceStub).broadcast_tx(
+            BroadcastTxRequest(tx_bytes=tx.to_bytes(), mode=mode)
+        )
+        return res.tx_response
+
+    async def broadcast_sync(self, tx: Tx) -> SyncTxBroadcastResult:
+        """Broadcasts a transaction using the ``sync`` broadcast mode.
+
+        Args:
+            tx (Tx): transaction to broadcast
+
+        Returns:
+            SyncTxBroadcastResult: result
+        """
+        res = await self._broadcast(tx, BroadcastMode.BROADCAST_MODE_SYNC)
+        return SyncTxBroadcastResult(
+            txhash=res.txhash,
+            raw_log=res.raw_log,
+            code=res.code,
+            codespace=res.codespace,
+        )
+
+    async def broadcast_async(self, tx: Tx) -> AsyncTxBroadcastResult:
+        """Broadcasts a transaction using the ``async`` broadcast mode.
+
+        Args:
+            tx (Tx): transaction to broadcast
+
+        Returns:
+            AsyncTxBroadcastResult: result
+        """
+        res = await self._broadcast(tx, BroadcastMode.BROADCAST_MODE_ASYNC)
+        return AsyncTxBroadcastResult(txhash=res.txhash)
+
+    async def broadcast(self, tx: Tx) -> BlockTxBroadcastResult:
+        """Broadcasts a transaction using the ``block`` broadcast mode.
+
+        Args:
+            tx (Tx): transaction to broadcast
+
+        Returns:
+            BlockTxBroadcastResult: result
+        """
+        res = await self._broadcast(tx, BroadcastMode.BROADCAST_MODE_BLOCK)
+        return BlockTxBroadcastResult(
+            height=res.height,
+            txhash=res.txhash,
+            raw_log=res.raw_log,
+            gas_wanted=res.gas_wanted,
+            gas_used=res.gas_used,
+            logs=[log.to_dict() for log in res.logs] or None,
+            code=res.code,
+            codespace=res.codespace,
+        )
+
+
+class TxAPI(AsyncTxAPI):
+    @sync_bind(AsyncTxAPI.tx_info)
+    def tx_info(self, tx_hash: str) -> TxInfo:
+        pass
+
+    @sync_bind(AsyncTxAPI.broadcast_sync)
+    def broadcast_sync(self, tx: Tx) -> SyncTxBroadcastResult:
+        pass
+
+    @sync_bind(AsyncTxAPI.broadcast_async)
+    def broadcast_async(self, tx: Tx) -> AsyncTxBroadcastResult:
+        pass
+
+    @sync_bind(AsyncTxAPI.broadcast)
+    def broadcast(self, tx: Tx) -> BlockTxBroadcastResult:
+        pass
+
+    tx_info.__doc__ = AsyncTxAPI.tx_info.__doc__
+    broadcast_sync.__doc__ = AsyncTxAPI.broadcast_sync.__doc__
+    broadcast_async.__doc__ = AsyncTxAPI.broadcast_async.__doc__
+    broadcast.__doc__ = AsyncTxAPI.broadcast.__doc__
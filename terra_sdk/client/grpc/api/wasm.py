@@ -0,0 +1,85 @@
+import json
+from typing import Any, Union
+
+from terra_proto.cosmos.base.query.v1beta1 import PageRequest
+from terra_proto.cosmwasm.wasm.v1 import (
+    QueryContractHistoryRequest,
+    QueryContractInfoRequest,
+    QuerySmartContractStateRequest,
+    QueryStub,
+)
+
+from terra_sdk.core import AccAddress
+from terra_sdk.core.wasm.data import AbsoluteTxPosition
+
+from ...lcd.api._base import BaseAsyncAPI, sync_bind
+
+__all__ = ["AsyncWasmAPI", "WasmAPI"]
+
+
+class AsyncWasmAPI(BaseAsyncAPI):
+    async def contract_info(self, contract_address: AccAddress) -> dict:
+        """Fetches information about an instantiated contract.
+
+        Args:
+            contract_address (AccAddress): contract address
+
+        Returns:
+            dict: contract information
+        """
+        res = await self._c._stub(QueryStub).contract_info(
+            QueryContractInfoRequest(address=contract_address)
+        )
+        contract_info = res.contract_info
+        # the first history entry is the instantiation
+        history = await self._c._stub(QueryStub).contract_history(
+            QueryContractHistoryRequest(
+                address=contract_address, pagination=PageRequest(limit=1)
+            )
+        )
+        return {
+            "code_id": contract_info.code_id,
+            "address": res.address,
+            "creator": contract_info.creator,
+            "admin": contract_info.admin or None,
+            "label": contract_info.label or None,
+            "init_msg": json.loads(history.entries[0].msg),
+            "created": AbsoluteTxPosition.from_proto(contract_info.created)
+            if contract_info.created
+            else None,
+            "ibc_port_id": contract_info.ibc_port_id or None,
+        }
+
+    async def contract_query(
+        self, contract_address: AccAddress, query: Union[dict, str]
+    ) -> Any:
+        """Runs a QueryMsg on a contract.
+
+        Args:
+            contract_address (AccAddress): contract address
+            query (dict): QueryMsg to run
+
+        Returns:
+            Any: results of query
+        """
+        res = await self._c._stub(QueryStub).smart_contract_state(
+            QuerySmartContractStateRequest(
+                address=contract_address, query_data=json.dumps(query).encode()
+            )
+        )
+        return json.loads(res.data)
+
+
+class WasmAPI(AsyncWasmAPI):
+    @sync_bind(AsyncWasmAPI.contract_info)
+    def contract_info(self, contract_address: AccAddress) -> dict:
+        pass
+
+    @sync_bind(AsyncWasmAPI.contract_query)
+    def contract_query(
+        self, contract_address: AccAddress, query: Union[dict, str]
+    ) -> Any:
+        pass
+
+    contract_info.__doc__ = AsyncWasmAPI.contract_info.__doc__
+    contract_query.__doc__ = AsyncWasmAPI.contract_query.__doc__
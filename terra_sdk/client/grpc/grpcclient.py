@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, get_event_loop
+from typing import Optional, Type, TypeVar
+
+from betterproto.grpc.grpclib_client import ServiceStub
+from grpclib.client import Channel
+
+from terra_sdk.util.loop import get_loop_thread
+
+from .api.auth import AsyncAuthAPI, AuthAPI
+from .api.bank import AsyncBankAPI, BankAPI
+from .api.staking import AsyncStakingAPI, StakingAPI
+from .api.tx import AsyncTxAPI, TxAPI
+from .api.wasm import AsyncWasmAPI, WasmAPI
+
+__all__ = ["AsyncGrpcClient", "GrpcClient"]
+
+S = TypeVar("S", bound=ServiceStub)
+
+
+async def _open_channel(host: Optional[str], port: int, ssl: bool) -> Channel:
+    # a channel binds to the event loop of the thread that creates it
+    return Channel(host, port, ssl=ssl)
+
+
+class AsyncGrpcClient:
+    """Queries a Terra node and broadcasts transactions over gRPC. Messages are
+    exchanged as protobuf, without the JSON and base64 conversions of the LCD.
+
+    Module APIs return the same :mod:`terra_sdk.core` objects as the ones of
+    :class:`AsyncLCDClient<terra_sdk.client.lcd.AsyncLCDClient>`. Failed calls raise
+    ``grpclib.exceptions.GRPCError``.
+
+    Args:
+        host (str, optional): host of the gRPC server
+        port (int, optional): port of the gRPC server
+        chain_id (str, optional): chain ID of the network
+        ssl (bool, optional): whether to use TLS
+        timeout (float, optional): timeout of a single call in seconds
+        channel (Channel, optional): existing channel to use instead of opening one
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: int = 9090,
+        chain_id: Optional[str] = None,
+        ssl: bool = False,
+        timeout: Optional[float] = None,
+        loop: Optional[AbstractEventLoop] = None,
+        channel: Optional[Channel] = None,
+    ):
+        if loop is None:
+            loop = get_event_loop()
+        self.loop = loop
+        self.chain_id = chain_id
+        self.timeout = timeout
+        if channel is None:
+            channel = Channel(host, port, ssl=ssl)
+        self.channel = channel
+
+        self.auth = AsyncAuthAPI(self)
+        self.bank = AsyncBankAPI(self)
+        self.staking = AsyncStakingAPI(self)
+        self.wasm = AsyncWasmAPI(self)
+        self.tx = AsyncTxAPI(self)
+
+    def _stub(self, stub: Type[S]) -> S:
+        return stub(self.channel, timeout=self.timeout)
+
+    async def close(self):
+        """Closes the channel."""
+        self.channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class GrpcClient(AsyncGrpcClient):
+    """Synchronous version of :class:`AsyncGrpcClient`. Calls run on the event loop
+    thread shared by the synchronous clients."""
+
+    chain_id: Optional[str]
+    """Chain ID of blockchain network connecting to."""
+
+    auth: AuthAPI
+    """:class:`AuthAPI<terra_sdk.client.grpc.api.auth.AuthAPI>`."""
+
+    bank: BankAPI
+    """:class:`BankAPI<terra_sdk.client.grpc.api.bank.BankAPI>`."""
+
+    staking: StakingAPI
+    """:class:`StakingAPI<terra_sdk.client.grpc.api.staking.StakingAPI>`."""
+
+    wasm: WasmAPI
+    """:class:`WasmAPI<terra_sdk.client.grpc.api.wasm.WasmAPI>`."""
+
+    tx: TxAPI
+    """:class:`TxAPI<terra_sdk.client.grpc.api.tx.TxAPI>`."""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: int = 9090,
+        chain_id: Optional[str] = None,
+        ssl: bool = False,
+        timeout: Optional[float] = None,
+        channel: Optional[Channel] = None,
+    ):
+        if channel is None:
+            channel = get_loop_thread().run(_open_channel(host, port, ssl))
+        super().__init__(
+            host,
+            port,
+            chain_id,
+            ssl,
+            timeout,
+            loop=get_loop_thread().loop,
+            channel=channel,
+        )
+
+        self.auth = AuthAPI(self)
+        self.bank = BankAPI(self)
+        self.staking = StakingAPI(self)
+        self.wasm = WasmAPI(self)
+        self.tx = TxAPI(self)
+
+    async def __aenter__(self):
+        raise NotImplementedError(
+            "async context manager not implemented - you probably want AsyncGrpcClient"
+        )
+
+    async def __aexit__(self, exc_type, exc, tb):
+        raise NotImplementedError(
+            "async context manager not implemented - you probably want AsyncGrpcClient"
+        )
+
+    def close(self):  # type: ignore
+        """Closes the channel."""
+        get_loop_thread().run(super().close())
+
+    def _run_sync(self, coroutine):
+        return get_loop_thread().run(coroutine)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
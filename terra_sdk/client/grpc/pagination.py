@@ -0,0 +1,48 @@
+import base64
+from typing import Optional
+
+from terra_proto.cosmos.base.query.v1beta1 import PageRequest, PageResponse
+
+from ..lcd.params import PaginationOptions
+
+__all__ = ["to_page_request", "from_page_response"]
+
+
+def to_page_request(params: Optional[PaginationOptions]) -> Optional[PageRequest]:
+    """Converts pagination options into a ``PageRequest`` message.
+
+    Args:
+        params (PaginationOptions, optional): pagination options
+
+    Returns:
+        Optional[PageRequest]: page request, ``None`` for the default page
+    """
+    if params is None:
+        return None
+    return PageRequest(
+        key=base64.b64decode(params.key) if params.key else b"",
+        offset=params.offset or 0,
+        limit=params.limit or 0,
+        count_total=bool(params.count_total),
+        reverse=bool(params.reverse),
+    )
+
+
+def from_page_response(proto: Optional[PageResponse]) -> Optional[dict]:
+    """Converts a ``PageResponse`` message into the pagination info returned by the
+    LCD, so that ``next_key`` can be passed on in :class:`PaginationOptions`.
+
+    Args:
+        proto (PageResponse, optional): page response
+
+    Returns:
+        Optional[dict]: pagination info
+    """
+    if proto is None:
+        return None
+    return {
+        "next_key": base64.b64encode(proto.next_key).decode()
+        if proto.next_key
+        else None,
+        "total": str(proto.total),
+    }
@@ -1,5 +1,20 @@
 from .lcdclient import AsyncLCDClient, LCDClient
+from .pagination import fetch_all, paginate
 from .params import PaginationOptions
+from .pipeline import TxPipeline
+from .session import ConnectionOptions
 from .wallet import AsyncWallet, Wallet
+from .walletpool import WalletPool
 
-__all__ = ["AsyncLCDClient", "LCDClient", "AsyncWallet", "Wallet", "PaginationOptions"]
+__all__ = [
+    "AsyncLCDClient",
+    "LCDClient",
+    "AsyncWallet",
+    "Wallet",
+    "TxPipeline",
+    "WalletPool",
+    "PaginationOptions",
+    "paginate",
+    "fetch_all",
+    "ConnectionOptions",
+]
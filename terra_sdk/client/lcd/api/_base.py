@@ -9,8 +9,10 @@ class BaseAsyncAPI:
         self._c = c
 
     def _run_sync(self, coroutine):
-        """Runs an asynchronous coroutine synchronously."""
-        return self._c.loop.run_until_complete(coroutine)
+        """Runs an asynchronous coroutine synchronously. When called from the client's
+        event loop, e.g. by another API method, the coroutine is returned to be awaited
+        with :meth:`_try_await`."""
+        return self._c._run_sync(coroutine)
 
     @staticmethod
     async def _try_await(aw):
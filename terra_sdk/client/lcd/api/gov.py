@@ -125,7 +125,7 @@ class AsyncGovAPI(BaseAsyncAPI):
             params (APIParams, optional): additional params for the API like pagination
         """
 
-        proposal = self.proposal(proposal_id)
+        proposal = await BaseAsyncAPI._try_await(self.proposal(proposal_id))
 
         status = proposal.status
         if (
@@ -153,8 +153,8 @@ class AsyncGovAPI(BaseAsyncAPI):
             params (APIParams, optional): additional params for the API like pagination
         """
 
-        proposal = self.proposal(proposal_id)
-        if proposal.status == ProposalStatus.PROPOSAL_STATUS_DEPOSIT_PERIOD:
+        proposal = await BaseAsyncAPI._try_await(self.proposal(proposal_id))
+        if proposal.status == ProposalStatus.PROPOSAL_STATUS_DEPOSIT_PERIOD.name:
             res = await self._c._get(
                 f"/cosmos/gov/v1beta1/proposals/{proposal_id}/votes", params
             )
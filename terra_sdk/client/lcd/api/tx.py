@@ -1,6 +1,6 @@
 import base64
-import copy
-from typing import List, Optional
+from asyncio import Future, Semaphore, ensure_future, gather
+from typing import Dict, Hashable, List, Optional, Tuple
 
 import attr
 from multidict import CIMultiDict
@@ -14,7 +14,7 @@ from terra_sdk.core.broadcast import (
 from terra_sdk.core.fee import Fee
 from terra_sdk.core.msg import Msg
 from terra_sdk.core.tx import AuthInfo, SignerData, SignMode, Tx, TxBody, TxInfo
-from terra_sdk.util.hash import hash_amino
+from terra_sdk.util.hash import hash_amino, hash_bytes
 from terra_sdk.util.json import JSONSerializable
 
 from ..params import APIParams
@@ -154,8 +154,6 @@ class AsyncTxAPI(BaseAsyncAPI):
             Tx: unsigned tx
         """
 
-        opt = copy.deepcopy(options)
-
         signer_data: List[SignerData] = []
         for signer in signers:
             seq = signer.sequence
@@ -172,12 +170,13 @@ class AsyncTxAPI(BaseAsyncAPI):
             signer_data.append(SignerData(seq, pubkey))
 
         # create the fake fee
-        if opt.fee is None:
-            opt.fee = await BaseAsyncAPI._try_await(self.estimate_fee(signer_data, opt))
+        fee = options.fee
+        if fee is None:
+            fee = await BaseAsyncAPI._try_await(self.estimate_fee(signer_data, options))
 
         return Tx(
-            TxBody(opt.msgs, opt.memo or "", opt.timeout_height or 0),
-            AuthInfo([], opt.fee),
+            TxBody(list(options.msgs), options.memo or "", options.timeout_height or 0),
+            AuthInfo([], fee),
             [],
         )
 
@@ -205,18 +204,11 @@ class AsyncTxAPI(BaseAsyncAPI):
                 gas_prices_coins = gas_prices_coins.filter(
                     lambda c: c.denom in _fee_denoms
                 )
-        tx_body = TxBody(messages=options.msgs, memo=options.memo or "")
-        emptyCoins = Coins()
-        emptyFee = Fee(0, emptyCoins)
-        auth_info = AuthInfo([], emptyFee)
-
-        tx = Tx(tx_body, auth_info, [])
-        tx.append_empty_signatures(signers)
+        tx = self._simulation_tx(signers, options)
 
         gas = options.gas
         if gas is None or gas == "auto" or int(gas) == 0:
-            opt = copy.deepcopy(options)
-            opt.gas_adjustment = gas_adjustment
+            opt = attr.evolve(options, gas_adjustment=gas_adjustment)
             gas = str(await super()._try_await(self.estimate_gas(tx, opt)))
 
         fee_amount = (
@@ -227,20 +219,86 @@ class AsyncTxAPI(BaseAsyncAPI):
 
         return Fee(Numeric.parse(gas), fee_amount, "", "")
 
+    @staticmethod
+    def _simulation_tx(signers: List[SignerOptions], options: CreateTxOptions) -> Tx:
+        tx_body = TxBody(messages=options.msgs, memo=options.memo or "")
+        emptyCoins = Coins()
+        emptyFee = Fee(0, emptyCoins)
+        auth_info = AuthInfo([], emptyFee)
+
+        tx = Tx(tx_body, auth_info, [])
+        tx.append_empty_signatures(signers)
+        return tx
+
+    async def estimate_fees(
+        self,
+        batch: List[Tuple[List[SignerOptions], CreateTxOptions]],
+        concurrency: int = 10,
+    ) -> List[Fee]:
+        """Estimates the fees of many transactions by simulating them concurrently.
+        Transactions that would be simulated with the same bytes and fee options are
+        simulated only once.
+
+        Args:
+            batch (List[Tuple[List[SignerOptions], CreateTxOptions]]): signers and
+                options of each transaction
+            concurrency (int, optional): maximum number of simulations run at the same
+                time
+
+        Returns:
+            List[Fee]: estimated fees, in the order of ``batch``
+        """
+        semaphore = Semaphore(concurrency)
+        estimates: Dict[Hashable, Future] = {}
+
+        async def estimate(signers: List[SignerOptions], options: CreateTxOptions):
+            async with semaphore:
+                return await BaseAsyncAPI._try_await(
+                    self.estimate_fee(signers, options)
+                )
+
+        futures = []
+        for signers, options in batch:
+            key = (
+                self._simulation_tx(signers, options).to_bytes(),
+                options.gas,
+                str(Coins(options.gas_prices)) if options.gas_prices else None,
+                str(options.gas_adjustment),
+                tuple(options.fee_denoms or ()),
+            )
+            if key not in estimates:
+                estimates[key] = ensure_future(estimate(signers, options))
+            futures.append(estimates[key])
+        try:
+            fees = await gather(*futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return [attr.evolve(fee) for fee in fees]
+
     async def estimate_gas(self, tx: Tx, options: Optional[CreateTxOptions]) -> int:
         gas_adjustment = options.gas_adjustment if options else self._c.gas_adjustment
 
-        res = await self._c._post(
-            "/cosmos/tx/v1beta1/simulate",
-            {"tx_bytes": await super()._try_await(self.encode(tx))},
+        gas_model = self._c.gas_model
+        gas_used = (
+            gas_model.predict(tx.body.messages) if gas_model is not None else None
         )
-        simulated = SimulateResponse.from_data(res)
-
-        return int(Dec(gas_adjustment).mul(simulated.gas_info["gas_used"]))
+        if gas_used is None:
+            res = await self._c._post(
+                "/cosmos/tx/v1beta1/simulate",
+                {"tx_bytes": await super()._try_await(self.encode(tx))},
+                idempotent=True,
+            )
+            gas_used = SimulateResponse.from_data(res).gas_info["gas_used"]
+            if gas_model is not None:
+                gas_model.record(tx.body.messages, int(gas_used))
+
+        return int(Dec(gas_adjustment).mul(gas_used))
 
     async def encode(self, tx: Tx) -> str:
         """Encode a Tx to base64 encoded proto string"""
-        return base64.b64encode(bytes(tx.to_proto())).decode()
+        return base64.b64encode(tx.to_bytes()).decode()
 
     async def decode(self, tx: str) -> Tx:
         """Decode base64 encoded proto string to a Tx"""
@@ -255,8 +313,7 @@ class AsyncTxAPI(BaseAsyncAPI):
         Returns:
             str: transaction hash
         """
-        amino = await super()._try_await(self.encode(tx))
-        return hash_amino(amino)
+        return hash_bytes(tx.to_bytes())
 
     async def _broadcast(
         self, tx: Tx, mode: str, options: BroadcastOptions = None
@@ -402,6 +459,16 @@ class TxAPI(AsyncTxAPI):
 
     estimate_fee.__doc__ = AsyncTxAPI.estimate_fee.__doc__
 
+    @sync_bind(AsyncTxAPI.estimate_fees)
+    def estimate_fees(
+        self,
+        batch: List[Tuple[List[SignerOptions], CreateTxOptions]],
+        concurrency: int = 10,
+    ) -> List[Fee]:
+        pass
+
+    estimate_fees.__doc__ = AsyncTxAPI.estimate_fees.__doc__
+
     @sync_bind(AsyncTxAPI.estimate_gas)
     def estimate_gas(
         self, tx: Tx, options: Optional[CreateTxOptions]
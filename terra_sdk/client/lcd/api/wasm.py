@@ -69,7 +69,9 @@ class AsyncWasmAPI(BaseAsyncAPI):
         )
         contract_info = res.get("contract_info")
         contract_address = res.get("address")
-        history_entries = self.contract_history(contract_address)
+        history_entries = await BaseAsyncAPI._try_await(
+            self.contract_history(contract_address)
+        )
         return {
             "code_id": Numeric.parse(contract_info["code_id"]),
             "address": contract_address,
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from time import monotonic
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+from multidict import CIMultiDict
+
+__all__ = ["ResponseCache"]
+
+
+def normalize_params(params: Optional[Union[CIMultiDict, list, dict]]) -> Tuple:
+    """Turns query parameters into a hashable tuple that does not depend on their order."""
+    if not params:
+        return ()
+    items = params.items() if hasattr(params, "items") else params
+    return tuple(sorted((str(k), str(v)) for k, v in items))
+
+
+class ResponseCache:
+    """Opt-in LRU cache of LCD query responses with per-route time-to-live.
+
+    Routes are matched against ``route_ttls`` with shell-style wildcards (``*`` also
+    matches ``/``) in the given order, and the first match wins. Routes that match no
+    pattern use ``ttl``. A TTL of ``None`` keeps entries until they are evicted, and a
+    TTL of ``0`` disables caching for the route. Responses of queries pinned to a block
+    height never change and are kept until they are evicted.
+
+    .. note::
+        Cached responses are shared between callers and must not be mutated.
+
+    Args:
+        max_size (int, optional): maximum number of cached responses.
+        ttl (float, optional): default time-to-live in seconds.
+        route_ttls (Dict[str, Optional[float]], optional): time-to-live per route pattern,
+            e.g. ``{"/cosmos/*/params": 3600, "/cosmos/bank/*": 1}``.
+    """
+
+    hits: int
+    """Number of lookups answered from the cache."""
+
+    misses: int
+    """Number of lookups that had to go to the node."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: Optional[float] = 5.0,
+        route_ttls: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.route_ttls = dict(route_ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Finds the time-to-live of a route.
+
+        Args:
+            path (str): route, e.g. ``/cosmos/staking/v1beta1/params``
+
+        Returns:
+            Optional[float]: time-to-live in seconds, ``None`` for no expiry
+        """
+        for pattern, ttl in self.route_ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def key(
+        path: str,
+        params: Optional[Union[CIMultiDict, list, dict]],
+        height: Optional[int] = None,
+    ) -> Hashable:
+        """Builds the cache key of a query.
+
+        Args:
+            path (str): route
+            params: query parameters
+            height (int, optional): block height the query is pinned to
+
+        Returns:
+            Hashable: cache key
+        """
+        return path, normalize_params(params), height
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Looks up a response and counts the hit or miss.
+
+        Args:
+            key (Hashable): cache key
+
+        Returns:
+            Tuple[bool, Any]: whether the key was found, and the cached response
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires is None or monotonic() < expires:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def set(self, key: Hashable, path: str, value: Any, pinned: bool = False):
+        """Stores a response, evicting the least recently used ones beyond ``max_size``.
+
+        Args:
+            key (Hashable): cache key
+            path (str): route, used to find the time-to-live
+            value (Any): response
+            pinned (bool, optional): whether the query was pinned to a block height, in
+                which case the response never expires
+        """
+        ttl = None if pinned else self.ttl_for(path)
+        if ttl is not None and ttl <= 0:
+            return
+        self._entries[key] = (None if ttl is None else monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops all cached responses."""
+        self._entries.clear()
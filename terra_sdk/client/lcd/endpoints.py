@@ -0,0 +1,259 @@
+from asyncio import TimeoutError
+from collections import deque
+from time import monotonic
+from typing import Deque, Iterable, List, Optional
+
+import attr
+from aiohttp import ClientError
+
+from terra_sdk.exceptions import LCDResponseError, LCDUnavailableError
+
+__all__ = ["Endpoint", "EndpointPool", "HedgeOptions", "is_node_failure"]
+
+UNAVAILABLE = (
+    "no LCD endpoint is available: all failed their health check or have an open "
+    "circuit breaker"
+)
+
+
+def is_node_failure(error: BaseException) -> bool:
+    """Checks whether an error of a request should be blamed on the node that served it
+    (connection errors, timeouts, ``429`` and ``5xx`` responses) rather than on the
+    request itself.
+
+    Args:
+        error (BaseException): raised error
+
+    Returns:
+        bool: whether the node failed
+    """
+    if isinstance(error, LCDResponseError):
+        status = getattr(error.response, "status", 0)
+        return status == 429 or status >= 500
+    return isinstance(error, (ClientError, TimeoutError))
+
+
+class Endpoint:
+    """A single LCD node tracked by :class:`EndpointPool`.
+
+    Args:
+        url (str): base URL of the LCD node
+    """
+
+    url: str
+    """Base URL of the LCD node."""
+
+    latency: Optional[float]
+    """Exponentially weighted moving average of response latency in seconds, ``None``
+    before the first response."""
+
+    healthy: bool
+    """Whether the last request to the node succeeded."""
+
+    passed_health_check: bool
+    """Whether the node passed its last health check: it answered, is not syncing and
+    serves the client's chain. Request outcomes leave it alone, and nodes that failed
+    the check receive no requests until they pass it again."""
+
+    failures: int
+    """Number of consecutive failed requests."""
+
+    samples: Deque[float]
+    """Latencies of the most recent responses in seconds."""
+
+    open_until: Optional[float]
+    """While the circuit breaker is open, the ``time.monotonic()`` at which the node
+    may be tried again."""
+
+    probing: bool
+    """Whether the trial request of a half-open circuit breaker is in flight."""
+
+    def __init__(self, url: str, max_samples: int = 100):
+        self.url = url
+        self.latency = None
+        self.healthy = True
+        self.passed_health_check = True
+        self.failures = 0
+        self.samples = deque(maxlen=max_samples)
+        self.open_until = None
+        self.probing = False
+
+    @property
+    def circuit_open(self) -> bool:
+        """Whether the circuit breaker currently keeps traffic away from the node."""
+        return self.open_until is not None and (
+            self.probing or monotonic() < self.open_until
+        )
+
+    def __repr__(self):
+        return f"Endpoint({self.url!r}, latency={self.latency}, healthy={self.healthy})"
+
+    def record_success(self, latency: float, alpha: float):
+        self.latency = (
+            latency
+            if self.latency is None
+            else alpha * latency + (1 - alpha) * self.latency
+        )
+        self.failures = 0
+        self.healthy = True
+        self.open_until = None
+        self.probing = False
+        self.samples.append(latency)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Computes a latency percentile over the most recent responses.
+
+        Args:
+            q (float): percentile as a fraction, e.g. ``0.95``
+
+        Returns:
+            Optional[float]: latency in seconds, ``None`` without samples
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    def record_failure(self):
+        self.failures += 1
+        self.healthy = False
+
+
+class EndpointPool:
+    """A set of LCD nodes serving the same chain. Requests are routed to the fastest
+    healthy node and fail over to the next one when a node errors out.
+
+    Optionally, each node gets a circuit breaker: after ``failure_threshold``
+    consecutive failures no traffic is sent to the node for ``cooldown`` seconds. The
+    first request after the cooldown is a trial, and no other request is sent to the
+    node while it is in flight; if it fails the circuit opens again.
+
+    Args:
+        urls (Iterable[str]): base URLs of the LCD nodes
+        ewma_alpha (float, optional): weight of the newest sample in the latency average.
+        failure_threshold (int, optional): consecutive failures that open the circuit
+            breaker of a node. ``None`` disables circuit breaking.
+        cooldown (float, optional): seconds an open circuit stays open.
+    """
+
+    endpoints: List[Endpoint]
+    """Tracked nodes, in the order they were given."""
+
+    def __init__(
+        self,
+        urls: Iterable[str],
+        ewma_alpha: float = 0.3,
+        failure_threshold: Optional[int] = None,
+        cooldown: float = 30.0,
+    ):
+        self.endpoints = [Endpoint(url) for url in urls]
+        if not self.endpoints:
+            raise ValueError("EndpointPool requires at least one url")
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def __iter__(self):
+        return iter(self.endpoints)
+
+    def ranked(self) -> List[Endpoint]:
+        """Orders the nodes by preference: healthy ones first, fastest first. Nodes
+        without a measured latency are tried before measured ones so that they get
+        probed. Nodes with an open circuit breaker or that failed their last health
+        check are left out.
+
+        Returns:
+            List[Endpoint]: nodes in routing order, empty if none is available
+        """
+        return sorted(
+            [e for e in self.endpoints if e.passed_health_check and not e.circuit_open],
+            key=lambda e: (not e.healthy, e.latency or 0.0),
+        )
+
+    def select(self) -> Endpoint:
+        """Picks the node the next request should be sent to.
+
+        Raises:
+            LCDUnavailableError: if no node is available
+
+        Returns:
+            Endpoint: preferred node
+        """
+        ranked = self.ranked()
+        if not ranked:
+            raise LCDUnavailableError(UNAVAILABLE)
+        return ranked[0]
+
+    def acquire(self, endpoint: Endpoint) -> bool:
+        """Claims a node for a request. Once the cooldown of an open circuit breaker
+        has passed, the first request to claim the node becomes its trial and the node
+        is refused to all others until :meth:`release` is called.
+
+        Args:
+            endpoint (Endpoint): node the request is about to be sent to
+
+        Returns:
+            bool: whether the request may be sent to the node
+        """
+        if endpoint.circuit_open:
+            return False
+        if endpoint.open_until is not None:
+            endpoint.probing = True
+        return True
+
+    def release(self, endpoint: Endpoint):
+        """Ends the trial request of a half-open node. If the trial neither succeeded
+        nor failed through the node's fault, the next request becomes the trial.
+
+        Args:
+            endpoint (Endpoint): node the trial request was sent to
+        """
+        endpoint.probing = False
+
+    def record_success(self, endpoint: Endpoint, latency: float):
+        endpoint.record_success(latency, self.ewma_alpha)
+
+    def record_failure(self, endpoint: Endpoint):
+        endpoint.record_failure()
+        if (
+            self.failure_threshold is not None
+            and endpoint.failures >= self.failure_threshold
+        ):
+            endpoint.open_until = monotonic() + self.cooldown
+
+
+@attr.s
+class HedgeOptions:
+    """Settings for hedged read requests. When the preferred node has not answered a
+    ``GET`` request after the hedging delay, the request is duplicated to the next node
+    and whichever answer arrives first is used; the other request is cancelled.
+
+    Args:
+        delay (float, optional): fixed delay in seconds. If ``None``, the ``percentile``
+            of the preferred node's recent latencies is used.
+        percentile (float, optional): latency percentile used as the delay.
+        min_samples (int, optional): number of latency samples a node needs before its
+            percentile is trusted; requests to nodes with fewer samples are not hedged.
+    """
+
+    delay: Optional[float] = attr.ib(default=None)
+    percentile: float = attr.ib(default=0.95)
+    min_samples: int = attr.ib(default=20)
+
+    def delay_for(self, endpoint: Endpoint) -> Optional[float]:
+        """Computes how long to wait for ``endpoint`` before hedging.
+
+        Args:
+            endpoint (Endpoint): node the request was sent to first
+
+        Returns:
+            Optional[float]: delay in seconds, ``None`` if the request should not be hedged
+        """
+        if self.delay is not None:
+            return self.delay
+        if len(endpoint.samples) < self.min_samples:
+            return None
+        return endpoint.percentile(self.percentile)
@@ -0,0 +1,132 @@
+import json
+import math
+from collections import deque
+from typing import Deque, Dict, Hashable, List, Optional, Tuple, Union
+
+from terra_sdk.core.msg import Msg
+from terra_sdk.core.wasm import MsgExecuteContract
+
+__all__ = ["GasModel"]
+
+
+def message_key(msg: Msg) -> Hashable:
+    """Gets the key whose gas usage is learned for a message: its type, and for contract
+    executions also the contract and the top-level key of the execute message."""
+    if isinstance(msg, MsgExecuteContract):
+        execute: Optional[Union[dict, str, bytes]] = msg.msg
+        if isinstance(execute, (str, bytes)):
+            try:
+                execute = json.loads(execute)
+            except ValueError:
+                execute = None
+        action = next(iter(execute)) if isinstance(execute, dict) and execute else None
+        return msg.type_url, msg.contract, action
+    return msg.type_url
+
+
+class GasModel:
+    """Learns the gas used by transactions from their simulations, so that the gas of
+    transactions with well-known messages is predicted locally instead of simulated.
+
+    Transactions are grouped by the keys of their messages: the message type, and for
+    ``MsgExecuteContract`` also the contract and the top-level key of the execute message.
+    Once ``min_samples`` simulations of a group are known and their relative standard
+    deviation is at most ``max_deviation``, the prediction is the largest gas used seen
+    plus ``margin``. Every ``refresh_interval`` predictions of a group, the transaction is
+    simulated again so that the model follows changes in contract state.
+
+    .. code-block:: python
+
+        terra = AsyncLCDClient(url, chain_id, gas_model=GasModel())
+
+    Args:
+        min_samples (int, optional): simulations needed before predicting
+        max_deviation (float, optional): largest relative standard deviation of the
+            gas used that is still predicted
+        margin (float, optional): share of gas added on top of the largest gas used seen,
+            before the gas adjustment of the transaction is applied
+        window (int, optional): number of recent simulations kept per group
+        refresh_interval (int, optional): predictions of a group between simulations
+    """
+
+    def __init__(
+        self,
+        min_samples: int = 5,
+        max_deviation: float = 0.05,
+        margin: float = 0.1,
+        window: int = 50,
+        refresh_interval: int = 100,
+    ):
+        self.min_samples = min_samples
+        self.max_deviation = max_deviation
+        self.margin = margin
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self._samples: Dict[Hashable, Deque[int]] = {}
+        self._predictions: Dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(msgs: List[Msg]) -> Tuple[Hashable, ...]:
+        """Gets the group of a transaction from its messages."""
+        return tuple(message_key(msg) for msg in msgs)
+
+    def record(self, msgs: List[Msg], gas_used: int):
+        """Adds the simulated gas used by a transaction.
+
+        Args:
+            msgs (List[Msg]): messages of the transaction
+            gas_used (int): simulated gas used
+        """
+        key = self.key(msgs)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(int(gas_used))
+
+    def predict(self, msgs: List[Msg]) -> Optional[int]:
+        """Predicts the gas used by a transaction.
+
+        Args:
+            msgs (List[Msg]): messages of the transaction
+
+        Returns:
+            Optional[int]: predicted gas used, or ``None`` if the transaction should be
+            simulated
+        """
+        key = self.key(msgs)
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            self.misses += 1
+            return None
+
+        mean = sum(samples) / len(samples)
+        variance = sum((s - mean) ** 2 for s in samples) / max(len(samples) - 1, 1)
+        predictions = self._predictions.get(key, 0)
+        if (
+            math.sqrt(variance) > self.max_deviation * mean
+            or predictions >= self.refresh_interval
+        ):
+            self._predictions[key] = 0
+            self.misses += 1
+            return None
+
+        self._predictions[key] = predictions + 1
+        self.hits += 1
+        return round(max(samples) * (1 + self.margin))
+
+    def forget(self, msgs: Optional[List[Msg]] = None):
+        """Drops what was learned about the group of a transaction, e.g. after it ran
+        out of gas, or about all groups.
+
+        Args:
+            msgs (List[Msg], optional): messages of the transaction
+        """
+        if msgs is None:
+            self._samples.clear()
+            self._predictions.clear()
+            return
+        key = self.key(msgs)
+        self._samples.pop(key, None)
+        self._predictions.pop(key, None)
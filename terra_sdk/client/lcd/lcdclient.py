@@ -1,19 +1,36 @@
 from __future__ import annotations
 
-from asyncio import AbstractEventLoop, get_event_loop
+import logging
+from asyncio import (
+    FIRST_COMPLETED,
+    AbstractEventLoop,
+    CancelledError,
+    Future,
+    Task,
+    TimeoutError,
+    ensure_future,
+    gather,
+    get_event_loop,
+    shield,
+    sleep,
+    wait,
+)
+from copy import copy
 from json import JSONDecodeError
-from typing import List, Optional, Union
+from time import monotonic
+from typing import Dict, Hashable, List, Optional, Set, Union
 
-import nest_asyncio
-from aiohttp import ClientSession
+from aiohttp import ClientError, ClientSession
 from multidict import CIMultiDict
 
 from terra_sdk.core import Coins, Dec, Numeric
-from terra_sdk.exceptions import LCDResponseError
+from terra_sdk.exceptions import LCDResponseError, LCDUnavailableError
 from terra_sdk.key.key import Key
 from terra_sdk.util.json import dict_to_data
+from terra_sdk.util.loop import get_loop_thread
 from terra_sdk.util.url import urljoin
 
+from .api._base import BaseAsyncAPI
 from .api.auth import AsyncAuthAPI, AuthAPI
 from .api.authz import AsyncAuthzAPI, AuthzAPI
 from .api.bank import AsyncBankAPI, BankAPI
@@ -28,10 +45,24 @@ from .api.staking import AsyncStakingAPI, StakingAPI
 from .api.tendermint import AsyncTendermintAPI, TendermintAPI
 from .api.tx import AsyncTxAPI, TxAPI
 from .api.wasm import AsyncWasmAPI, WasmAPI
+from .cache import ResponseCache
+from .endpoints import (
+    UNAVAILABLE,
+    Endpoint,
+    EndpointPool,
+    HedgeOptions,
+    is_node_failure,
+)
+from .gas import GasModel
 from .lcdutils import AsyncLCDUtils, LCDUtils
 from .params import APIParams
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .session import ConnectionOptions
 from .wallet import AsyncWallet, Wallet
 
+logger = logging.getLogger(__name__)
+
 
 def get_default(chain_id: str) -> [Coins, Numeric]:
     if chain_id == "phoenix-1":
@@ -47,23 +78,45 @@ def get_default(chain_id: str) -> [Coins, Numeric]:
 class AsyncLCDClient:
     def __init__(
         self,
-        url: str,
+        url: Union[str, List[str], EndpointPool],
         chain_id: Optional[str] = None,
         gas_prices: Optional[Coins.Input] = None,
         gas_adjustment: Optional[Numeric.Input] = None,
         loop: Optional[AbstractEventLoop] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        health_check_interval: Optional[float] = None,
+        hedge: Optional[HedgeOptions] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        rate_limit: Optional[RateLimiter] = None,
+        gas_model: Optional[GasModel] = None,
         _create_session: bool = True,  # don't create a session (used for sync LCDClient)
     ):
         if loop is None:
             loop = get_event_loop()
         self.loop = loop
+        self.connection_options = connection_options or ConnectionOptions()
+        self.session: Optional[ClientSession] = None
         if _create_session:
-            self.session = ClientSession(
-                headers={"Accept": "application/json"}, loop=self.loop
-            )
+            self.session = self.connection_options.create_session(self.loop)
 
         self.chain_id = chain_id
-        self.url = url
+        if isinstance(url, EndpointPool):
+            self.endpoints = url
+        else:
+            self.endpoints = EndpointPool([url] if isinstance(url, str) else url)
+        self.url = self.endpoints.endpoints[0].url
+        self.health_check_interval = health_check_interval
+        self._health_check_task: Optional[Task] = None
+        self.hedge = hedge
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.rate_limit = rate_limit
+        self.gas_model = gas_model
+        self._in_flight: Optional[Dict[Hashable, Future]] = {} if coalesce else None
+        self.height: Optional[int] = None
+        self._parent: Optional[AsyncLCDClient] = None
         self.last_request_height = None
 
         default_price, default_adjustment = get_default(chain_id)
@@ -86,13 +139,187 @@ class AsyncLCDClient:
         self.tx = AsyncTxAPI(self)
         self.utils = AsyncLCDUtils(self)
 
-    def wallet(self, key: Key) -> AsyncWallet:
+    def wallet(self, key: Key, manage_sequence: bool = False) -> AsyncWallet:
         """Creates a :class:`AsyncWallet` object from a key.
 
         Args:
             key (Key): key implementation
+            manage_sequence (bool, optional): hand out account sequences from memory
+                instead of querying the account for every transaction
         """
-        return AsyncWallet(self, key)
+        return AsyncWallet(self, key, manage_sequence)
+
+    def at_height(self, height: int) -> AsyncLCDClient:
+        """Creates a view of the client whose queries all run against the state at
+        block ``height``, so that results from different modules are consistent. The
+        view shares the session, endpoints and cache of the client; responses from a
+        pinned height never change and are cached without expiry.
+
+        Args:
+            height (int): block height
+
+        Returns:
+            AsyncLCDClient: client pinned to ``height``
+        """
+        height = int(height)
+        if height <= 0:
+            raise ValueError(f"height must be positive, got {height}")
+        pinned = copy(self)
+        pinned.height = height
+        pinned._parent = self._parent or self
+        for name, value in vars(self).items():
+            if isinstance(value, BaseAsyncAPI):
+                api = copy(value)
+                api._c = pinned
+                setattr(pinned, name, api)
+        return pinned
+
+    async def _request(
+        self,
+        node: Endpoint,
+        method: str,
+        path: str,
+        params: Optional[Union[CIMultiDict, list, dict]] = None,
+        data: Optional[dict] = None,
+    ):
+        """Sends a single HTTP request to the given LCD node within the client's rate
+        limits."""
+        if self.rate_limit is None:
+            return await self._send(node, method, path, params, data)
+        async with self.rate_limit.limit(node.url):
+            return await self._send(node, method, path, params, data)
+
+    async def _send(
+        self,
+        node: Endpoint,
+        method: str,
+        path: str,
+        params: Optional[Union[CIMultiDict, list, dict]] = None,
+        data: Optional[dict] = None,
+    ):
+        """Sends a single HTTP request to the given LCD node and records the outcome
+        in the endpoint pool."""
+        headers = None
+        if method == "GET" and self.height is not None:
+            headers = {"x-cosmos-block-height": str(self.height)}
+        start = monotonic()
+        try:
+            async with self._open_session().request(
+                method,
+                urljoin(node.url, path),
+                params=params,
+                json=data,
+                headers=headers,
+            ) as response:
+                try:
+                    result = await response.json(content_type=None)
+                except JSONDecodeError:
+                    raise LCDResponseError(
+                        message=str(response.reason), response=response
+                    )
+                if not 200 <= response.status < 299:
+                    if method == "POST":
+                        raise LCDResponseError(
+                            message=result.get("message"), response=response
+                        )
+                    raise LCDResponseError(message=str(result), response=response)
+        except (ClientError, TimeoutError, LCDResponseError) as e:
+            if is_node_failure(e):
+                self.endpoints.record_failure(node)
+            raise
+        self.endpoints.record_success(node, monotonic() - start)
+        return result
+
+    async def _fetch(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Union[CIMultiDict, list, dict]] = None,
+        data: Optional[dict] = None,
+        hedge: bool = False,
+        idempotent: bool = True,
+    ):
+        """Sends a request to the preferred LCD node, failing over to the other nodes
+        of the pool when it errors out, and retrying according to the retry policy.
+        If ``hedge`` is set and the preferred node is slower than the hedging delay,
+        the request is duplicated to the next node."""
+        (self._parent or self)._start_health_checks()
+        attempt = 0
+        while True:
+            attempt += 1
+            nodes = self.endpoints.ranked()
+            if not nodes:
+                raise LCDUnavailableError(UNAVAILABLE)
+            delay = (
+                self.hedge.delay_for(nodes[0])
+                if hedge and self.hedge is not None and len(nodes) > 1
+                else None
+            )
+            try:
+                result = await self._race(
+                    nodes, delay, idempotent, method, path, params, data
+                )
+                break
+            except (ClientError, TimeoutError, LCDResponseError) as e:
+                if not self.retry_policy.should_retry(e, attempt, idempotent):
+                    raise
+            await sleep(self.retry_policy.backoff(attempt))
+        self.last_request_height = (
+            result.get("height") if result else self.last_request_height
+        )
+        return result
+
+    async def _race(
+        self,
+        nodes: List[Endpoint],
+        delay: Optional[float],
+        idempotent: bool,
+        method: str,
+        path: str,
+        params: Optional[Union[CIMultiDict, list, dict]],
+        data: Optional[dict],
+    ):
+        pending: Set[Future] = set()
+        error: Optional[BaseException] = None
+
+        def send() -> bool:
+            while nodes:
+                node = nodes.pop(0)
+                if not self.endpoints.acquire(node):
+                    continue
+                trial = node.probing
+                task = ensure_future(self._request(node, method, path, params, data))
+                if trial:
+                    task.add_done_callback(lambda _: self.endpoints.release(node))
+                pending.add(task)
+                return True
+            return False
+
+        if not send():
+            raise LCDUnavailableError(UNAVAILABLE)
+        try:
+            while pending:
+                done, pending = await wait(
+                    pending,
+                    timeout=delay if nodes else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done:  # the preferred node is slow: hedge once
+                    delay = None
+                    send()
+                    continue
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not self.retry_policy.is_retryable(error, idempotent):
+                        raise error
+                if nodes and not pending:
+                    send()
+            raise error  # type: ignore
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _get(
         self,
@@ -107,36 +334,52 @@ class AsyncLCDClient:
         ):
             params = params.to_dict()
 
-        async with self.session.get(
-            urljoin(self.url, endpoint), params=params
-        ) as response:
-            try:
-                result = await response.json(content_type=None)
-            except JSONDecodeError:
-                raise LCDResponseError(message=str(response.reason), response=response)
-            if not 200 <= response.status < 299:
-                raise LCDResponseError(message=str(result), response=response)
-        self.last_request_height = (
-            result.get("height") if result else self.last_request_height
-        )
-        return result  # if raw else result["result"]
+        if self.cache is None and self._in_flight is None:
+            return await self._fetch(
+                "GET", endpoint, params, hedge=True
+            )  # if raw else result["result"]
+
+        key = ResponseCache.key(endpoint, params, self.height)
+        if self.cache is not None:
+            found, result = self.cache.get(key)
+            if found:
+                self.last_request_height = (
+                    result.get("height") if result else self.last_request_height
+                )
+                return result
+        in_flight = self._in_flight
+        if in_flight is None:
+            return await self._query(key, endpoint, params)
+
+        # single-flight: identical queries share the request already in flight
+        task = in_flight.get(key)
+        if task is None:
+            task = ensure_future(self._query(key, endpoint, params))
+            in_flight[key] = task
+            task.add_done_callback(lambda _: in_flight.pop(key, None))
+        return await shield(task)
+
+    async def _query(
+        self,
+        key: Hashable,
+        endpoint: str,
+        params: Optional[Union[CIMultiDict, list, dict]],
+    ):
+        result = await self._fetch("GET", endpoint, params, hedge=True)
+        if self.cache is not None:
+            self.cache.set(key, endpoint, result, pinned=self.height is not None)
+        return result
 
     async def _post(
-        self, endpoint: str, data: Optional[dict] = None  # , raw: bool = False
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        idempotent: bool = False,
+        # raw: bool = False
     ):
-        async with self.session.post(
-            urljoin(self.url, endpoint), json=data and dict_to_data(data)
-        ) as response:
-            try:
-                result = await response.json(content_type=None)
-            except JSONDecodeError:
-                raise LCDResponseError(message=str(response.reason), response=response)
-            if not 200 <= response.status < 299:
-                raise LCDResponseError(message=result.get("message"), response=response)
-        self.last_request_height = (
-            result.get("height") if result else self.last_request_height
-        )
-        return result  # if raw else result["result"]
+        return await self._fetch(
+            "POST", endpoint, data=data and dict_to_data(data), idempotent=idempotent
+        )  # if raw else result["result"]
 
     async def _search(
         self,
@@ -156,32 +399,82 @@ class AsyncLCDClient:
             for p in params:
                 actual_params.add(p, params[p])
 
-        async with self.session.get(
-            urljoin(self.url, "/cosmos/tx/v1beta1/txs"), params=actual_params
-        ) as response:
-            try:
-                result = await response.json(content_type=None)
-            except JSONDecodeError:
-                raise LCDResponseError(message=str(response.reason), response=response)
-            if not 200 <= response.status < 299:
-                raise LCDResponseError(message=str(result), response=response)
-        self.last_request_height = (
-            result.get("height") if result else self.last_request_height
+        return await self._fetch(
+            "GET", "/cosmos/tx/v1beta1/txs", actual_params
+        )  # if raw else result["result"]
+
+    async def _check_endpoint(self, node: Endpoint):
+        try:
+            syncing, node_info = await gather(
+                self._request(node, "GET", "/cosmos/base/tendermint/v1beta1/syncing"),
+                self._request(node, "GET", "/cosmos/base/tendermint/v1beta1/node_info"),
+            )
+            network = node_info["default_node_info"]["network"]
+            is_syncing = syncing["syncing"]
+        except (ClientError, TimeoutError, LCDResponseError, KeyError, TypeError):
+            node.passed_health_check = False
+            return
+        node.passed_health_check = not is_syncing and (
+            self.chain_id is None or network == self.chain_id
         )
-        return result  # if raw else result["result"]
+
+    async def check_endpoints(self):
+        """Runs one round of health checks against every LCD node of the pool. A node
+        passes if it answers, is not syncing and serves the client's chain; nodes that
+        fail receive no requests until they pass a later round."""
+        await gather(*[self._check_endpoint(node) for node in self.endpoints])
+
+    async def _health_check_loop(self):
+        while True:
+            try:
+                await self.check_endpoints()
+            except CancelledError:
+                raise
+            except Exception:
+                # keep checking: the next round may succeed
+                logger.warning(
+                    "health check of the LCD endpoints failed", exc_info=True
+                )
+            await sleep(self.health_check_interval)
+
+    def _start_health_checks(self):
+        if self.health_check_interval and self._health_check_task is None:
+            self._health_check_task = self.loop.create_task(self._health_check_loop())
+
+    def _open_session(self) -> ClientSession:
+        if self.session is None:
+            self.session = self.connection_options.create_session(self.loop)
+        return self.session
+
+    async def close(self):
+        """Closes the HTTP session and all pooled connections."""
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.session.close()
+        await self.close()
 
 
 class LCDClient(AsyncLCDClient):
-    """An object representing a connection to a node running the Terra LCD server."""
+    """An object representing a connection to a node running the Terra LCD server.
+
+    Requests run on an event loop in a background thread that is shared by all
+    synchronous clients, so a single client can be used from several threads at once
+    and their requests run concurrently.
+    """
 
     url: str
-    """URL endpoint of LCD server."""
+    """URL endpoint of LCD server (the first one if several were given)."""
+
+    endpoints: EndpointPool
+    """:class:`EndpointPool<terra_sdk.client.lcd.endpoints.EndpointPool>` of the LCD
+    servers requests are routed to."""
 
     chain_id: str
     """Chain ID of blockchain network connecting to."""
@@ -192,9 +485,17 @@ class LCDClient(AsyncLCDClient):
     gas_adjustment: Union[str, float, int, Dec]
     """Gas adjustment factor for automatic fee estimation."""
 
+    gas_model: Optional[GasModel]
+    """:class:`GasModel<terra_sdk.client.lcd.gas.GasModel>` predicting the gas of
+    well-known transactions instead of simulating them, if any."""
+
     last_request_height: Optional[int]  # type: ignore
     """Height of response of last-made made LCD request."""
 
+    height: Optional[int]
+    """Block height queries are pinned to (see :meth:`at_height`), or ``None`` for the
+    latest block."""
+
     auth: AuthAPI
     """:class:`AuthAPI<terra_sdk.client.lcd.api.auth.AuthAPI>`."""
 
@@ -239,10 +540,18 @@ class LCDClient(AsyncLCDClient):
 
     def __init__(
         self,
-        url: str,
+        url: Union[str, List[str], EndpointPool],
         chain_id: str = None,
         gas_prices: Optional[Coins.Input] = None,
         gas_adjustment: Optional[Numeric.Input] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        health_check_interval: Optional[float] = None,
+        hedge: Optional[HedgeOptions] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        rate_limit: Optional[RateLimiter] = None,
+        gas_model: Optional[GasModel] = None,
     ):
         super().__init__(
             url,
@@ -250,7 +559,15 @@ class LCDClient(AsyncLCDClient):
             gas_prices,
             gas_adjustment,
             _create_session=False,
-            loop=nest_asyncio.apply(get_event_loop()),
+            loop=get_loop_thread().loop,
+            connection_options=connection_options,
+            health_check_interval=health_check_interval,
+            hedge=hedge,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce=coalesce,
+            rate_limit=rate_limit,
+            gas_model=gas_model,
         )
 
         self.auth = AuthAPI(self)
@@ -279,47 +596,67 @@ class LCDClient(AsyncLCDClient):
             "async context manager not implemented - you probably want AsyncLCDClient"
         )
 
-    def wallet(self, key: Key) -> Wallet:  # type: ignore
+    def wallet(self, key: Key, manage_sequence: bool = False) -> Wallet:  # type: ignore
         """Creates a :class:`Wallet` object from a key for easy transaction creating and
         signing.
 
         Args:
             key (Key): key implementation
+            manage_sequence (bool, optional): hand out account sequences from memory
+                instead of querying the account for every transaction
+        """
+        return Wallet(self, key, manage_sequence)
+
+    def at_height(self, height: int) -> LCDClient:  # type: ignore
+        """Creates a view of the client whose queries all run against the state at
+        block ``height``, so that results from different modules are consistent.
+
+        Args:
+            height (int): block height
+
+        Returns:
+            LCDClient: client pinned to ``height``
         """
-        return Wallet(self, key)
+        return super().at_height(height)  # type: ignore
+
+    def close(self):  # type: ignore
+        """Closes the HTTP session and all pooled connections. The client opens a new
+        session if it is used again afterwards.
+
+        Called from the loop thread, e.g. by a callback running on it, the session is
+        closed in a task that is returned and may be awaited: blocking there would
+        deadlock."""
+        loop_thread = get_loop_thread()
+        if loop_thread.in_loop_thread():
+            return loop_thread.loop.create_task(super().close())
+        loop_thread.run(super().close())
+
+    def _run_sync(self, coroutine):
+        return get_loop_thread().run(coroutine)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open_session(self) -> ClientSession:
+        # the session is created lazily so that it is bound to a running loop, and is
+        # then kept alive across requests to reuse pooled connections
+        if self._parent is not None:
+            self.session = self._parent._open_session()
+        elif self.session is None or self.session.closed:
+            self.session = self.connection_options.create_session(self.loop)
+        return self.session
 
     async def _get(self, *args, **kwargs):
-        # session has to be manually created and torn down for each HTTP request in a
-        # synchronous client
-        self.session = ClientSession(
-            headers={"Accept": "application/json"}, loop=self.loop
-        )
-        try:
-            result = await super()._get(*args, **kwargs)
-        finally:
-            await self.session.close()
-        return result
+        self._open_session()
+        return await super()._get(*args, **kwargs)
 
     async def _post(self, *args, **kwargs):
-        # session has to be manually created and torn down for each HTTP request in a
-        # synchronous client
-        self.session = ClientSession(
-            headers={"Accept": "application/json"}, loop=self.loop
-        )
-        try:
-            result = await super()._post(*args, **kwargs)
-        finally:
-            await self.session.close()
-        return result
+        self._open_session()
+        return await super()._post(*args, **kwargs)
 
     async def _search(self, *args, **kwargs):
-        # session has to be manually created and torn down for each HTTP request in a
-        # synchronous client
-        self.session = ClientSession(
-            headers={"Accept": "application/json"}, loop=self.loop
-        )
-        try:
-            result = await super()._search(*args, **kwargs)
-        finally:
-            await self.session.close()
-        return result
+        self._open_session()
+        return await super()._search(*args, **kwargs)
@@ -1,43 +1,77 @@
-from functools import reduce
-from math import ceil
-from typing import Any, Dict, Union
-
-from terra_sdk.core import Coin
+from asyncio import gather
+from collections import OrderedDict
+from typing import Dict, Optional
 
 from .api._base import BaseAsyncAPI, sync_bind
+from .pagination import fetch_all
+from .params import PaginationOptions
 
-
-def index_by_pub_key(m: Dict[str, Any], o: Any):
-    m[o["pub_key"]["key"]] = o
-    return m
+PAGE_LIMIT = 100
+CACHED_HEIGHTS = 8
 
 
 class AsyncLCDUtils(BaseAsyncAPI):
-    async def validators_with_voting_power(self) -> Dict[str, dict]:
-        """Gets current validators and merges their voting power from the validator set query.
+    def __init__(self, c):
+        super().__init__(c)
+        self._voting_power: "OrderedDict[int, Dict[str, dict]]" = OrderedDict()
+
+    async def validators_with_voting_power(
+        self, height: Optional[int] = None
+    ) -> Dict[str, dict]:
+        """Gets the validators of the validator set and merges in their voting power.
+
+        All pages of the validator set and of the staking validators are fetched
+        concurrently at the same height. Results are cached per height, so calling this
+        again within the same block costs a single request.
+
+        Args:
+            height (int, optional): block height, defaults to latest.
 
         Returns:
-            Dict[str, dict]: validators with voting power
+            Dict[str, dict]: validators with voting power, by operator address
         """
-        validator_set_response = await BaseAsyncAPI._try_await(
-            self._c.tendermint.validator_set()
+        if height is not None and height in self._voting_power:
+            return self._voting_power[height]
+
+        first_page = await BaseAsyncAPI._try_await(
+            self._c.tendermint.validator_set(
+                height, PaginationOptions(limit=PAGE_LIMIT, count_total=True)
+            )
         )
-        next_key = ""
-        while True:
-            from terra_sdk.client.lcd import PaginationOptions
+        height = int(first_page["block_height"])
+        if height in self._voting_power:
+            return self._voting_power[height]
+
+        async def validator_set_page(params: PaginationOptions):
+            res = await BaseAsyncAPI._try_await(
+                self._c.tendermint.validator_set(height, params)
+            )
+            return res["validators"], res.get("pagination")
 
-            validators, pag = await BaseAsyncAPI._try_await(
-                self._c.staking.validators(PaginationOptions(key=next_key))
+        validator_set = first_page["validators"]
+        pages = [
+            fetch_all(
+                self._c.at_height(height).staking.validators,
+                params=PaginationOptions(limit=PAGE_LIMIT),
             )
-            validator_set: Dict[str, Any] = reduce(
-                index_by_pub_key, validator_set_response["validators"], {}
+        ]
+        if (first_page.get("pagination") or {}).get("next_key"):
+            pages.append(
+                fetch_all(
+                    validator_set_page,
+                    params=PaginationOptions(
+                        offset=len(validator_set), limit=PAGE_LIMIT
+                    ),
+                )
             )
-            if pag is None or pag["next_key"] is None:
-                break
-            next_key = pag["next_key"]
+        validators, *rest = await gather(*pages)
+        delegates = {
+            d["pub_key"]["key"]: d for d in validator_set + (rest[0] if rest else [])
+        }
+
         res = {}
         for v in validators:
-            delegate_info = validator_set.get(v.consensus_pubkey["key"])
+            delegate_info = delegates.get(v.consensus_pubkey["key"])
             if delegate_info is None:
                 continue
             res[v.operator_address] = {
@@ -45,10 +79,20 @@ class AsyncLCDUtils(BaseAsyncAPI):
                 "voting_power": int(delegate_info["voting_power"]),
                 "proposer_priority": int(delegate_info["proposer_priority"]),
             }
+
+        self._voting_power[height] = res
+        while len(self._voting_power) > CACHED_HEIGHTS:
+            self._voting_power.popitem(last=False)
         return res
 
 
 class LCDUtils(AsyncLCDUtils):
     @sync_bind(AsyncLCDUtils.validators_with_voting_power)
-    async def validators_with_voting_power(self) -> Dict[str, dict]:
+    def validators_with_voting_power(
+        self, height: Optional[int] = None
+    ) -> Dict[str, dict]:
         pass
+
+    validators_with_voting_power.__doc__ = (
+        AsyncLCDUtils.validators_with_voting_power.__doc__
+    )
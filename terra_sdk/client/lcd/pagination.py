@@ -0,0 +1,137 @@
+from asyncio import Future, Semaphore, ensure_future, gather
+from copy import copy
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+from .params import PaginationOptions
+
+__all__ = ["paginate", "fetch_all"]
+
+
+async def paginate(
+    method: Callable[..., Awaitable[Tuple[Any, Optional[dict]]]],
+    *args,
+    params: Optional[PaginationOptions] = None,
+    prefetch: bool = True,
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """Iterates over the items of all pages of a paginated query, following
+    ``next_key``. While the items of a page are consumed, the next page is already
+    being fetched, so walking a full set takes about as long as its slowest page.
+
+    .. code-block:: python
+
+        async for validator in paginate(terra.staking.validators):
+            print(validator.operator_address)
+
+        async for delegation in paginate(
+            terra.staking.delegations, validator=address, params=PaginationOptions(limit=200)
+        ):
+            ...
+
+    Args:
+        method: asynchronous API method that accepts ``params`` and returns a list of
+            items together with pagination info
+        *args: positional arguments of ``method``
+        params (PaginationOptions, optional): options of the first page, e.g. ``limit``
+        prefetch (bool, optional): whether to fetch the next page while the current
+            one is consumed
+        **kwargs: keyword arguments of ``method``
+
+    Yields:
+        items of every page, in order
+    """
+    options = params or PaginationOptions()
+
+    def fetch(key: Optional[str]) -> Future:
+        page = copy(options)
+        if key is not None:
+            page.key, page.offset = key, None
+        return ensure_future(method(*args, params=page, **kwargs))
+
+    task: Optional[Future] = fetch(options.key)
+    try:
+        while task is not None:
+            items, pagination = await task
+            next_key = pagination.get("next_key") if pagination else None
+            task = fetch(next_key) if next_key and prefetch else None
+            for item in items:
+                yield item
+            if next_key and not prefetch:
+                task = fetch(next_key)
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+async def fetch_all(
+    method: Callable[..., Awaitable[Tuple[Any, Optional[dict]]]],
+    *args,
+    params: Optional[PaginationOptions] = None,
+    concurrency: int = 10,
+    **kwargs,
+) -> List[Any]:
+    """Fetches the items of all pages of a paginated query in parallel.
+
+    The first page is requested with ``count_total``. The rest of the range is then split
+    into offset windows of ``limit`` items, which are fetched concurrently, at most
+    ``concurrency`` at a time and within the client's own rate limits. Items are returned
+    in order. If the node does not report a total, the remaining pages are fetched one
+    after the other by ``next_key``.
+
+    .. code-block:: python
+
+        delegations = await fetch_all(
+            terra.staking.delegations, validator=address, params=PaginationOptions(limit=500)
+        )
+
+    Args:
+        method: asynchronous API method that accepts ``params`` and returns a list of
+            items together with pagination info
+        *args: positional arguments of ``method``
+        params (PaginationOptions, optional): page size (``limit``) and first ``offset``
+        concurrency (int, optional): maximum number of pages fetched at the same time
+        **kwargs: keyword arguments of ``method``
+
+    Returns:
+        List[Any]: items of every page, in order
+    """
+    options = copy(params) if params else PaginationOptions()
+    options.key = None
+    options.count_total = True
+    start = options.offset or 0
+
+    items, pagination = await method(*args, params=options, **kwargs)
+    result = list(items)
+    if not pagination or not pagination.get("next_key"):
+        return result
+    next_key = pagination["next_key"]
+
+    total = int(pagination.get("total") or 0)
+    # the first page is full since it has a next page: its size is the page size the
+    # node actually serves, which may be smaller than the requested limit
+    limit = len(result)
+    if not total or not limit:
+        async for item in paginate(
+            method,
+            *args,
+            params=PaginationOptions(key=next_key, limit=options.limit),
+            **kwargs,
+        ):
+            result.append(item)
+        return result
+
+    semaphore = Semaphore(concurrency)
+
+    async def fetch(offset: int) -> List[Any]:
+        page = copy(options)
+        page.offset, page.limit, page.count_total = offset, limit, None
+        async with semaphore:
+            page_items, _ = await method(*args, params=page, **kwargs)
+        return list(page_items)
+
+    pages = await gather(
+        *[fetch(offset) for offset in range(start + limit, total, limit)]
+    )
+    for page_items in pages:
+        result.extend(page_items)
+    return result
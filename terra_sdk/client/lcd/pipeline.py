@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from asyncio import (
+    CancelledError,
+    Future,
+    Queue,
+    Task,
+    ensure_future,
+    gather,
+    get_running_loop,
+)
+from functools import partial
+from typing import AsyncIterable, Dict, Iterable, List, Optional, Set, Union
+
+import attr
+
+from terra_sdk.core import AccAddress
+from terra_sdk.core.fee import Fee
+from terra_sdk.core.msg import Msg
+from terra_sdk.exceptions import LCDResponseError, TxRejectedError
+
+from .api.tx import CreateTxOptions, SignerOptions
+from .sequence import SequenceManager, expected_sequence, is_sequence_mismatch
+from .wallet import AsyncWallet
+from .watcher import ConfirmationWatcher
+
+__all__ = ["TxPipeline"]
+
+
+@attr.s
+class _Job:
+    options: CreateTxOptions = attr.ib()
+    future: Future = attr.ib()
+    attempts: int = attr.ib(default=0)
+    txhash: Optional[str] = attr.ib(default=None)
+
+
+class TxPipeline:
+    """Submits the transactions of one wallet at a sustained rate by running their
+    stages concurrently: fees of upcoming transactions are estimated while earlier ones
+    are signed and broadcast in ``sync`` mode, and broadcast transactions are tracked
+    until they are included in a block.
+
+    Each submission returns a future of the :class:`TxInfo<terra_sdk.core.tx.TxInfo>` of
+    the included transaction. It fails with :class:`TxRejectedError<terra_sdk.exceptions.TxRejectedError>`
+    if the node rejects the transaction, and with :class:`asyncio.TimeoutError` if it is
+    not included within ``confirm_timeout`` seconds or by its ``timeout_height``. Inclusion
+    is tracked by a :class:`ConfirmationWatcher<terra_sdk.client.lcd.watcher.ConfirmationWatcher>`.
+    Transactions rejected for a wrong
+    sequence are signed again with the sequence the node expects.
+
+    .. code-block:: python
+
+        wallet = terra.wallet(key, manage_sequence=True)
+        async with TxPipeline(wallet) as pipeline:
+            futures = [await pipeline.submit([msg]) for msg in msgs]
+        infos = await asyncio.gather(*futures)
+
+    Args:
+        wallet (AsyncWallet): wallet created with ``manage_sequence=True``
+        concurrency (int, optional): number of fee estimations run at the same time
+        max_queued (int, optional): number of submissions waiting for a stage before
+            :meth:`submit` waits
+        poll_interval (float, optional): seconds between checks of pending transactions
+        watcher (ConfirmationWatcher, optional): watcher to track inclusion with, e.g. one
+            shared by several pipelines
+        fee_granter (AccAddress, optional): account that pays the estimated fees through
+            a fee grant
+        confirm_timeout (float, optional): seconds a broadcast transaction may take to be
+            included
+        max_retries (int, optional): number of times a transaction is signed again after
+            a sequence mismatch
+    """
+
+    def __init__(
+        self,
+        wallet: AsyncWallet,
+        concurrency: int = 4,
+        max_queued: int = 100,
+        poll_interval: float = 1.0,
+        confirm_timeout: float = 60.0,
+        max_retries: int = 3,
+        watcher: Optional[ConfirmationWatcher] = None,
+        fee_granter: Optional[AccAddress] = None,
+    ):
+        if wallet.sequence_manager is None:
+            raise ValueError("TxPipeline needs a wallet with manage_sequence=True")
+        self.wallet = wallet
+        self._sequence_manager: SequenceManager = wallet.sequence_manager
+        self.concurrency = concurrency
+        self.max_queued = max_queued
+        self.poll_interval = poll_interval
+        self.confirm_timeout = confirm_timeout
+        self.max_retries = max_retries
+        self.watcher = watcher or ConfirmationWatcher(wallet.lcd, poll_interval)
+        self._owns_watcher = watcher is None
+        self.fee_granter = fee_granter
+
+        self._estimate_queue: Optional[Queue] = None
+        self._sign_queue: Optional[Queue] = None
+        self._pending: Dict[str, _Job] = {}
+        self._futures: Set[Future] = set()
+        self._tasks: List[Task] = []
+
+    @property
+    def pending(self) -> List[str]:
+        """Hashes of the broadcast transactions that are not included yet."""
+        return list(self._pending)
+
+    async def start(self):
+        """Starts the stages of the pipeline. Called by :meth:`submit` if needed."""
+        if self._tasks:
+            return
+        self._estimate_queue = Queue(self.max_queued)
+        self._sign_queue = Queue(self.max_queued)
+        self._tasks = [
+            ensure_future(self._estimate_stage(self._estimate_queue, self._sign_queue))
+            for _ in range(self.concurrency)
+        ]
+        self._tasks.append(ensure_future(self._broadcast_stage(self._sign_queue)))
+
+    async def submit(self, tx: Union[CreateTxOptions, List[Msg]]) -> Future:
+        """Queues a transaction, waiting while the pipeline is full.
+
+        Args:
+            tx (Union[CreateTxOptions, List[Msg]]): options of the transaction, or its
+                messages
+
+        Returns:
+            Future: future of the ``TxInfo`` of the included transaction
+        """
+        await self.start()
+        assert self._estimate_queue is not None
+        options = tx if isinstance(tx, CreateTxOptions) else CreateTxOptions(msgs=tx)
+        future = get_running_loop().create_future()
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        await self._estimate_queue.put(_Job(attr.evolve(options), future))
+        return future
+
+    async def feed(
+        self, stream: Union[AsyncIterable, Iterable[Union[CreateTxOptions, List[Msg]]]]
+    ) -> List[Future]:
+        """Submits every transaction of a stream.
+
+        Args:
+            stream: (asynchronous) iterable of ``CreateTxOptions`` or lists of messages
+
+        Returns:
+            List[Future]: futures of the transactions, in order
+        """
+        if hasattr(stream, "__aiter__"):
+            return [await self.submit(tx) async for tx in stream]
+        return [await self.submit(tx) for tx in stream]
+
+    async def join(self):
+        """Waits until every submitted transaction is included or has failed."""
+        while self._futures:
+            await gather(*self._futures, return_exceptions=True)
+
+    async def close(self):
+        """Stops the pipeline. Transactions without outcome yet are cancelled."""
+        for task in self._tasks:
+            task.cancel()
+        await gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for future in list(self._futures):
+            future.cancel()
+        self._pending.clear()
+        if self._owns_watcher:
+            await self.watcher.close()
+
+    def drain(self) -> List[Future]:
+        """Takes back the transactions that are queued but not broadcast yet, e.g. to
+        submit them through another wallet. Their futures are cancelled.
+
+        Returns:
+            List[Future]: futures of the transactions taken back, in submission order
+        """
+        jobs = []
+        for queue in (self._sign_queue, self._estimate_queue):
+            while queue is not None and not queue.empty():
+                jobs.append(queue.get_nowait())
+        for job in jobs:
+            job.future.cancel()
+        return [job.future for job in jobs]
+
+    async def __aenter__(self) -> TxPipeline:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.join()
+        await self.close()
+
+    @staticmethod
+    def _fail(job: _Job, error: BaseException):
+        if not job.future.done():
+            job.future.set_exception(error)
+
+    async def _estimate_fee(self, options: CreateTxOptions) -> Fee:
+        # the node simulates against its pending state, so the simulation carries the
+        # sequence the node expects now rather than the one the transaction is signed with
+        manager = self._sequence_manager
+        sequence = manager.next_sequence
+        if sequence is None:
+            res = await self.wallet.account_number_and_sequence()
+            manager.sync(res["account_number"], res["sequence"])
+            sequence = res["sequence"]
+        attempt = 0
+        while True:
+            signer = SignerOptions(
+                address=self.wallet.key.acc_address,
+                sequence=sequence,
+                public_key=self.wallet.key.public_key,
+            )
+            try:
+                return await self.wallet.lcd.tx.estimate_fee([signer], options)
+            except LCDResponseError as e:
+                sequence = expected_sequence(e)
+                if sequence is None or attempt == self.max_retries:
+                    raise
+            attempt += 1
+
+    async def _estimate_stage(self, estimate_queue: Queue, sign_queue: Queue):
+        while True:
+            job = await estimate_queue.get()
+            try:
+                if job.options.fee is None:
+                    fee = await self._estimate_fee(job.options)
+                    if self.fee_granter:
+                        fee = attr.evolve(fee, granter=self.fee_granter)
+                    job.options.fee = fee
+                await sign_queue.put(job)
+            except CancelledError:
+                raise
+            except Exception as e:
+                self._fail(job, e)
+
+    async def _broadcast_stage(self, sign_queue: Queue):
+        # a node only accepts the transactions of an account in sequence order, so they
+        # are signed and broadcast one at a time
+        while True:
+            job = await sign_queue.get()
+            try:
+                await self._broadcast(job)
+            except CancelledError:
+                raise
+            except Exception as e:
+                self._fail(job, e)
+
+    async def _broadcast(self, job: _Job):
+        while not job.future.done():
+            tx = await self.wallet.create_and_sign_tx(
+                attr.evolve(job.options, account_number=None, sequence=None)
+            )
+            res = await self.wallet.broadcast_sync(tx)
+            if not res.code:
+                job.txhash = res.txhash
+                self._pending[res.txhash] = job
+                self.watcher.watch(
+                    res.txhash,
+                    timeout_height=job.options.timeout_height,
+                    timeout=self.confirm_timeout,
+                ).add_done_callback(partial(self._settle, job))
+                return
+            if not is_sequence_mismatch(res) or job.attempts >= self.max_retries:
+                raise TxRejectedError(res)
+            job.attempts += 1
+
+    def _settle(self, job: _Job, confirmation: Future):
+        if job.txhash is not None:
+            self._pending.pop(job.txhash, None)
+        if job.future.done():
+            return
+        if confirmation.cancelled():
+            job.future.cancel()
+            return
+        error = confirmation.exception()
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(confirmation.result())
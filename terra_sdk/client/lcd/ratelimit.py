@@ -0,0 +1,121 @@
+from asyncio import Semaphore, sleep
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import AsyncIterator, Dict, Optional
+
+__all__ = ["RateLimiter", "TokenBucket"]
+
+
+class TokenBucket:
+    """Paces requests to a steady rate while allowing short bursts.
+
+    Args:
+        rate (float): tokens added per second
+        burst (int, optional): capacity of the bucket, defaults to one second worth of
+            tokens.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = float(burst or max(1, rate))
+        self.tokens = self.capacity
+        self.updated = monotonic()
+
+    def reserve(self) -> float:
+        """Takes a token, going into debt if the bucket is empty.
+
+        Returns:
+            float: seconds to wait until the reserved token is available
+        """
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self):
+        """Waits until a token is available and takes it. Waiters are served in the
+        order they arrive."""
+        delay = self.reserve()
+        if delay:
+            await sleep(delay)
+
+
+class RateLimiter:
+    """Client-side limits on the requests an LCD client sends.
+
+    Pacing requests below the throttling limits of public LCD servers gives better
+    sustained throughput than being answered with ``429`` and retrying.
+
+    Args:
+        max_in_flight (int, optional): maximum number of requests awaiting a response
+            at the same time by each endpoint.
+        requests_per_second (float, optional): rate of requests sent to each endpoint.
+        burst (int, optional): number of requests an idle endpoint may receive at once,
+            defaults to ``requests_per_second``.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+    ):
+        self.max_in_flight = max_in_flight
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._semaphores: Dict[str, Semaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> Optional[TokenBucket]:
+        """Gets the token bucket pacing requests to an endpoint.
+
+        Args:
+            url (str): endpoint URL
+
+        Returns:
+            Optional[TokenBucket]: bucket, or ``None`` if requests are not paced
+        """
+        if self.requests_per_second is None:
+            return None
+        if url not in self._buckets:
+            self._buckets[url] = TokenBucket(self.requests_per_second, self.burst)
+        return self._buckets[url]
+
+    def semaphore(self, url: str) -> Optional[Semaphore]:
+        """Gets the semaphore bounding the requests in flight to an endpoint.
+
+        Args:
+            url (str): endpoint URL
+
+        Returns:
+            Optional[Semaphore]: semaphore, or ``None`` if requests in flight are not
+            bounded
+        """
+        if self.max_in_flight is None:
+            return None
+        if url not in self._semaphores:
+            # created lazily so that it binds to the running loop on Python < 3.10
+            self._semaphores[url] = Semaphore(self.max_in_flight)
+        return self._semaphores[url]
+
+    @asynccontextmanager
+    async def limit(self, url: str) -> AsyncIterator[None]:
+        """Holds a request slot for an endpoint for the duration of the block.
+
+        Args:
+            url (str): endpoint URL
+        """
+        semaphore = self.semaphore(url)
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            bucket = self.bucket(url)
+            if bucket is not None:
+                await bucket.acquire()
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
@@ -0,0 +1,92 @@
+import random
+from typing import FrozenSet
+
+import attr
+from aiohttp import ClientConnectorError
+
+from terra_sdk.exceptions import LCDResponseError
+
+from .endpoints import is_node_failure
+
+__all__ = ["RetryPolicy"]
+
+
+@attr.s
+class RetryPolicy:
+    """Decides which failed LCD requests are retried, and how long to wait in between.
+
+    Idempotent requests (queries and transaction simulation) are retried after any
+    failure of the node. Broadcasts are only retried when the node provably did not
+    process the request, i.e. the connection could not be established or the node
+    answered ``429``, so that a transaction is not submitted twice. Subclasses can
+    override :meth:`is_retryable` and :meth:`backoff` to plug in other rules.
+
+    The same rules decide whether a request fails over to the next LCD endpoint.
+
+    Args:
+        max_attempts (int, optional): attempts of an idempotent request, including the
+            first one.
+        max_broadcast_attempts (int, optional): attempts of a broadcast, including the
+            first one.
+        backoff_base (float, optional): backoff in seconds before the first retry. It
+            doubles with every further retry.
+        backoff_max (float, optional): upper bound of the backoff in seconds.
+        retry_statuses (FrozenSet[int], optional): HTTP statuses considered transient.
+    """
+
+    max_attempts: int = attr.ib(default=1)
+    max_broadcast_attempts: int = attr.ib(default=1)
+    backoff_base: float = attr.ib(default=0.1)
+    backoff_max: float = attr.ib(default=5.0)
+    retry_statuses: FrozenSet[int] = attr.ib(
+        default=frozenset({429, 500, 502, 503, 504}), converter=frozenset
+    )
+
+    def is_retryable(self, error: BaseException, idempotent: bool) -> bool:
+        """Checks whether a request that failed with ``error`` may be sent again.
+
+        Args:
+            error (BaseException): raised error
+            idempotent (bool): whether the request can safely be repeated
+
+        Returns:
+            bool: whether the request may be sent again
+        """
+        if isinstance(error, LCDResponseError):
+            status = getattr(error.response, "status", 0)
+            if not idempotent:
+                return status == 429
+            return status in self.retry_statuses
+        if not idempotent:
+            return isinstance(error, ClientConnectorError)
+        return is_node_failure(error)
+
+    def should_retry(
+        self, error: BaseException, attempt: int, idempotent: bool
+    ) -> bool:
+        """Checks whether to retry a request after its ``attempt``-th attempt failed.
+
+        Args:
+            error (BaseException): raised error
+            attempt (int): number of attempts made so far
+            idempotent (bool): whether the request can safely be repeated
+
+        Returns:
+            bool: whether to retry
+        """
+        limit = self.max_attempts if idempotent else self.max_broadcast_attempts
+        return attempt < limit and self.is_retryable(error, idempotent)
+
+    def backoff(self, attempt: int) -> float:
+        """Computes the delay before the next attempt with exponential backoff and
+        full jitter.
+
+        Args:
+            attempt (int): number of attempts made so far
+
+        Returns:
+            float: delay in seconds
+        """
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        )
@@ -0,0 +1,157 @@
+import re
+from threading import Lock
+from typing import Optional, Tuple, Union
+
+from terra_sdk.core.broadcast import BlockTxBroadcastResult, SyncTxBroadcastResult
+from terra_sdk.exceptions import LCDResponseError
+
+__all__ = ["SequenceManager", "expected_sequence", "is_sequence_mismatch"]
+
+SEQUENCE_MISMATCH = re.compile(r"account sequence mismatch, expected (\d+)")
+"""Pattern of the ``ErrWrongSequence`` error message of the Cosmos SDK."""
+
+SDK_CODESPACE = "sdk"
+WRONG_SEQUENCE_CODE = 32
+
+
+def is_sequence_mismatch(
+    outcome: Union[SyncTxBroadcastResult, BlockTxBroadcastResult, LCDResponseError]
+) -> bool:
+    """Checks whether a broadcast was rejected because of a wrong account sequence.
+
+    Args:
+        outcome: broadcast result or raised error
+
+    Returns:
+        bool: whether the sequence did not match
+    """
+    if isinstance(outcome, LCDResponseError):
+        return SEQUENCE_MISMATCH.search(str(outcome.message)) is not None
+    return (
+        outcome.codespace == SDK_CODESPACE and outcome.code == WRONG_SEQUENCE_CODE
+    ) or SEQUENCE_MISMATCH.search(outcome.raw_log or "") is not None
+
+
+def expected_sequence(
+    outcome: Union[SyncTxBroadcastResult, BlockTxBroadcastResult, LCDResponseError]
+) -> Optional[int]:
+    """Gets the sequence the node expected from a sequence-mismatch error.
+
+    Args:
+        outcome: broadcast result or raised error
+
+    Returns:
+        Optional[int]: expected sequence, or ``None`` if unknown
+    """
+    if isinstance(outcome, LCDResponseError):
+        match = SEQUENCE_MISMATCH.search(str(outcome.message))
+    else:
+        match = SEQUENCE_MISMATCH.search(outcome.raw_log or "")
+    return int(match.group(1)) if match is not None else None
+
+
+class SequenceManager:
+    """Hands out the account number and sequences of an account from memory, so that
+    transactions can be signed back-to-back without querying the account first.
+
+    The account number is fetched once. Sequences are handed out atomically, also
+    across threads. When a broadcast is rejected for a sequence mismatch,
+    :meth:`observe` resyncs the counter from the sequence the node expected.
+    """
+
+    def __init__(self):
+        self.account_number: Optional[int] = None
+        self._next_sequence: Optional[int] = None
+        self._lock = Lock()
+
+    @property
+    def synced(self) -> bool:
+        """Whether the next sequence is known locally."""
+        return self._next_sequence is not None
+
+    @property
+    def next_sequence(self) -> Optional[int]:
+        """Sequence that will be handed out next, if known."""
+        return self._next_sequence
+
+    def sync(self, account_number: int, sequence: int):
+        """Sets the account number and the next sequence from the node, unless another
+        caller already did so in the meantime.
+
+        Args:
+            account_number (int): account number
+            sequence (int): next sequence reported by the node
+        """
+        with self._lock:
+            if self.account_number is None:
+                self.account_number = account_number
+            if self._next_sequence is None:
+                self._next_sequence = sequence
+
+    def take(self) -> Optional[Tuple[int, int]]:
+        """Reserves the next sequence.
+
+        Returns:
+            Optional[Tuple[int, int]]: account number and sequence, or ``None`` if the
+            manager has to be synced first
+        """
+        with self._lock:
+            if self.account_number is None or self._next_sequence is None:
+                return None
+            sequence = self._next_sequence
+            self._next_sequence += 1
+            return self.account_number, sequence
+
+    def release(self, sequence: int):
+        """Gives back a reserved sequence that will not be broadcast, e.g. because
+        signing failed. If later sequences were handed out in the meantime, the local
+        sequence is forgotten instead, since it now has a gap.
+
+        Args:
+            sequence (int): reserved sequence
+        """
+        with self._lock:
+            if self._next_sequence == sequence + 1:
+                self._next_sequence = sequence
+            else:
+                self._next_sequence = None
+
+    def reset(self, sequence: Optional[int] = None):
+        """Forgets the local sequence so that it is fetched again, or sets it.
+
+        Args:
+            sequence (int, optional): next sequence, if known
+        """
+        with self._lock:
+            self._next_sequence = sequence
+
+    def observe(
+        self,
+        outcome: Union[SyncTxBroadcastResult, BlockTxBroadcastResult, LCDResponseError],
+        sequence: Optional[int] = None,
+    ) -> bool:
+        """Updates the local sequence after a broadcast. A sequence mismatch resyncs it
+        to the sequence the node expected, or has it fetched again if the error does
+        not tell. A transaction rejected for another reason did not use up its
+        sequence: if it is given and no later sequence was handed out, it is handed
+        out again. Otherwise the local sequence is kept.
+
+        Args:
+            outcome: broadcast result or raised error
+            sequence (int, optional): sequence the transaction was signed with
+
+        Returns:
+            bool: whether the sequence had to be resynced
+        """
+        if is_sequence_mismatch(outcome):
+            self.reset(expected_sequence(outcome))
+            return True
+        if (
+            sequence is not None
+            and not isinstance(outcome, LCDResponseError)
+            and outcome.code
+        ):
+            with self._lock:
+                if self._next_sequence == sequence + 1:
+                    self._next_sequence = sequence
+        return False
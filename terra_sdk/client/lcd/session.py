@@ -0,0 +1,52 @@
+from asyncio import AbstractEventLoop
+from typing import Optional
+
+import attr
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+__all__ = ["ConnectionOptions"]
+
+
+@attr.s
+class ConnectionOptions:
+    """Settings of the pooled HTTP connections held by an LCD client.
+
+    Args:
+        limit (int, optional): total number of simultaneous connections (0 for no limit).
+        limit_per_host (int, optional): number of simultaneous connections to a single
+            host (0 for no limit).
+        keepalive_timeout (float, optional): seconds an idle connection is kept open
+            for reuse.
+        ttl_dns_cache (int, optional): seconds resolved host names are cached. ``None``
+            caches them forever.
+        timeout (float, optional): total timeout of a single request in seconds.
+    """
+
+    limit: int = attr.ib(default=100)
+    limit_per_host: int = attr.ib(default=0)
+    keepalive_timeout: float = attr.ib(default=30.0)
+    ttl_dns_cache: Optional[int] = attr.ib(default=300)
+    timeout: Optional[float] = attr.ib(default=None)
+
+    def create_session(self, loop: AbstractEventLoop) -> ClientSession:
+        """Creates a new ``aiohttp.ClientSession`` backed by a keep-alive connector.
+
+        Args:
+            loop (AbstractEventLoop): event loop the session is bound to
+
+        Returns:
+            ClientSession: session
+        """
+        connector = TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            loop=loop,
+        )
+        return ClientSession(
+            connector=connector,
+            headers={"Accept": "application/json"},
+            timeout=ClientTimeout(total=self.timeout),
+            loop=loop,
+        )
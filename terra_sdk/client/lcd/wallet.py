@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+from typing import Optional, Tuple
+
+import attr
+
+from terra_sdk.core.broadcast import SyncTxBroadcastResult
+from terra_sdk.exceptions import LCDResponseError
 from terra_sdk.key.key import Key, SignOptions
 
 from .api.tx import CreateTxOptions, SignerOptions
+from .sequence import SequenceManager
 
 __all__ = ["Wallet", "AsyncWallet"]
 
 from ...core.tx import SignMode, Tx
 
 
+def _signed_sequence(tx: Tx) -> Optional[int]:
+    signer_infos = tx.auth_info.signer_infos
+    return signer_infos[0].sequence if signer_infos else None
+
+
 class AsyncWallet:
-    def __init__(self, lcd, key: Key):
+    def __init__(self, lcd, key: Key, manage_sequence: bool = False):
         self.lcd = lcd
         self.key = key
+        self.sequence_manager: Optional[SequenceManager] = (
+            SequenceManager() if manage_sequence else None
+        )
 
     async def account_number(self) -> int:
         res = await self.lcd.auth.account_info(self.key.acc_address)
@@ -29,6 +44,14 @@ class AsyncWallet:
             "sequence": res.get_sequence(),
         }
 
+    async def _reserve_sequence(self, manager: SequenceManager) -> Tuple[int, int]:
+        reserved = manager.take()
+        while reserved is None:
+            res = await self.account_number_and_sequence()
+            manager.sync(res["account_number"], res["sequence"])
+            reserved = manager.take()
+        return reserved
+
     async def create_tx(self, options: CreateTxOptions) -> Tx:
         sigOpt = [
             SignerOptions(
@@ -42,35 +65,69 @@ class AsyncWallet:
     async def create_and_sign_tx(self, options: CreateTxOptions) -> Tx:
         account_number = options.account_number
         sequence = options.sequence
-        if account_number is None or sequence is None:
+        manager = self.sequence_manager
+        reserved = None
+        if manager is not None and sequence is None:
+            reserved = await self._reserve_sequence(manager)
+            if account_number is None:
+                account_number = reserved[0]
+            sequence = reserved[1]
+        elif account_number is None or sequence is None:
             res = await self.account_number_and_sequence()
             if account_number is None:
                 account_number = res.get("account_number")
             if sequence is None:
                 sequence = res.get("sequence")
-        options.sequence = sequence
-        options.account_number = account_number
-        return self.key.sign_tx(
-            tx=(await self.create_tx(options)),
-            options=SignOptions(
-                account_number=account_number,
-                sequence=sequence,
-                chain_id=self.lcd.chain_id,
-                sign_mode=options.sign_mode
-                if options.sign_mode
-                else SignMode.SIGN_MODE_DIRECT,
-            ),
-        )
+        options = attr.evolve(options, sequence=sequence, account_number=account_number)
+        try:
+            # the unsigned transaction is not handed out, so its body can be encoded
+            # once for the signature, the broadcast and the hash
+            signed = self.key.sign_tx(
+                tx=(await self.create_tx(options)).finalize(),
+                options=SignOptions(
+                    account_number=account_number,
+                    sequence=sequence,
+                    chain_id=self.lcd.chain_id,
+                    sign_mode=options.sign_mode
+                    if options.sign_mode
+                    else SignMode.SIGN_MODE_DIRECT,
+                ),
+            )
+            return signed.finalize()
+        except BaseException:
+            if manager is not None and reserved is not None:
+                manager.release(reserved[1])
+            raise
+
+    async def broadcast_sync(self, tx: Tx) -> SyncTxBroadcastResult:
+        try:
+            res = await self.lcd.tx.broadcast_sync(tx)
+        except LCDResponseError as e:
+            if self.sequence_manager is not None:
+                self.sequence_manager.observe(e)
+            raise
+        if self.sequence_manager is not None:
+            self.sequence_manager.observe(res, _signed_sequence(tx))
+        return res
 
 
 class Wallet:
     """Wraps around a :class:`Key` implementation and provides transaction building and
     signing functionality. It is recommended to create this object through
-    :meth:`LCDClient.wallet()<terra_sdk.client.lcd.LCDClient.wallet>`."""
+    :meth:`LCDClient.wallet()<terra_sdk.client.lcd.LCDClient.wallet>`.
+
+    With ``manage_sequence``, the account number is fetched once and sequences are
+    handed out from memory by a :class:`SequenceManager<terra_sdk.client.lcd.sequence.SequenceManager>`,
+    so transactions can be signed and broadcast back-to-back without querying the account
+    first. Broadcast them with :meth:`broadcast_sync` to resync the sequence when the node
+    rejects one."""
 
-    def __init__(self, lcd, key: Key):
+    def __init__(self, lcd, key: Key, manage_sequence: bool = False):
         self.lcd = lcd
         self.key = key
+        self.sequence_manager: Optional[SequenceManager] = (
+            SequenceManager() if manage_sequence else None
+        )
 
     def account_number(self) -> int:
         """Fetches account number for the account associated with the Key."""
@@ -90,6 +147,14 @@ class Wallet:
             "sequence": res.get_sequence(),
         }
 
+    def _reserve_sequence(self, manager: SequenceManager) -> Tuple[int, int]:
+        reserved = manager.take()
+        while reserved is None:
+            res = self.account_number_and_sequence()
+            manager.sync(res["account_number"], res["sequence"])
+            reserved = manager.take()
+        return reserved
+
     def create_tx(self, options: CreateTxOptions) -> Tx:
         """Builds an unsigned transaction object. The ``Wallet`` will first
         query the blockchain to fetch the latest ``account`` and ``sequence`` values for the
@@ -120,27 +185,61 @@ class Wallet:
             options (CreateTxOptions): Options to create a tx
 
         Returns:
-            Tx: signed transaction
+            Tx: signed transaction, finalized (see :meth:`Tx.finalize()<terra_sdk.core.tx.Tx.finalize>`)
         """
 
         account_number = options.account_number
         sequence = options.sequence
-        if account_number is None or sequence is None:
+        manager = self.sequence_manager
+        reserved = None
+        if manager is not None and sequence is None:
+            reserved = self._reserve_sequence(manager)
+            if account_number is None:
+                account_number = reserved[0]
+            sequence = reserved[1]
+        elif account_number is None or sequence is None:
             res = self.account_number_and_sequence()
             if account_number is None:
                 account_number = res.get("account_number")
             if sequence is None:
                 sequence = res.get("sequence")
-        options.sequence = sequence
-        options.account_number = account_number
-        return self.key.sign_tx(
-            tx=self.create_tx(options),
-            options=SignOptions(
-                account_number=account_number,
-                sequence=sequence,
-                chain_id=self.lcd.chain_id,
-                sign_mode=options.sign_mode
-                if options.sign_mode
-                else SignMode.SIGN_MODE_DIRECT,
-            ),
-        )
+        options = attr.evolve(options, sequence=sequence, account_number=account_number)
+        try:
+            # the unsigned transaction is not handed out, so its body can be encoded
+            # once for the signature, the broadcast and the hash
+            signed = self.key.sign_tx(
+                tx=self.create_tx(options).finalize(),
+                options=SignOptions(
+                    account_number=account_number,
+                    sequence=sequence,
+                    chain_id=self.lcd.chain_id,
+                    sign_mode=options.sign_mode
+                    if options.sign_mode
+                    else SignMode.SIGN_MODE_DIRECT,
+                ),
+            )
+            return signed.finalize()
+        except BaseException:
+            if manager is not None and reserved is not None:
+                manager.release(reserved[1])
+            raise
+
+    def broadcast_sync(self, tx: Tx) -> SyncTxBroadcastResult:
+        """Broadcasts a transaction signed by this wallet in ``sync`` mode. With
+        ``manage_sequence``, the local sequence is resynced if the node rejects it.
+
+        Args:
+            tx (Tx): signed transaction
+
+        Returns:
+            SyncTxBroadcastResult: result of the check of the transaction
+        """
+        try:
+            res = self.lcd.tx.broadcast_sync(tx)
+        except LCDResponseError as e:
+            if self.sequence_manager is not None:
+                self.sequence_manager.observe(e)
+            raise
+        if self.sequence_manager is not None:
+            self.sequence_manager.observe(res, _signed_sequence(tx))
+        return res
@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+from asyncio import (
+    CancelledError,
+    Event,
+    Future,
+    Queue,
+    Task,
+    TimeoutError,
+    ensure_future,
+    gather,
+    get_running_loop,
+    wait_for,
+)
+from collections import deque
+from functools import partial
+from typing import (
+    AsyncIterable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import attr
+
+from terra_sdk.core import AccAddress
+from terra_sdk.core.msg import Msg
+from terra_sdk.exceptions import TxRejectedError
+from terra_sdk.key.key import Key
+from terra_sdk.key.mnemonic import MnemonicKey
+
+from .api.tx import CreateTxOptions
+from .pipeline import TxPipeline
+from .sequence import is_sequence_mismatch
+from .wallet import AsyncWallet
+from .watcher import ConfirmationWatcher
+
+__all__ = ["WalletPool"]
+
+Submission = Union[CreateTxOptions, List[Msg]]
+TxFactory = Callable[[AccAddress], Submission]
+_Submitted = Tuple[TxFactory, Future]
+
+
+@attr.s
+class _Account:
+    wallet: AsyncWallet = attr.ib()
+    pipeline: TxPipeline = attr.ib()
+    in_flight: int = attr.ib(default=0)
+    last_used: int = attr.ib(default=0)
+    stuck_until: float = attr.ib(default=0)
+    # submissions handed to the pipeline, by the future of the pipeline
+    submissions: Dict[Future, _Submitted] = attr.ib(factory=dict)
+
+
+class WalletPool:
+    """Spreads transactions over many accounts, since the sequence of an account lets a
+    node accept its transactions only one after the other.
+
+    Each submitted transaction goes to the account with the fewest transactions in
+    flight, which signs and broadcasts it through its own :class:`TxPipeline<terra_sdk.client.lcd.TxPipeline>`
+    with its own sequence. An account whose transaction is not included in time or keeps
+    hitting sequence mismatches is considered stuck: it receives no new transactions for
+    ``cooldown`` seconds, its sequence is fetched again, and the other accounts take over
+    its share. The transactions it has not broadcast yet are handed to the other
+    accounts too; those already broadcast keep waiting for inclusion.
+
+    .. code-block:: python
+
+        pool = WalletPool.from_mnemonic(terra, mnemonic, count=8, fee_granter=treasury)
+        async with pool:
+            futures = await pool.feed(
+                lambda sender: [MsgExecuteContract(sender, contract, order)]
+                for order in orders
+            )
+
+    Messages name the account that sends them, which is only known once the account is
+    picked, and changes when the transaction is handed to another account. So
+    transactions are submitted as functions that take the address of the account and
+    return the messages or options of the transaction.
+
+    Args:
+        lcd (AsyncLCDClient): client to send transactions with
+        keys (List[Key]): keys of the accounts
+        fee_granter (AccAddress, optional): account that pays the fees of all accounts
+            through fee grants
+        max_in_flight (int, optional): transactions an account may have broadcast but not
+            included at the same time
+        cooldown (float, optional): seconds a stuck account receives no transactions
+        max_queued (int, optional): number of submissions waiting for an account before
+            :meth:`submit` waits
+        poll_interval (float, optional): seconds between checks of pending transactions
+        **pipeline_options: options of the :class:`TxPipeline` of every account, e.g.
+            ``confirm_timeout``
+    """
+
+    def __init__(
+        self,
+        lcd,
+        keys: List[Key],
+        fee_granter: Optional[AccAddress] = None,
+        max_in_flight: int = 4,
+        cooldown: float = 30.0,
+        max_queued: int = 100,
+        poll_interval: float = 1.0,
+        **pipeline_options,
+    ):
+        if not keys:
+            raise ValueError("WalletPool needs at least one key")
+        self.lcd = lcd
+        self.max_in_flight = max_in_flight
+        self.cooldown = cooldown
+        self.max_queued = max_queued
+        self.watcher = ConfirmationWatcher(lcd, poll_interval)
+        self._accounts = [
+            _Account(
+                wallet,
+                TxPipeline(
+                    wallet,
+                    concurrency=max_in_flight,
+                    watcher=self.watcher,
+                    fee_granter=fee_granter,
+                    **pipeline_options,
+                ),
+            )
+            for wallet in (lcd.wallet(key, manage_sequence=True) for key in keys)
+        ]
+        self._uses = 0
+        self._queue: Optional[Queue] = None
+        self._retry: Deque[_Submitted] = deque()
+        self._capacity: Optional[Event] = None
+        self._dispatcher: Optional[Task] = None
+        self._futures: Set[Future] = set()
+
+    @classmethod
+    def from_mnemonic(
+        cls, lcd, mnemonic: str, count: int, account: int = 0, **kwargs
+    ) -> WalletPool:
+        """Creates a pool over the first ``count`` address indices of a mnemonic.
+
+        Args:
+            lcd (AsyncLCDClient): client to send transactions with
+            mnemonic (str): mnemonic of the keys
+            count (int): number of accounts
+            account (int, optional): HD path account of the keys
+            **kwargs: options of the pool
+
+        Returns:
+            WalletPool: pool over the keys
+        """
+        keys: List[Key] = [
+            MnemonicKey(mnemonic, account, index) for index in range(count)
+        ]
+        return cls(lcd, keys, **kwargs)
+
+    @property
+    def wallets(self) -> List[AsyncWallet]:
+        """Wallets of the accounts of the pool."""
+        return [account.wallet for account in self._accounts]
+
+    @property
+    def stuck(self) -> List[AsyncWallet]:
+        """Wallets of the accounts that currently receive no transactions."""
+        now = get_running_loop().time()
+        return [a.wallet for a in self._accounts if a.stuck_until > now]
+
+    async def start(self):
+        """Starts dispatching transactions. Called by :meth:`submit` if needed."""
+        if self._dispatcher is not None:
+            return
+        self._queue = Queue(self.max_queued)
+        self._capacity = Event()
+        self._dispatcher = ensure_future(self._dispatch())
+
+    async def submit(self, tx: TxFactory) -> Future:
+        """Queues a transaction for the next idle account, waiting while the pool is full.
+
+        Args:
+            tx: function that returns the options of the transaction, or its messages,
+                from the address of the account that sends it
+
+        Raises:
+            TypeError: if ``tx`` is not callable
+
+        Returns:
+            Future: future of the ``TxInfo`` of the included transaction
+        """
+        if not callable(tx):
+            raise TypeError(
+                "WalletPool.submit() takes a function of the sender address, since "
+                "the messages must name the account the pool picks"
+            )
+        await self.start()
+        assert self._queue is not None
+        future = get_running_loop().create_future()
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        await self._queue.put((tx, future))
+        return future
+
+    async def feed(
+        self, stream: Union[AsyncIterable, Iterable[TxFactory]]
+    ) -> List[Future]:
+        """Submits every transaction of a stream.
+
+        Args:
+            stream: (asynchronous) iterable of transactions as taken by :meth:`submit`
+
+        Returns:
+            List[Future]: futures of the transactions, in order
+        """
+        if hasattr(stream, "__aiter__"):
+            return [await self.submit(tx) async for tx in stream]
+        return [await self.submit(tx) for tx in stream]
+
+    async def join(self):
+        """Waits until every submitted transaction is included or has failed."""
+        while self._futures:
+            await gather(*self._futures, return_exceptions=True)
+
+    async def close(self):
+        """Stops the pool. Transactions without outcome yet are cancelled."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        await gather(*[account.pipeline.close() for account in self._accounts])
+        await self.watcher.close()
+        self._retry.clear()
+        for future in list(self._futures):
+            future.cancel()
+
+    async def __aenter__(self) -> WalletPool:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            await self.join()
+        await self.close()
+
+    def _idle_account(self) -> Optional[_Account]:
+        now = get_running_loop().time()
+        idle = [
+            account
+            for account in self._accounts
+            if account.in_flight < self.max_in_flight and account.stuck_until <= now
+        ]
+        if not idle:
+            return None
+        return min(idle, key=lambda account: (account.in_flight, account.last_used))
+
+    async def _dispatch(self):
+        while True:
+            if self._retry:
+                submission = self._retry.popleft()
+            else:
+                submission = await self._queue.get()
+                if submission is None:
+                    continue
+            tx, future = submission
+            account = self._idle_account()
+            while account is None:
+                # wait for a transaction to settle, or for a stuck account to cool down
+                self._capacity.clear()
+                now = get_running_loop().time()
+                cooldowns = [
+                    a.stuck_until - now for a in self._accounts if a.stuck_until > now
+                ]
+                try:
+                    await wait_for(
+                        self._capacity.wait(), min(cooldowns) if cooldowns else None
+                    )
+                except TimeoutError:
+                    pass
+                account = self._idle_account()
+            if future.done():
+                continue
+
+            self._uses += 1
+            account.last_used = self._uses
+            account.in_flight += 1
+            try:
+                inner = await account.pipeline.submit(
+                    tx(account.wallet.key.acc_address)
+                )
+            except CancelledError:
+                account.in_flight -= 1
+                raise
+            except Exception as e:
+                account.in_flight -= 1
+                future.set_exception(e)
+                continue
+            account.submissions[inner] = submission
+            inner.add_done_callback(partial(self._settle, account))
+
+    def _settle(self, account: _Account, inner: Future):
+        account.in_flight -= 1
+        if self._capacity is not None:
+            self._capacity.set()
+        submission = account.submissions.pop(inner, None)
+        if submission is None:
+            return  # taken back from a stuck account and submitted again
+        future = submission[1]
+        if inner.cancelled():
+            future.cancel()
+            return
+        error = inner.exception()
+        if isinstance(error, TimeoutError) or (
+            isinstance(error, TxRejectedError) and is_sequence_mismatch(error.result)
+        ):
+            account.stuck_until = get_running_loop().time() + self.cooldown
+            manager = account.wallet.sequence_manager
+            if manager is not None:
+                manager.reset()
+            self._resubmit_queued(account)
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(inner.result())
+
+    def _resubmit_queued(self, account: _Account):
+        # the transactions queued behind a stuck account would wait for it or fail
+        # with it, so they go to the other accounts ahead of new submissions
+        for inner in account.pipeline.drain():
+            submission = account.submissions.pop(inner, None)
+            if submission is not None:
+                self._retry.append(submission)
+        if self._retry and self._queue is not None and self._queue.empty():
+            self._queue.put_nowait(None)  # wakes up the dispatcher
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+from asyncio import (
+    CancelledError,
+    Future,
+    Task,
+    TimeoutError,
+    ensure_future,
+    get_running_loop,
+    sleep,
+)
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+import attr
+
+from terra_sdk.core.tx import TxInfo
+from terra_sdk.util.hash import hash_amino
+
+from .api._base import BaseAsyncAPI
+
+__all__ = ["ConfirmationWatcher"]
+
+logger = logging.getLogger(__name__)
+
+
+@attr.s
+class _Watch:
+    future: Future = attr.ib()
+    timeout_height: Optional[int] = attr.ib(default=None)
+    deadline: Optional[float] = attr.ib(default=None)
+
+
+class ConfirmationWatcher:
+    """Waits for many broadcast transactions to be included in a block at the cost of
+    about one request per block, instead of one ``tx_info`` call per transaction and poll,
+    or one open connection per transaction with ``BROADCAST_MODE_BLOCK``.
+
+    Each poll fetches the latest block, and the blocks since the previous poll if any
+    were missed. When polling starts, the ``lookback_blocks`` blocks before the latest
+    are fetched too, since a transaction may be included before it is watched. The
+    transactions of every block that contains a watched hash are then fetched with a
+    single ``tx.height`` search. Polling stops while nothing is watched.
+
+    .. code-block:: python
+
+        watcher = ConfirmationWatcher(terra)
+        results = [await terra.tx.broadcast_sync(tx) for tx in txs]
+        infos = await asyncio.gather(*[watcher.watch(res.txhash) for res in results])
+
+    Args:
+        lcd (AsyncLCDClient): client to poll
+        poll_interval (float, optional): seconds between polls, about a block time
+        recent_blocks (int, optional): number of scanned blocks whose transaction hashes
+            are remembered, so that a transaction included before it is watched is found
+        page_limit (int, optional): page size of the ``tx.height`` search
+        lookback_blocks (int, optional): number of blocks before the latest one scanned
+            when polling starts
+    """
+
+    def __init__(
+        self,
+        lcd,
+        poll_interval: float = 1.0,
+        recent_blocks: int = 10,
+        page_limit: int = 100,
+        lookback_blocks: int = 5,
+    ):
+        self.lcd = lcd
+        self.poll_interval = poll_interval
+        self.recent_blocks = recent_blocks
+        self.page_limit = page_limit
+        self.lookback_blocks = lookback_blocks
+
+        self.height: Optional[int] = None
+        """Last scanned block height."""
+
+        self._watches: Dict[str, _Watch] = {}
+        self._recent: "OrderedDict[int, Set[str]]" = OrderedDict()
+        self._rescan: Set[int] = set()
+        self._task: Optional[Task] = None
+
+    @property
+    def pending(self) -> List[str]:
+        """Hashes of the watched transactions that are not included yet."""
+        return list(self._watches)
+
+    def watch(
+        self,
+        txhash: str,
+        timeout_height: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Watches for a transaction to be included.
+
+        Args:
+            txhash (str): hash of a broadcast transaction
+            timeout_height (int, optional): ``timeout_height`` of the transaction: it fails
+                once a later block has been scanned without it
+            timeout (float, optional): seconds after which it fails
+
+        Returns:
+            Future: future of the ``TxInfo`` of the included transaction, failing with
+            :class:`asyncio.TimeoutError` on timeout
+        """
+        txhash = txhash.upper()
+        watch = self._watches.get(txhash)
+        if watch is not None and not watch.future.done():
+            return watch.future
+
+        loop = get_running_loop()
+        watch = _Watch(
+            loop.create_future(),
+            timeout_height or None,
+            loop.time() + timeout if timeout is not None else None,
+        )
+        self._watches[txhash] = watch
+        for height, hashes in self._recent.items():
+            if txhash in hashes:
+                self._rescan.add(height)
+        if self._task is None or self._task.done():
+            self._task = ensure_future(self._run())
+        return watch.future
+
+    async def close(self):
+        """Stops polling. Transactions still watched are cancelled."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except CancelledError:
+                pass
+            self._task = None
+        for watch in self._watches.values():
+            watch.future.cancel()
+        self._watches.clear()
+
+    async def _run(self):
+        while self._watches:
+            try:
+                await self._poll()
+            except CancelledError:
+                raise
+            except Exception:
+                # the node may be unreachable for a moment: keep watching
+                logger.warning("polling for confirmations failed", exc_info=True)
+            self._expire()
+            if self._watches:
+                await sleep(self.poll_interval)
+        # whatever is watched next was broadcast after this point
+        self.height = None
+        self._recent.clear()
+        self._rescan.clear()
+
+    async def _poll(self):
+        block = await BaseAsyncAPI._try_await(self.lcd.tendermint.block_info())
+        latest = int(block["block"]["header"]["height"])
+        if self.height is None:
+            start = max(latest - self.lookback_blocks, 1)
+        else:
+            start = self.height + 1
+
+        for height in sorted(self._rescan):
+            await self._scan(height)
+            self._rescan.discard(height)
+        for height in range(start, latest + 1):
+            txs = block["block"]["data"].get("txs")
+            if height != latest:
+                missed = await BaseAsyncAPI._try_await(
+                    self.lcd.tendermint.block_info(height)
+                )
+                txs = missed["block"]["data"].get("txs")
+            hashes = {hash_amino(tx).upper() for tx in (txs or [])}
+            self._remember(height, hashes)
+            if not hashes.isdisjoint(self._watches):
+                await self._scan(height)
+            self.height = height
+
+    async def _scan(self, height: int):
+        infos: List[TxInfo] = []
+        while True:
+            res = await BaseAsyncAPI._try_await(
+                self.lcd.tx.search(
+                    [["tx.height", height]],
+                    {
+                        "pagination.offset": len(infos),
+                        "pagination.limit": self.page_limit,
+                    },
+                )
+            )
+            infos.extend(res["txs"])
+            total = int((res.get("pagination") or {}).get("total") or 0)
+            if len(res["txs"]) < self.page_limit or len(infos) >= total:
+                break
+
+        self._remember(height, {info.txhash.upper() for info in infos})
+        for info in infos:
+            watch = self._watches.pop(info.txhash.upper(), None)
+            if watch is not None and not watch.future.done():
+                watch.future.set_result(info)
+
+    def _remember(self, height: int, hashes: Set[str]):
+        self._recent[height] = hashes
+        while len(self._recent) > self.recent_blocks:
+            self._recent.popitem(last=False)
+
+    def _expire(self):
+        now = get_running_loop().time()
+        for txhash, watch in list(self._watches.items()):
+            if watch.future.done():
+                del self._watches[txhash]
+            elif (
+                watch.timeout_height is not None
+                and self.height is not None
+                and self.height >= watch.timeout_height
+            ) or (watch.deadline is not None and now > watch.deadline):
+                del self._watches[txhash]
+                watch.future.set_exception(
+                    TimeoutError(f"transaction {txhash} was not included in time")
+                )
@@ -1,5 +1,17 @@
 from abc import ABC, abstractmethod
 
+from betterproto.lib.google.protobuf import Any as Any_pb
+from terra_proto.cosmos.auth.v1beta1 import BaseAccount as BaseAccount_pb
+from terra_proto.cosmos.vesting.v1beta1 import (
+    ContinuousVestingAccount as ContinuousVestingAccount_pb,
+)
+from terra_proto.cosmos.vesting.v1beta1 import (
+    DelayedVestingAccount as DelayedVestingAccount_pb,
+)
+from terra_proto.cosmos.vesting.v1beta1 import (
+    PeriodicVestingAccount as PeriodicVestingAccount_pb,
+)
+
 from terra_sdk.core.public_key import PublicKey
 from terra_sdk.util.json import JSONSerializable
 
@@ -43,3 +55,23 @@ class Account(JSONSerializable, ABC):
             return DelayedVestingAccount.from_data(data)
         elif data["@type"] == PeriodicVestingAccount.type_url:
             return PeriodicVestingAccount.from_data(data)
+
+    @classmethod
+    def from_proto(cls, proto: Any_pb):  # -> Account:
+        type_url = proto.type_url
+        value = proto.value
+        if type_url == BaseAccount.type_url:
+            return BaseAccount.from_proto(BaseAccount_pb().parse(value))
+        elif type_url == ContinuousVestingAccount.type_url:
+            return ContinuousVestingAccount.from_proto(
+                ContinuousVestingAccount_pb().parse(value)
+            )
+        elif type_url == DelayedVestingAccount.type_url:
+            return DelayedVestingAccount.from_proto(
+                DelayedVestingAccount_pb().parse(value)
+            )
+        elif type_url == PeriodicVestingAccount.type_url:
+            return PeriodicVestingAccount.from_proto(
+                PeriodicVestingAccount_pb().parse(value)
+            )
+        raise TypeError("could not unmarshal Account: type is incorrect")
@@ -87,7 +87,9 @@ class BaseAccount(JSONSerializable):
     def from_proto(cls, proto: BaseAccount_pb) -> BaseAccount:
         return cls(
             address=proto.address,
-            public_key=PublicKey.from_proto(proto.pub_key),
+            public_key=PublicKey.from_proto(proto.pub_key)
+            if proto.pub_key and proto.pub_key.type_url
+            else None,
             account_number=proto.account_number,
             sequence=proto.sequence,
         )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
 from terra_proto.cosmos.base.v1beta1 import Coin as Coin_pb
@@ -65,7 +64,7 @@ class Coins(JSONSerializable, List[Coin_pb]):
             raise TypeError(f"could not create Coins object with argument: {arg!s}")
 
         if isinstance(arg, Coins):
-            self._coins = copy.deepcopy(arg._coins)
+            self._coins = dict(arg._coins)
             return
 
         if isinstance(arg, str):
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import base64
 import math
+from typing import Callable, List
 
 import attr
 from terra_proto.cosmos.crypto.multisig.v1beta1 import (
@@ -71,18 +72,37 @@ class CompactBitArray(JSONSerializable):
         return True
 
     def num_true_bits_before(self, index: int) -> int:
-        def count_one_bits(n: int):
-            return len("".join("{0:b}".format(n).split("0")))
-
-        ones_count = 0
-        _max = self.count()
-        if index > _max:
-            index = _max
-
-        elem = 0
-        while True:
-            if (elem * 8 + 7) >= index:
-                ones_count += count_one_bits(self.elems[elem] >> (7 - (index % 8) + 1))
-                return ones_count
-            ones_count += count_one_bits(self.elems[elem])
-            elem += 1
+        index = min(index, self.count())
+        whole, rest = divmod(index, 8)
+        ones_count = _popcount(int.from_bytes(self.elems[:whole], "big"))
+        if rest:
+            ones_count += _popcount(self.elems[whole] >> (8 - rest))
+        return ones_count
+
+    def num_true_bits(self) -> int:
+        return self.num_true_bits_before(self.count())
+
+    def true_indices(self) -> List[int]:
+        """Gets the indices of the set bits, in increasing order."""
+        indices: List[int] = []
+        for elem, byte in enumerate(self.elems):
+            if byte:
+                indices.extend(
+                    elem * 8 + bit for bit in range(8) if byte & (0x80 >> bit)
+                )
+        return [i for i in indices if i < self.count()]
+
+
+# number of set bits of every byte value
+_BYTE_POPCOUNTS = bytes(bin(i).count("1") for i in range(256))
+
+
+def _popcount_bytes(n: int) -> int:
+    return sum(n.to_bytes((n.bit_length() + 7) // 8, "big").translate(_BYTE_POPCOUNTS))
+
+
+_popcount: Callable[[int], int]
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # pragma: no cover - int.bit_count() needs Python 3.10
+    _popcount = _popcount_bytes
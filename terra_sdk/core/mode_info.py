@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 import attr
+import betterproto
 from terra_proto.cosmos.tx.v1beta1 import ModeInfo as ModeInfo_pb
 from terra_proto.cosmos.tx.v1beta1 import ModeInfoMulti as ModeInfoMulti_pb
 from terra_proto.cosmos.tx.v1beta1 import ModeInfoSingle as ModeInfoSingle_pb
@@ -51,10 +52,10 @@ class ModeInfo(JSONSerializable):
 
     @classmethod
     def from_proto(cls, proto: ModeInfo_pb) -> ModeInfo:
-        if proto.single is not None:
-            return ModeInfo(single=ModeInfoSingle.from_proto(proto.single))
-        else:
+        # betterproto fills both fields of the oneof with defaults, so ask which one is set
+        if betterproto.which_one_of(proto, "sum")[0] == "multi":
             return ModeInfo(multi=ModeInfoMulti.from_proto(proto.multi))
+        return ModeInfo(single=ModeInfoSingle.from_proto(proto.single))
 
 
 @attr.s
@@ -105,5 +106,5 @@ class ModeInfoMulti(JSONSerializable):
     def from_proto(cls, proto: ModeInfoMulti_pb) -> ModeInfoMulti:
         return cls(
             CompactBitArray.from_proto(proto.bitarray),
-            ModeInfo_pb.from_proto(proto.mode_infos),
+            [ModeInfo.from_proto(mi) for mi in proto.mode_infos],
         )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List
 
 import attr
 
@@ -18,14 +18,49 @@ __all__ = ["MultiSignature"]
 
 @attr.s
 class MultiSignature(JSONSerializable):
+    """Collects the signatures of the members of a multisig account into the signature of
+    the account.
+
+    Args:
+        multisig_pubkey (LegacyAminoMultisigPublicKey): public key of the multisig account
+    """
+
     bitarray: CompactBitArray = attr.ib(init=False)
     signatures: List[Descriptor] = attr.ib(init=False)
     multisig_pubkey: LegacyAminoMultisigPublicKey = attr.ib()
+    _indices: Dict[bytes, int] = attr.ib(init=False, repr=False, eq=False)
 
     def __attrs_post_init__(self):
         n = len(self.multisig_pubkey.public_keys)
         self.bitarray = CompactBitArray.from_bits(n)
         self.signatures = []
+        self._indices = {}
+        for i, public_key in enumerate(self.multisig_pubkey.public_keys):
+            self._indices.setdefault(bytes(public_key.key), i)
+
+    def to_data(self) -> dict:
+        return {
+            "bitarray": self.bitarray.to_data(),
+            "signatures": [sig.to_data() for sig in self.signatures],
+            "multisig_pubkey": self.multisig_pubkey.to_data(),
+        }
+
+    def index_of(self, public_key: SimplePublicKey) -> int:
+        """Finds the position of a member in the public key of the multisig account.
+
+        Args:
+            public_key (SimplePublicKey): public key of the member
+
+        Raises:
+            ValueError: if the key is not a member of the multisig account
+
+        Returns:
+            int: index of the member
+        """
+        index = self._indices.get(bytes(public_key.key))
+        if index is None:
+            raise ValueError("provided key doesn't exist in public_keys")
+        return index
 
     def append_signature(self, signature_data: Descriptor, index: int):
         new_idx = self.bitarray.num_true_bits_before(index)
@@ -46,20 +81,31 @@ class MultiSignature(JSONSerializable):
     def append_signature_from_pubkey(
         self, signature_data: Descriptor, public_key: SimplePublicKey
     ):
-        index = 0
-        for i, v in enumerate(self.multisig_pubkey.public_keys):
-            if v.key == public_key.key:
-                index = i
-                break
-        if index < 0:
-            raise ValueError("provided key doesn't exist in public_keys")
-        self.append_signature(signature_data, index)
+        self.append_signature(signature_data, self.index_of(public_key))
 
     def append_signature_v2s(self, signatures: List[SignatureV2]):
+        """Adds the signatures of members, replacing earlier signatures of the same
+        members. The bit array and the signatures in bit order are built again once for
+        all of them, rather than once per signature.
+
+        Args:
+            signatures (List[SignatureV2]): signatures of members
+
+        Raises:
+            ValueError: if a signature is not made by a member
+        """
+        by_index = dict(zip(self.bitarray.true_indices(), self.signatures))
         for sig in signatures:
             if not isinstance(sig.public_key, SimplePublicKey):
                 raise ValueError("non-SimplePublicKey cannot be used to sign multisig")
-            self.append_signature_from_pubkey(sig.data, sig.public_key)
+            by_index[self.index_of(sig.public_key)] = sig.data
+
+        bitarray = CompactBitArray.from_bits(len(self.multisig_pubkey.public_keys))
+        indices = sorted(by_index)
+        for index in indices:
+            bitarray.set_index(index, True)
+        self.bitarray = bitarray
+        self.signatures = [by_index[index] for index in indices]
 
     def to_signature_descriptor(self) -> Descriptor:
         return Descriptor(
@@ -349,6 +349,14 @@ class Dec(JSONSerializable):
         """Converts Dec-formatted string into proper :class:`Dec` object."""
         return cls(data)
 
+    @classmethod
+    def from_proto(cls, data: str) -> Dec:
+        """Converts a Dec from a protobuf message into a :class:`Dec` object. The
+        Cosmos SDK encodes these as integers scaled by ``10**18``."""
+        if "." in data:
+            return cls(data)
+        return cls.with_prec(data or 0, DEC_NUM_DIGITS)
+
     @classmethod
     def with_prec(cls, i: Union[int, str], prec: int) -> Dec:
         """Replicates Cosmos SDK's ``Dec.withPreic(i, prec)``.
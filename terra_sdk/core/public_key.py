@@ -11,6 +11,7 @@ from terra_proto.cosmos.crypto.ed25519 import PubKey as ValConsPubKey_pb
 from terra_proto.cosmos.crypto.multisig import LegacyAminoPubKey as LegacyAminoPubKey_pb
 from terra_proto.cosmos.crypto.secp256k1 import PubKey as SimplePubKey_pb
 
+from terra_sdk.key import secp256k1
 from terra_sdk.util.json import JSONSerializable
 
 from ..util.base import create_demux_unpack_any
@@ -32,14 +33,16 @@ __all__ = [
 
 
 def encode_uvarint(value: Union[int, str]) -> List[int]:
+    """Encodes an unsigned integer as a protobuf varint, like Go's ``binary.PutUvarint``."""
     val = int(str(value))
-    if val > 127:
-        raise ValueError(
-            "Encoding numbers > 127 is not supported here. Please tell those lazy CosmJS maintainers to "
-            "port the binary.PutUvarint implementation from the Go standard library and write some "
-            "tests."
-        )
-    return [val]
+    if val < 0:
+        raise ValueError("cannot encode a negative number as uvarint")
+    out = []
+    while val > 0x7F:
+        out.append((val & 0x7F) | 0x80)
+        val >>= 7
+    out.append(val)
+    return out
 
 
 def address_from_public_key(public_key: PublicKey) -> bytes:
@@ -197,6 +200,19 @@ class SimplePublicKey(PublicKey):
     def address(self) -> str:
         return get_bech("terra", self.raw_address().hex())
 
+    def verify(self, payload: bytes, signature: bytes) -> bool:
+        """Checks a signature of the data payload made with the private key of this
+        public key, as produced by :meth:`RawKey.sign()<terra_sdk.key.raw.RawKey.sign>`.
+
+        Args:
+            payload (bytes): signed data
+            signature (bytes): 64-byte signature
+
+        Returns:
+            bool: whether the signature is valid
+        """
+        return secp256k1.verify(bytes(self.key), payload, signature)
+
 
 @attr.s
 class ValConsPubKey(PublicKey):
@@ -312,8 +328,6 @@ class LegacyAminoMultisigPublicKey(PublicKey):
         )
 
     def encode_amino_pubkey(self) -> bytearray:
-        if self.threshold > 127:
-            raise ValueError("threshold over 127 is now supported here")
         out = bytearray.fromhex(BECH32_AMINO_PUBKEY_DATA_PREFIX_MULTISIG_THRESHOLD)
         out.append(0x08)
         out += bytearray(encode_uvarint(self.threshold))
@@ -68,8 +68,8 @@ class SignDoc(JSONSerializable):
 
     def to_proto(self) -> SignDoc_pb:
         return SignDoc_pb(
-            body_bytes=bytes(self.tx_body.to_proto()),
-            auth_info_bytes=bytes(self.auth_info.to_proto()),
+            body_bytes=self.tx_body.to_bytes(),
+            auth_info_bytes=self.auth_info.to_bytes(),
             chain_id=self.chain_id,
             account_number=self.account_number,
         )
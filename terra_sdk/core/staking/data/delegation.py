@@ -79,6 +79,17 @@ class Delegation(JSONSerializable):
             balance=self.balance.to_proto(),
         )
 
+    @classmethod
+    def from_proto(cls, proto: DelegationResponse_pb) -> Delegation:
+        return cls(
+            delegation=DelegationInfo(
+                delegator_address=proto.delegation.delegator_address,
+                validator_address=proto.delegation.validator_address,
+                shares=Dec.from_proto(proto.delegation.shares),
+            ),
+            balance=Coin.from_proto(proto.balance),
+        )
+
 
 @attr.s
 class UnbondingDelegationEntry(JSONSerializable):
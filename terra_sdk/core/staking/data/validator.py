@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import base64
 import copy
 from datetime import datetime
 from typing import Union
 
 import attr
 from dateutil import parser
+from terra_proto.cosmos.crypto.ed25519 import PubKey as ValConsPubKey_pb
 from terra_proto.cosmos.staking.v1beta1 import BondStatus
 from terra_proto.cosmos.staking.v1beta1 import Commission as Commission_pb
 from terra_proto.cosmos.staking.v1beta1 import CommissionRates as CommissionRates_pb
@@ -86,9 +88,9 @@ class CommissionRates(JSONSerializable):
     @classmethod
     def from_proto(cls, proto: CommissionRates_pb) -> CommissionRates:
         return cls(
-            rate=proto.rate,
-            max_rate=proto.max_rate,
-            max_change_rate=proto.max_change_rate,
+            rate=Dec.from_proto(proto.rate),
+            max_rate=Dec.from_proto(proto.max_rate),
+            max_change_rate=Dec.from_proto(proto.max_change_rate),
         )
 
 
@@ -127,6 +129,13 @@ class Commission(JSONSerializable):
             update_time=self.update_time,
         )
 
+    @classmethod
+    def from_proto(cls, proto: Commission_pb) -> Commission:
+        return cls(
+            commission_rates=CommissionRates.from_proto(proto.commission_rates),
+            update_time=to_isoformat(proto.update_time),
+        )
+
 
 @attr.s
 class Description(JSONSerializable):
@@ -294,3 +303,23 @@ class Validator(JSONSerializable):
             commission=self.commission.to_proto(),
             min_self_delegation=str(self.min_self_delegation),
         )
+
+    @classmethod
+    def from_proto(cls, proto: Validator_pb) -> Validator:
+        consensus_pubkey = ValConsPubKey_pb().parse(proto.consensus_pubkey.value)
+        return cls(
+            operator_address=proto.operator_address,
+            consensus_pubkey={
+                "@type": proto.consensus_pubkey.type_url,
+                "key": base64.b64encode(consensus_pubkey.key).decode(),
+            },
+            jailed=proto.jailed,
+            status=proto.status,
+            tokens=proto.tokens,
+            delegator_shares=Dec.from_proto(proto.delegator_shares),
+            description=Description.from_proto(proto.description),
+            unbonding_height=proto.unbonding_height,
+            unbonding_time=to_isoformat(proto.unbonding_time),
+            commission=Commission.from_proto(proto.commission),
+            min_self_delegation=proto.min_self_delegation,
+        )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import base64
 import json
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import attr
 from betterproto.lib.google.protobuf import Any
@@ -17,6 +17,7 @@ from terra_proto.cosmos.tx.v1beta1 import AuthInfo as AuthInfo_pb
 from terra_proto.cosmos.tx.v1beta1 import SignerInfo as SignerInfo_pb
 from terra_proto.cosmos.tx.v1beta1 import Tx as Tx_pb
 from terra_proto.cosmos.tx.v1beta1 import TxBody as TxBody_pb
+from terra_proto.cosmos.tx.v1beta1 import TxRaw as TxRaw_pb
 
 from terra_sdk.core.compact_bit_array import CompactBitArray
 from terra_sdk.core.fee import Fee
@@ -46,16 +47,37 @@ __all__ = [
 SignMode = SignMode_pb
 
 
+def _cached_bytes(obj, key: tuple, encode: Callable[[], bytes]) -> bytes:
+    # messages, signer infos and fees can be modified in place without their parent
+    # noticing, so only finalized objects reuse their bytes; the key still catches
+    # fields assigned or lists extended after finalizing
+    if not obj.__dict__.get("_finalized"):
+        return encode()
+    cached = obj.__dict__.get("_proto_bytes")
+    if cached is None or cached[0] != key:
+        cached = (key, encode())
+        obj.__dict__["_proto_bytes"] = cached
+    return cached[1]
+
+
+def _drop_cached_bytes(obj, attribute: attr.Attribute, value):
+    obj.__dict__.pop("_proto_bytes", None)
+    return value
+
+
 @attr.s
 class SignerData:
     sequence: int = attr.ib(converter=int)
     public_key: Optional[PublicKey] = attr.ib(default=None)
 
 
-@attr.s
+@attr.s(on_setattr=_drop_cached_bytes)
 class Tx(JSONSerializable):
     """Data structure for a transaction which can be broadcasted.
 
+    Once :meth:`finalize` is called, the protobuf bytes of a transaction are cached by
+    :meth:`to_bytes` until its body, auth info or signatures are replaced.
+
     Args:
         body (TxBody): the processable content of the transaction
         auth_info (AuthInfo): the authorization related content of the transaction
@@ -82,6 +104,44 @@ class Tx(JSONSerializable):
             signatures=self.signatures,
         )
 
+    def to_bytes(self) -> bytes:
+        """Serializes the transaction to protobuf bytes, as broadcast and hashed.
+
+        Returns:
+            bytes: protobuf bytes, reused while a finalized transaction is unchanged
+        """
+        body_bytes = self.body.to_bytes()
+        auth_info_bytes = self.auth_info.to_bytes()
+        signatures = tuple(self.signatures)
+        return _cached_bytes(
+            self,
+            (body_bytes, auth_info_bytes, signatures),
+            # TxRaw encodes the same bytes as Tx without encoding body and auth info again
+            lambda: bytes(
+                TxRaw_pb(
+                    body_bytes=body_bytes,
+                    auth_info_bytes=auth_info_bytes,
+                    signatures=list(signatures),
+                )
+            ),
+        )
+
+    def finalize(self) -> Tx:
+        """Marks the transaction, its body and its auth info as final, so that their
+        protobuf bytes are encoded once and reused by :meth:`to_bytes`, when signing,
+        broadcasting and hashing.
+
+        Assigning a field afterwards drops the cached bytes, but changes made in place
+        to its messages, signer infos or fee are not seen: replace them instead.
+
+        Returns:
+            Tx: this transaction
+        """
+        self.body.finalize()
+        self.auth_info.finalize()
+        self.__dict__["_finalized"] = True
+        return self
+
     @classmethod
     def from_data(cls, data: dict) -> Tx:
         return cls(
@@ -151,7 +211,7 @@ class Tx(JSONSerializable):
             )
 
 
-@attr.s
+@attr.s(on_setattr=_drop_cached_bytes)
 class TxBody(JSONSerializable):
     """Body of a transaction.
 
@@ -181,6 +241,28 @@ class TxBody(JSONSerializable):
             timeout_height=self.timeout_height,
         )
 
+    def to_bytes(self) -> bytes:
+        """Serializes the body to protobuf bytes.
+
+        Returns:
+            bytes: protobuf bytes, reused while a finalized body is unchanged
+        """
+        return _cached_bytes(
+            self,
+            (tuple(self.messages), self.memo, self.timeout_height),
+            lambda: bytes(self.to_proto()),
+        )
+
+    def finalize(self) -> TxBody:
+        """Marks the body as final, so that :meth:`to_bytes` reuses its bytes. See
+        :meth:`Tx.finalize`.
+
+        Returns:
+            TxBody: this body
+        """
+        self.__dict__["_finalized"] = True
+        return self
+
     @classmethod
     def from_data(cls, data: dict) -> TxBody:
         return cls(
@@ -198,7 +280,7 @@ class TxBody(JSONSerializable):
         )
 
 
-@attr.s
+@attr.s(on_setattr=_drop_cached_bytes)
 class AuthInfo(JSONSerializable):
     """AuthInfo
 
@@ -225,6 +307,28 @@ class AuthInfo(JSONSerializable):
             fee=self.fee.to_proto(),
         )
 
+    def to_bytes(self) -> bytes:
+        """Serializes the auth info to protobuf bytes.
+
+        Returns:
+            bytes: protobuf bytes, reused while a finalized auth info is unchanged
+        """
+        return _cached_bytes(
+            self,
+            (tuple(self.signer_infos), self.fee),
+            lambda: bytes(self.to_proto()),
+        )
+
+    def finalize(self) -> AuthInfo:
+        """Marks the auth info as final, so that :meth:`to_bytes` reuses its bytes. See
+        :meth:`Tx.finalize`.
+
+        Returns:
+            AuthInfo: this auth info
+        """
+        self.__dict__["_finalized"] = True
+        return self
+
     @classmethod
     def from_data(cls, data: dict) -> AuthInfo:
         return cls(
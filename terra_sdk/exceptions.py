@@ -13,3 +13,27 @@ class LCDResponseError(IOError):
         if self.message:
             message = " - " + self.message
         return f"Status {self.response.status}{message}"
+
+
+class LCDUnavailableError(IOError):
+    """Triggered when no LCD endpoint can take a request because all of them failed their
+    health check or have an open circuit breaker"""
+
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+class TxRejectedError(Exception):
+    """Triggered when a node rejects a transaction on broadcast, before it could be
+    included in a block"""
+
+    def __init__(self, result):
+        self.result = result
+
+    def __str__(self):
+        return (
+            f"Code {self.result.code} ({self.result.codespace}) - {self.result.raw_log}"
+        )
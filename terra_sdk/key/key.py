@@ -1,6 +1,7 @@
 import abc
-import copy
-from typing import Optional
+from concurrent.futures import Executor
+from functools import partial
+from typing import List, Optional, Union
 
 import attr
 
@@ -23,6 +24,7 @@ from terra_sdk.core.public_key import (
 from terra_sdk.core.signature_v2 import Descriptor
 from terra_sdk.core.signature_v2 import Single as SingleDescriptor
 from terra_sdk.core.tx import AuthInfo, SignerInfo, SignMode, Tx
+from terra_sdk.util.parallel import map_chunks
 
 __all__ = ["Key", "SignOptions"]
 
@@ -169,21 +171,16 @@ class Key:
                 "signature could not be created: Key instance missing public_key"
             )
 
-        # make backup
-        si_backup = copy.deepcopy(sign_doc.auth_info.signer_infos)
-        sign_doc.auth_info.signer_infos = [
-            SignerInfo(
-                public_key=self.public_key,
-                sequence=sign_doc.sequence,
-                mode_info=ModeInfo(
-                    single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)
-                ),
-            )
-        ]
-        signature = self.sign(sign_doc.to_bytes())
-
-        # restore
-        sign_doc.auth_info.signer_infos = si_backup
+        # sign a shallow copy carrying only this signer, leaving sign_doc untouched
+        signer_info = SignerInfo(
+            public_key=self.public_key,
+            sequence=sign_doc.sequence,
+            mode_info=ModeInfo(single=ModeInfoSingle(mode=SignMode.SIGN_MODE_DIRECT)),
+        )
+        auth_info = attr.evolve(sign_doc.auth_info)
+        auth_info.signer_infos = [signer_info]
+        signed_doc = attr.evolve(sign_doc, auth_info=auth_info)
+        signature = self.sign(signed_doc.to_bytes())
 
         return SignatureV2(
             public_key=self.public_key,
@@ -238,3 +235,50 @@ class Key:
             )
         )
         return signedTx
+
+    def sign_txs(
+        self,
+        txs: List[Tx],
+        options: Union[SignOptions, List[SignOptions]],
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Tx]:
+        """Signs many transactions at once in worker processes, e.g. to prepare
+        transactions that are broadcast later. The key is sent to the workers, so it
+        must be picklable, which :class:`RawKey<terra_sdk.key.raw.RawKey>` and
+        :class:`MnemonicKey<terra_sdk.key.mnemonic.MnemonicKey>` are.
+
+        Args:
+            txs (List[Tx]): unsigned transactions
+            options (Union[SignOptions, List[SignOptions]]): options for signing each
+                transaction, or options for the first one, the next ones being signed
+                with the following sequences
+            max_workers (int, optional): number of worker processes, by default the
+                number of CPUs. With 1, the transactions are signed in this process.
+            executor (Executor, optional): pool to sign in instead of a new process pool
+
+        Raises:
+            ValueError: if the number of options does not match the transactions
+
+        Returns:
+            List[Tx]: ready-to-broadcast transactions, in the order of ``txs``
+        """
+        if isinstance(options, SignOptions):
+            options = [
+                attr.evolve(options, sequence=options.sequence + i)
+                for i in range(len(txs))
+            ]
+        elif len(options) != len(txs):
+            raise ValueError("sign_txs needs one SignOptions per transaction")
+
+        return map_chunks(
+            partial(_sign_txs, self),
+            txs,
+            options,
+            max_workers=max_workers,
+            executor=executor,
+        )
+
+
+def _sign_txs(key: Key, txs: List[Tx], options: List[SignOptions]) -> List[Tx]:
+    return [key.sign_tx(tx, opt) for tx, opt in zip(txs, options)]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 from bip32utils import BIP32_HARDEN, BIP32Key
 from mnemonic import Mnemonic
 
@@ -22,6 +24,7 @@ class MnemonicKey(RawKey):
         account (int, optional): HD path parameter - account number.
         index (int, optional): HD path parameter - account index.
         coin_type (int, optional): HD path parameter - coin type.
+        backend (str, optional): name of the signing backend, see :class:`RawKey`.
     """
 
     mnemonic: str
@@ -53,6 +56,7 @@ class MnemonicKey(RawKey):
         account: int = 0,
         index: int = 0,
         coin_type: int = LUNA_COIN_TYPE,
+        backend: Optional[str] = None,
     ):
         if mnemonic is None:
             mnemonic = Mnemonic("english").generate(256)
@@ -67,7 +71,7 @@ class MnemonicKey(RawKey):
             .ChildKey(index)
         )
 
-        super().__init__(child.PrivateKey())
+        super().__init__(child.PrivateKey(), backend)
         self.mnemonic = mnemonic
         self.coin_type = coin_type
         self.account = account
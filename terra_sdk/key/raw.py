@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import hashlib
-
-from ecdsa import SECP256k1, SigningKey
-from ecdsa.util import sigencode_string_canonize
+from typing import Optional
 
 from .key import Key
+from .secp256k1 import Signer, load_signer
 
 __all__ = ["RawKey"]
 
@@ -13,37 +11,51 @@ from ..core import PublicKey, SimplePublicKey
 
 
 def compute_public_key(private_key: bytes) -> PublicKey:
-    return SimplePublicKey(
-        key=SigningKey.from_string(private_key, curve=SECP256k1)
-        .get_verifying_key()
-        .to_string("compressed")
-    )
+    return SimplePublicKey(key=load_signer(private_key).public_key)
 
 
 class RawKey(Key):
     """RawKey directly uses a raw (plaintext) private key in memory, and provides
     the implementation for signing with ECDSA on curve Secp256k1.
 
+    The private key is parsed once by a signing backend of
+    :mod:`terra_sdk.key.secp256k1`: ``coincurve`` (libsecp256k1) if it is installed,
+    otherwise the pure-Python ``ecdsa``. Both produce the same signatures.
+
     Args:
         private_key (bytes): private key in bytes
+        backend (str, optional): name of the signing backend, ``"coincurve"`` or
+            ``"ecdsa"``
     """
 
     private_key: bytes
     """Private key, in bytes."""
 
+    backend: Optional[str]
+    """Name of the signing backend, or ``None`` for the default one."""
+
     @classmethod
-    def from_hex(cls, private_key_hex: str) -> RawKey:
+    def from_hex(cls, private_key_hex: str, backend: Optional[str] = None) -> RawKey:
         """Create a new RawKey from a hex-encoded private key string.
 
         Args:
             private_key_hex (str): hex-encoded private key
+            backend (str, optional): name of the signing backend
         """
-        return cls(bytes.fromhex(private_key_hex))
+        return cls(bytes.fromhex(private_key_hex), backend)
 
-    def __init__(self, private_key: bytes):
-        public_key = compute_public_key(private_key)
-        super().__init__(public_key)
+    def __init__(self, private_key: bytes, backend: Optional[str] = None):
+        signer = load_signer(private_key, backend)
+        super().__init__(SimplePublicKey(key=signer.public_key))
         self.private_key = private_key
+        self.backend = backend
+        self._signer: Optional[Signer] = signer
+
+    def __getstate__(self) -> dict:
+        # parsed keys of native backends cannot be pickled; parse again after loading
+        state = self.__dict__.copy()
+        state["_signer"] = None
+        return state
 
     def sign(self, payload: bytes) -> bytes:
         """Signs the data payload using ECDSA and curve Secp256k1 with the private key as
@@ -52,9 +64,7 @@ class RawKey(Key):
         Args:
             payload (bytes): data to sign
         """
-        sk = SigningKey.from_string(self.private_key, curve=SECP256k1)
-        return sk.sign_deterministic(
-            payload,
-            hashfunc=hashlib.sha256,
-            sigencode=sigencode_string_canonize,
-        )
+        signer = self._signer
+        if signer is None or signer.private_key != self.private_key:
+            signer = self._signer = load_signer(self.private_key, self.backend)
+        return signer.sign(payload)
@@ -0,0 +1,212 @@
+"""Signing backends for ECDSA on curve Secp256k1."""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+from functools import lru_cache
+from typing import Dict, Optional, Type
+
+from ecdsa import SECP256k1, SigningKey, VerifyingKey
+from ecdsa.keys import BadSignatureError, MalformedPointError
+from ecdsa.util import sigencode_string_canonize
+
+try:
+    import coincurve
+except ImportError:  # pragma: no cover - optional dependency
+    coincurve = None
+
+__all__ = [
+    "is_canonical",
+    "Signer",
+    "EcdsaSigner",
+    "CoincurveSigner",
+    "BACKENDS",
+    "DEFAULT_BACKEND",
+    "load_signer",
+    "verify",
+]
+
+HALF_ORDER = SECP256k1.order // 2
+
+
+def is_canonical(signature: bytes) -> bool:
+    """Checks that a signature is 64 bytes ``r || s`` with ``s`` in its low form, the
+    only form accepted by Cosmos SDK chains."""
+    return (
+        len(signature) == 64 and 0 < int.from_bytes(signature[32:], "big") <= HALF_ORDER
+    )
+
+
+class Signer(abc.ABC):
+    """Signs payloads with one private key, keeping the parsed key between signatures.
+
+    Every backend produces the same deterministic (RFC 6979) signature over the SHA-256
+    digest of the payload, as 64 bytes ``r || s`` with ``s`` in its canonical low form.
+
+    Args:
+        private_key (bytes): private key in bytes
+    """
+
+    private_key: bytes
+    """Private key, in bytes."""
+
+    public_key: bytes
+    """Compressed public key, in bytes."""
+
+    def __init__(self, private_key: bytes):
+        self.private_key = private_key
+
+    @abc.abstractmethod
+    def sign(self, payload: bytes) -> bytes:
+        """Signs the data payload.
+
+        Args:
+            payload (bytes): data to sign
+
+        Returns:
+            bytes: canonical 64-byte signature
+        """
+
+    @classmethod
+    @abc.abstractmethod
+    def verify(cls, public_key: bytes, payload: bytes, signature: bytes) -> bool:
+        """Checks a canonical signature of the data payload.
+
+        Args:
+            public_key (bytes): compressed public key
+            payload (bytes): signed data
+            signature (bytes): 64-byte signature
+
+        Returns:
+            bool: whether the signature is valid
+        """
+
+
+class EcdsaSigner(Signer):
+    """Pure-Python backend on the ``ecdsa`` package. Parsing a private key computes its
+    public key, which costs about as much as a signature, so the parsed ``SigningKey`` is
+    kept. The multiples of the curve generator used to sign are precomputed by ``ecdsa``
+    once per process."""
+
+    def __init__(self, private_key: bytes):
+        super().__init__(private_key)
+        self._key = SigningKey.from_string(private_key, curve=SECP256k1)
+        self.public_key = self._key.get_verifying_key().to_string("compressed")
+
+    def sign(self, payload: bytes) -> bytes:
+        return self._key.sign_deterministic(
+            payload,
+            hashfunc=hashlib.sha256,
+            sigencode=sigencode_string_canonize,
+        )
+
+    @classmethod
+    def verify(cls, public_key: bytes, payload: bytes, signature: bytes) -> bool:
+        if not is_canonical(signature):
+            return False
+        try:
+            return _ecdsa_verifying_key(public_key).verify(
+                signature, payload, hashfunc=hashlib.sha256
+            )
+        except (BadSignatureError, MalformedPointError):
+            return False
+
+
+class CoincurveSigner(Signer):
+    """Backend on libsecp256k1 through the optional ``coincurve`` package, an order of
+    magnitude faster than :class:`EcdsaSigner`. Install it with
+    ``pip install coincurve``."""
+
+    def __init__(self, private_key: bytes):
+        if coincurve is None:
+            raise ImportError("the coincurve backend requires the coincurve package")
+        super().__init__(private_key)
+        self._key = coincurve.PrivateKey(private_key)
+        self.public_key = self._key.public_key.format(compressed=True)
+
+    def sign(self, payload: bytes) -> bytes:
+        # libsecp256k1 signs with RFC 6979 nonces and normalizes s, so dropping the
+        # recovery id leaves the same bytes as EcdsaSigner
+        return self._key.sign_recoverable(payload)[:64]
+
+    @classmethod
+    def verify(cls, public_key: bytes, payload: bytes, signature: bytes) -> bool:
+        if coincurve is None:
+            raise ImportError("the coincurve backend requires the coincurve package")
+        if not is_canonical(signature):
+            return False
+        try:
+            key = _coincurve_public_key(public_key)
+        except ValueError:
+            return False
+        der = coincurve.ecdsa.cdata_to_der(
+            coincurve.ecdsa.deserialize_compact(signature)
+        )
+        return key.verify(der, payload)
+
+
+# transactions of one account are usually verified together, so keep its parsed public
+# key around; decompressing it costs a square root modulo the field prime
+@lru_cache(maxsize=1024)
+def _ecdsa_verifying_key(public_key: bytes) -> VerifyingKey:
+    return VerifyingKey.from_string(public_key, curve=SECP256k1)
+
+
+@lru_cache(maxsize=1024)
+def _coincurve_public_key(public_key: bytes):
+    return coincurve.PublicKey(public_key)
+
+
+BACKENDS: Dict[str, Type[Signer]] = {
+    "coincurve": CoincurveSigner,
+    "ecdsa": EcdsaSigner,
+}
+"""Signing backends by name."""
+
+DEFAULT_BACKEND = "coincurve" if coincurve is not None else "ecdsa"
+"""Backend used when none is given: ``coincurve`` if it is installed, else ``ecdsa``."""
+
+
+def load_signer(private_key: bytes, backend: Optional[str] = None) -> Signer:
+    """Parses a private key for signing.
+
+    Args:
+        private_key (bytes): private key in bytes
+        backend (str, optional): name of a backend of :data:`BACKENDS`, by default
+            :data:`DEFAULT_BACKEND`
+
+    Raises:
+        ValueError: if the backend is unknown
+
+    Returns:
+        Signer: signer of the key
+    """
+    name = backend or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"unknown signing backend: {name}")
+    return BACKENDS[name](private_key)
+
+
+def verify(
+    public_key: bytes, payload: bytes, signature: bytes, backend: Optional[str] = None
+) -> bool:
+    """Checks a canonical signature of the data payload.
+
+    Args:
+        public_key (bytes): compressed public key
+        payload (bytes): signed data
+        signature (bytes): 64-byte signature
+        backend (str, optional): name of a backend of :data:`BACKENDS`, by default
+            :data:`DEFAULT_BACKEND`
+
+    Raises:
+        ValueError: if the backend is unknown
+
+    Returns:
+        bool: whether the signature is valid
+    """
+    name = backend or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"unknown signing backend: {name}")
+    return BACKENDS[name].verify(public_key, payload, signature)
@@ -0,0 +1,189 @@
+"""Verification of the signatures of received transactions."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Union
+
+from terra_proto.cosmos.crypto.multisig.v1beta1 import (
+    MultiSignature as MultiSignature_pb,
+)
+from terra_proto.cosmos.tx.v1beta1 import SignDoc as SignDoc_pb
+from terra_proto.cosmos.tx.v1beta1 import TxRaw as TxRaw_pb
+
+from terra_sdk.core import SignDoc
+from terra_sdk.core.mode_info import ModeInfo
+from terra_sdk.core.public_key import (
+    LegacyAminoMultisigPublicKey,
+    PublicKey,
+    SimplePublicKey,
+)
+from terra_sdk.core.tx import SignMode, Tx
+from terra_sdk.util.parallel import map_chunks
+
+__all__ = ["verify_tx", "verify_txs"]
+
+AccountNumbers = Union[int, List[int]]
+
+
+def verify_tx(
+    tx: Union[Tx, bytes], chain_id: str, account_numbers: AccountNumbers
+) -> bool:
+    """Checks every signature of a transaction against the public keys of its signer
+    infos, as the chain does before accepting it.
+
+    The signed bytes are rebuilt from the transaction: the protobuf ``SignDoc`` for
+    ``SIGN_MODE_DIRECT``, or the amino JSON sign doc for ``SIGN_MODE_LEGACY_AMINO_JSON``.
+    Multisig signatures are checked against each public key of the multisig and its
+    threshold.
+
+    Pass a received transaction as its ``TxRaw`` bytes: ``SIGN_MODE_DIRECT`` signatures
+    are then checked against the body and auth info bytes exactly as they were signed.
+    The body and auth info of a :class:`Tx` are encoded again, which only matches the
+    signed bytes if the signer encoded them the same way.
+
+    Args:
+        tx (Union[Tx, bytes]): signed transaction, or its protobuf bytes
+        chain_id (str): chain ID the transaction is meant for
+        account_numbers (Union[int, List[int]]): account number of each signer, in the
+            order of the signer infos, or the account number of the only signer
+
+    Returns:
+        bool: whether every signature is valid
+    """
+    if isinstance(tx, bytes):
+        raw = TxRaw_pb().parse(tx)
+        body_bytes, auth_info_bytes = raw.body_bytes, raw.auth_info_bytes
+        tx = Tx.from_bytes(tx)
+    else:
+        body_bytes, auth_info_bytes = tx.body.to_bytes(), tx.auth_info.to_bytes()
+
+    signer_infos = tx.auth_info.signer_infos
+    if isinstance(account_numbers, int):
+        account_numbers = [account_numbers] * len(signer_infos)
+    if not signer_infos or not (
+        len(signer_infos) == len(tx.signatures) == len(account_numbers)
+    ):
+        return False
+
+    for signer_info, signature, account_number in zip(
+        signer_infos, tx.signatures, account_numbers
+    ):
+        doc = SignDoc(
+            chain_id=chain_id,
+            account_number=account_number,
+            sequence=signer_info.sequence,
+            auth_info=tx.auth_info,
+            tx_body=tx.body,
+        )
+        if not _verify(
+            signer_info.public_key,
+            signer_info.mode_info,
+            signature,
+            partial(_sign_bytes, doc, body_bytes, auth_info_bytes, {}),
+        ):
+            return False
+    return True
+
+
+def verify_txs(
+    txs: List[Union[Tx, bytes]],
+    chain_id: str,
+    account_numbers: List[AccountNumbers],
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[bool]:
+    """Checks the signatures of many transactions in worker processes.
+
+    Args:
+        txs (List[Union[Tx, bytes]]): signed transactions, or their protobuf bytes, as
+            taken by :func:`verify_tx`
+        chain_id (str): chain ID the transactions are meant for
+        account_numbers (List[Union[int, List[int]]]): account numbers of the signers
+            of each transaction, as taken by :func:`verify_tx`
+        max_workers (int, optional): number of worker processes, by default the
+            number of CPUs. With 1, the transactions are checked in this process.
+        executor (Executor, optional): pool to check in instead of a new process pool
+
+    Raises:
+        ValueError: if the number of account numbers does not match the transactions
+
+    Returns:
+        List[bool]: whether every signature of each transaction is valid, in the order
+        of ``txs``
+    """
+    if len(account_numbers) != len(txs):
+        raise ValueError("verify_txs needs account numbers for every transaction")
+
+    return map_chunks(
+        partial(_verify_txs, chain_id),
+        txs,
+        account_numbers,
+        max_workers=max_workers,
+        executor=executor,
+    )
+
+
+def _verify_txs(
+    chain_id: str, txs: List[Union[Tx, bytes]], account_numbers: List[AccountNumbers]
+) -> List[bool]:
+    return [verify_tx(tx, chain_id, acc) for tx, acc in zip(txs, account_numbers)]
+
+
+def _sign_bytes(
+    doc: SignDoc,
+    body_bytes: bytes,
+    auth_info_bytes: bytes,
+    cache: Dict[SignMode, bytes],
+    mode: SignMode,
+) -> bytes:
+    # the signatures of a multisig usually share one sign mode, so build its bytes once
+    if mode not in cache:
+        if mode == SignMode.SIGN_MODE_DIRECT:
+            cache[mode] = bytes(
+                SignDoc_pb(
+                    body_bytes=body_bytes,
+                    auth_info_bytes=auth_info_bytes,
+                    chain_id=doc.chain_id,
+                    account_number=doc.account_number,
+                )
+            )
+        elif mode == SignMode.SIGN_MODE_LEGACY_AMINO_JSON:
+            cache[mode] = doc.to_amino_json()
+        else:
+            raise ValueError(f"unsupported sign mode: {mode}")
+    return cache[mode]
+
+
+def _verify(
+    public_key: PublicKey,
+    mode_info: ModeInfo,
+    signature: bytes,
+    sign_bytes: Callable[[SignMode], bytes],
+) -> bool:
+    try:
+        if mode_info.single is not None:
+            return isinstance(public_key, SimplePublicKey) and public_key.verify(
+                sign_bytes(mode_info.single.mode), signature
+            )
+
+        multi = mode_info.multi
+        if multi is None or not isinstance(public_key, LegacyAminoMultisigPublicKey):
+            return False
+        signatures = MultiSignature_pb().parse(signature).signatures
+        keys = public_key.public_keys
+        signed_keys = [keys[i] for i in multi.bitarray.true_indices() if i < len(keys)]
+        if not (
+            public_key.threshold
+            <= len(signed_keys)
+            == len(signatures)
+            == len(multi.mode_infos)
+        ):
+            return False
+        return all(
+            _verify(key, info, sig, sign_bytes)
+            for key, info, sig in zip(signed_keys, multi.mode_infos, signatures)
+        )
+    except ValueError:
+        return False
@@ -2,6 +2,11 @@ import base64
 import hashlib
 
 
+def hash_bytes(txbytes: bytes) -> str:
+    """Get the transaction hash from encoded Transaction bytes."""
+    return hashlib.sha256(txbytes).hexdigest()
+
+
 def hash_amino(txdata: str) -> str:
     """Get the transaction hash from Amino-encoded Transaction in base64."""
-    return hashlib.sha256(base64.b64decode(txdata)).digest().hex()
+    return hash_bytes(base64.b64decode(txdata))
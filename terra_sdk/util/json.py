@@ -1,4 +1,3 @@
-import copy
 import json
 from abc import ABC
 from datetime import datetime
@@ -50,7 +49,7 @@ def dict_to_data(d: dict) -> dict:
 class JSONSerializable(ABC):
     def to_data(self) -> Any:
         """Converts the object to its JSON-serializable Python data representation."""
-        return dict_to_data(copy.deepcopy(self.__dict__))
+        return dict_to_data(self.__dict__)
 
     def to_json(self) -> str:
         """Marshals the object into a stringified JSON serialization. Keys are first sorted
@@ -0,0 +1,50 @@
+from asyncio import AbstractEventLoop, new_event_loop, run_coroutine_threadsafe
+from threading import Lock, Thread, get_ident
+from typing import Any, Coroutine, Optional
+
+__all__ = ["LoopThread", "get_loop_thread"]
+
+
+class LoopThread:
+    """Runs an event loop forever in a daemon thread, so that synchronous code in any
+    thread can run coroutines on it concurrently."""
+
+    def __init__(self, name: str = "terra-sdk-loop"):
+        self.loop: AbstractEventLoop = new_event_loop()
+        self._thread = Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def in_loop_thread(self) -> bool:
+        """Checks whether the caller runs on the loop thread."""
+        return get_ident() == self._thread.ident
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """Runs a coroutine on the loop and blocks until it is done.
+
+        Called from the loop thread itself, e.g. by a synchronous API method that
+        another API method invokes, the coroutine is returned as is: blocking there
+        would deadlock, and the caller awaits it instead.
+
+        Args:
+            coroutine (Coroutine): coroutine to run
+
+        Returns:
+            Any: result of the coroutine
+        """
+        if self.in_loop_thread():
+            return coroutine
+        return run_coroutine_threadsafe(coroutine, self.loop).result()
+
+
+_loop_thread: Optional[LoopThread] = None
+_loop_thread_lock = Lock()
+
+
+def get_loop_thread() -> LoopThread:
+    """Gets the loop thread shared by the synchronous clients, starting it on first
+    use."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = LoopThread()
+        return _loop_thread
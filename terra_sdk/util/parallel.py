@@ -0,0 +1,47 @@
+import math
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+__all__ = ["map_chunks"]
+
+T = TypeVar("T")
+
+
+def map_chunks(
+    fn: Callable[..., List[T]],
+    *args: Sequence,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[T]:
+    """Splits equally long argument lists into chunks, calls ``fn`` on each chunk in
+    worker processes and joins the results.
+
+    Args:
+        fn (Callable[..., List[T]]): picklable function taking one chunk of each
+            argument list and returning one result per item
+        args (Sequence): argument lists
+        max_workers (int, optional): number of worker processes, by default the
+            number of CPUs. With 1, ``fn`` is called once in this process.
+        executor (Executor, optional): pool to run in instead of a new process pool
+
+    Returns:
+        List[T]: results of ``fn``, in the order of the arguments
+    """
+    count = len(args[0])
+    if executor is None and (max_workers == 1 or count < 2):
+        return fn(*args)
+
+    # a few chunks per worker, so that a slow worker does not hold up the others
+    workers = max_workers or os.cpu_count() or 1
+    size = math.ceil(count / (workers * 4))
+    bounds = [(start, start + size) for start in range(0, count, size)]
+    pool = executor or ProcessPoolExecutor(max_workers)
+    try:
+        chunks = pool.map(
+            fn, *([arg[start:stop] for start, stop in bounds] for arg in args)
+        )
+        return [result for chunk in chunks for result in chunk]
+    finally:
+        if executor is None:
+            pool.shutdown()
@@ -0,0 +1,166 @@
+import json
+from datetime import datetime, timezone
+
+from betterproto.lib.google.protobuf import Any as Any_pb
+from grpclib.testing import ChannelFor
+from terra_proto.cosmos.auth.v1beta1 import BaseAccount as BaseAccount_pb
+from terra_proto.cosmos.auth.v1beta1 import QueryAccountResponse
+from terra_proto.cosmos.auth.v1beta1 import QueryBase as AuthQueryBase
+from terra_proto.cosmos.bank.v1beta1 import QueryAllBalancesResponse
+from terra_proto.cosmos.bank.v1beta1 import QueryBase as BankQueryBase
+from terra_proto.cosmos.base.abci.v1beta1 import TxResponse
+from terra_proto.cosmos.base.query.v1beta1 import PageResponse
+from terra_proto.cosmos.base.v1beta1 import Coin as Coin_pb
+from terra_proto.cosmos.crypto.ed25519 import PubKey as Ed25519PubKey_pb
+from terra_proto.cosmos.staking import v1beta1 as staking_pb
+from terra_proto.cosmos.tx.v1beta1 import BroadcastMode, BroadcastTxResponse
+from terra_proto.cosmos.tx.v1beta1 import ServiceBase as TxServiceBase
+from terra_proto.cosmwasm.wasm import v1 as wasm_pb
+
+from terra_sdk.client.grpc import AsyncGrpcClient
+from terra_sdk.client.lcd import PaginationOptions
+from terra_sdk.core import Coins, Dec
+from terra_sdk.core.auth import BaseAccount
+from terra_sdk.core.tx import Tx
+
+ADDRESS = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+VALOPER = "terravaloper1x46rqay4d3cssq8gxxvqz8xt6nwlz4tdnsnsqy"
+
+
+class Auth(AuthQueryBase):
+    async def account(self, request):
+        account = BaseAccount_pb(address=request.address, account_number=7, sequence=3)
+        return QueryAccountResponse(
+            account=Any_pb(
+                type_url="/cosmos.auth.v1beta1.BaseAccount", value=bytes(account)
+            )
+        )
+
+
+class Bank(BankQueryBase):
+    async def all_balances(self, request):
+        assert request.pagination.limit == 1
+        return QueryAllBalancesResponse(
+            balances=[Coin_pb(denom="uluna", amount="1000")],
+            pagination=PageResponse(next_key=b"\x01", total=2),
+        )
+
+
+class Staking(staking_pb.QueryBase):
+    async def validator(self, request):
+        pubkey = Ed25519PubKey_pb(key=b"\x02" * 32)
+        time = datetime(2022, 5, 28, tzinfo=timezone.utc)
+        return staking_pb.QueryValidatorResponse(
+            validator=staking_pb.Validator(
+                operator_address=request.validator_addr,
+                consensus_pubkey=Any_pb(
+                    type_url="/cosmos.crypto.ed25519.PubKey", value=bytes(pubkey)
+                ),
+                status=3,
+                tokens="1000000",
+                delegator_shares="1000000000000000000000000",
+                description=staking_pb.Description(moniker="one"),
+                unbonding_time=time,
+                commission=staking_pb.Commission(
+                    commission_rates=staking_pb.CommissionRates(
+                        rate="100000000000000000",
+                        max_rate="200000000000000000",
+                        max_change_rate="10000000000000000",
+                    ),
+                    update_time=time,
+                ),
+                min_self_delegation="1",
+            )
+        )
+
+
+class Wasm(wasm_pb.QueryBase):
+    async def smart_contract_state(self, request):
+        query = json.loads(request.query_data)
+        return wasm_pb.QuerySmartContractStateResponse(data=json.dumps(query).encode())
+
+    async def contract_info(self, request):
+        return wasm_pb.QueryContractInfoResponse(
+            address=request.address,
+            contract_info=wasm_pb.ContractInfo(code_id=4, creator=ADDRESS, label="x"),
+        )
+
+    async def contract_history(self, request):
+        assert request.pagination.limit == 1
+        return wasm_pb.QueryContractHistoryResponse(
+            entries=[
+                wasm_pb.ContractCodeHistoryEntry(
+                    code_id=4, msg=json.dumps({"count": 0}).encode()
+                )
+            ]
+        )
+
+
+class TxService(TxServiceBase):
+    async def broadcast_tx(self, request):
+        assert request.mode == BroadcastMode.BROADCAST_MODE_SYNC
+        assert Tx.from_bytes(request.tx_bytes).body.memo == "hello"
+        return BroadcastTxResponse(
+            tx_response=TxResponse(txhash="ABCD", raw_log="[]", code=0)
+        )
+
+
+async def test_queries_return_core_objects():
+    async with ChannelFor([Auth(), Bank(), Staking(), Wasm()]) as channel:
+        terra = AsyncGrpcClient(chain_id="pisco-1", channel=channel)
+
+        account = await terra.auth.account_info(ADDRESS)
+        assert isinstance(account, BaseAccount)
+        assert (account.address, account.public_key) == (ADDRESS, None)
+        assert (account.account_number, account.sequence) == (7, 3)
+
+        balance, pagination = await terra.bank.balance(
+            ADDRESS, PaginationOptions(limit=1)
+        )
+        assert balance == Coins("1000uluna")
+        assert pagination == {"next_key": "AQ==", "total": "2"}
+
+        validator = await terra.staking.validator(VALOPER)
+        assert validator.operator_address == VALOPER
+        assert (
+            validator.consensus_pubkey["key"]
+            == "AgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgI="
+        )
+        assert validator.delegator_shares == Dec(1000000)
+        assert validator.commission.commission_rates.rate == Dec("0.1")
+        assert validator.description.moniker == "one"
+
+        assert await terra.wasm.contract_query(ADDRESS, {"config": {}}) == {
+            "config": {}
+        }
+        contract_info = await terra.wasm.contract_info(ADDRESS)
+        assert (contract_info["code_id"], contract_info["label"]) == (4, "x")
+        assert contract_info["init_msg"] == {"count": 0}
+
+
+async def test_broadcast_sync():
+    tx = Tx.from_data(
+        {
+            "body": {
+                "messages": [],
+                "memo": "hello",
+                "timeout_height": "0",
+                "extension_options": [],
+                "non_critical_extension_options": [],
+            },
+            "auth_info": {
+                "signer_infos": [],
+                "fee": {
+                    "amount": [],
+                    "gas_limit": "0",
+                    "payer": "",
+                    "granter": "",
+                },
+            },
+            "signatures": [],
+        }
+    )
+    async with ChannelFor([TxService()]) as channel:
+        terra = AsyncGrpcClient(channel=channel)
+        res = await terra.tx.broadcast_sync(tx)
+        assert res.txhash == "ABCD" and not res.is_tx_error()
@@ -1,5 +1,12 @@
-from terra_sdk.client.lcd import LCDClient
+import asyncio
+
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient, LCDClient
+from terra_sdk.client.lcd.api.tx import CreateTxOptions, SignerOptions
 from terra_sdk.client.lcd.params import PaginationOptions
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
 
 terra = LCDClient(
     url="https://pisco-lcd.terra.dev/",
@@ -44,3 +51,46 @@ def test_tx_infos_by_height():
 def test_tx_infos_by_height_with_height():
     result = terra.tx.tx_infos_by_height(1)
     assert result is not None
+
+
+async def test_estimate_fees_simulates_distinct_transactions_concurrently():
+    simulating = 0
+    most_simulating = 0
+
+    async def simulate(url, **kwargs):
+        nonlocal simulating, most_simulating
+        simulating += 1
+        most_simulating = max(most_simulating, simulating)
+        await asyncio.sleep(0.01)
+        simulating -= 1
+        return CallbackResult(
+            payload={"gas_info": {"gas_used": "100000"}, "result": {}}
+        )
+
+    sender = "terra1h8ljdmae7lx05kjj79c9ekscwsyjd3yr8wyvdn"
+    batch = [
+        (
+            [SignerOptions(address=sender, sequence=0)],
+            CreateTxOptions(
+                msgs=[MsgSend(sender, sender, Coins(uluna=i % 6 + 1))],
+                gas_prices="0.15uluna",
+                gas_adjustment=2,
+            ),
+        )
+        for i in range(12)
+    ]
+    client = AsyncLCDClient(url="https://lcd.test", chain_id="pisco-1")
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://lcd.test/cosmos/tx/v1beta1/simulate",
+            callback=simulate,
+            repeat=True,
+        )
+        fees = await client.tx.estimate_fees(batch, concurrency=4)
+        simulations = sum(len(calls) for calls in mocked.requests.values())
+
+    assert [fee.gas_limit for fee in fees] == [200000] * 12
+    assert len({id(fee) for fee in fees}) == 12
+    assert simulations == 6
+    assert most_simulating == 4
+    await client.close()
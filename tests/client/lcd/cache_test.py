@@ -0,0 +1,72 @@
+import time
+
+from aioresponses import aioresponses
+from multidict import CIMultiDict
+
+from terra_sdk.client.lcd import AsyncLCDClient, PaginationOptions
+from terra_sdk.client.lcd.cache import ResponseCache
+
+INFLATION = "https://a/cosmos/mint/v1beta1/inflation"
+
+
+def test_route_ttls():
+    cache = ResponseCache(
+        ttl=5,
+        route_ttls={
+            "/cosmos/*/params": None,
+            "/cosmwasm/wasm/v1/code/*": 3600,
+            "/cosmos/bank/*": 0,
+        },
+    )
+    assert cache.ttl_for("/cosmos/staking/v1beta1/params") is None
+    assert cache.ttl_for("/cosmwasm/wasm/v1/code/12") == 3600
+    assert cache.ttl_for("/cosmos/mint/v1beta1/inflation") == 5
+
+    key = cache.key("/cosmos/bank/v1beta1/balances/terra1", None)
+    cache.set(key, "/cosmos/bank/v1beta1/balances/terra1", {})
+    assert len(cache) == 0
+
+
+def test_params_are_normalized():
+    assert ResponseCache.key("/a", {"x": 1, "y": "2"}) == ResponseCache.key(
+        "/a", [("y", "2"), ("x", "1")]
+    )
+    assert ResponseCache.key("/a", CIMultiDict(events="b")) != ResponseCache.key(
+        "/a", None
+    )
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_size=2)
+    for path in ["/a", "/b"]:
+        cache.set(cache.key(path, None), path, path)
+    cache.get(cache.key("/a", None))
+    cache.set(cache.key("/c", None), "/c", "/c")
+
+    assert cache.get(cache.key("/b", None)) == (False, None)
+    assert cache.get(cache.key("/a", None)) == (True, "/a")
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_expiry():
+    cache = ResponseCache(route_ttls={"/short": 0.001})
+    cache.set(cache.key("/short", None), "/short", 1)
+    time.sleep(0.01)
+
+    assert cache.get(cache.key("/short", None)) == (False, None)
+    assert len(cache) == 0
+
+
+async def test_client_serves_repeated_queries_from_cache():
+    with aioresponses() as mocked:
+        mocked.get(INFLATION, payload={"inflation": "0.07"})
+        mocked.get(INFLATION + "?pagination.limit=1", payload={"inflation": "0.08"})
+        cache = ResponseCache()
+        terra = AsyncLCDClient(url="https://a", chain_id="pisco-1", cache=cache)
+
+        assert await terra.mint.inflation() == await terra.mint.inflation()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        await terra._get("/cosmos/mint/v1beta1/inflation", PaginationOptions(limit=1))
+        assert cache.misses == 2
+        await terra.close()
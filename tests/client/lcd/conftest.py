@@ -0,0 +1,92 @@
+import base64
+import json
+import re
+
+import pytest
+from aioresponses import CallbackResult
+
+from terra_sdk.core.tx import Tx
+from terra_sdk.util.hash import hash_amino
+
+MNEMONIC = (
+    "notice oak worry limit wrap speak medal online prefer cluster roof addict wrist "
+    "behave treat actual wasp year salad speed social layer crew genius"
+)
+LCD = "https://lcd.test"
+LATEST_BLOCK = f"{LCD}/cosmos/base/tendermint/v1beta1/blocks/latest"
+BLOCK = re.compile(rf"^{re.escape(LCD)}/cosmos/base/tendermint/v1beta1/blocks/\d+$")
+SEARCH = re.compile(rf"^{re.escape(LCD)}/cosmos/tx/v1beta1/txs\?.*$")
+
+
+class FakeChain:
+    """Blocks of a chain served by a mocked LCD node at ``url``. Every query of the
+    latest block produces the next block, holding the planned transactions of that
+    height and the base64 encoded transactions in ``mempool``."""
+
+    url = LCD
+    latest_block_url = LATEST_BLOCK
+    mnemonic = MNEMONIC
+
+    def __init__(self):
+        self.blocks = {}
+        self.height = 99
+        self.mempool = []
+        self.searched = []
+
+    def plan(self, blocks, start=100):
+        """Lays out the transactions of the blocks from ``start`` on."""
+        self.blocks.update({start + i: txs for i, txs in enumerate(blocks)})
+
+    def mock(self, mocked):
+        mocked.get(LATEST_BLOCK, callback=self.latest_block, repeat=True)
+        mocked.get(BLOCK, callback=self.block, repeat=True)
+        mocked.get(SEARCH, callback=self.search, repeat=True)
+
+    def latest_block(self, url, **kwargs):
+        self.height += 1
+        self.blocks[self.height] = self.blocks.get(self.height, []) + self.mempool
+        self.mempool = []
+        return self.block_at(self.height)
+
+    def block(self, url, **kwargs):
+        return self.block_at(int(url.path.rsplit("/", 1)[-1]))
+
+    def block_at(self, height):
+        return CallbackResult(
+            payload={
+                "block": {
+                    "header": {"height": str(height)},
+                    "data": {"txs": self.blocks.get(height, [])},
+                }
+            }
+        )
+
+    def search(self, url, **kwargs):
+        height = int(kwargs["params"]["events"][0].split("=")[1])
+        self.searched.append(height)
+        txs = [tx_response(height, tx_bytes) for tx_bytes in self.blocks[height]]
+        return CallbackResult(
+            payload={"tx_responses": txs, "pagination": {"total": str(len(txs))}}
+        )
+
+
+def tx_response(height, tx_bytes):
+    tx = Tx.from_bytes(base64.b64decode(tx_bytes)).to_data()
+    return {
+        "height": str(height),
+        "txhash": hash_amino(tx_bytes).upper(),
+        "raw_log": "[]",
+        "logs": [],
+        "gas_wanted": "100000",
+        "gas_used": "90000",
+        "tx": json.loads(
+            json.dumps(tx, default=lambda b: base64.b64encode(b).decode())
+        ),
+        "timestamp": "2022-06-01T00:00:00Z",
+        "code": 0,
+    }
+
+
+@pytest.fixture
+def fake_chain():
+    return FakeChain()
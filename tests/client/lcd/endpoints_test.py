@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient
+from terra_sdk.client.lcd.endpoints import EndpointPool, HedgeOptions
+from terra_sdk.exceptions import LCDResponseError
+
+SYNCING = "/cosmos/base/tendermint/v1beta1/syncing"
+NODE_INFO = "/cosmos/base/tendermint/v1beta1/node_info"
+
+
+def test_ranked_prefers_fastest_healthy_endpoint():
+    pool = EndpointPool(["https://a", "https://b", "https://c"])
+    a, b, c = pool.endpoints
+    pool.record_success(a, 0.3)
+    pool.record_success(b, 0.1)
+    pool.record_success(c, 0.05)
+    pool.record_failure(c)
+
+    assert pool.ranked() == [b, a, c]
+    assert pool.select() is b
+
+
+def test_latency_is_ewma():
+    pool = EndpointPool(["https://a"], ewma_alpha=0.5)
+    node = pool.select()
+    pool.record_success(node, 1.0)
+    pool.record_success(node, 0.0)
+    assert node.latency == 0.5
+
+
+async def test_fails_over_to_next_endpoint():
+    with aioresponses() as mocked:
+        mocked.get("https://a" + SYNCING, status=503, body="{}")
+        mocked.get("https://b" + SYNCING, payload={"syncing": False})
+        terra = AsyncLCDClient(url=["https://a", "https://b"], chain_id="pisco-1")
+
+        assert await terra.tendermint.syncing() is False
+        a, b = terra.endpoints.endpoints
+        assert not a.healthy and a.failures == 1
+        assert b.healthy and b.latency is not None
+        await terra.close()
+
+
+async def test_client_errors_do_not_fail_over():
+    with aioresponses() as mocked:
+        mocked.get("https://a" + SYNCING, status=404, body='{"message": "no"}')
+        terra = AsyncLCDClient(url=["https://a", "https://b"], chain_id="pisco-1")
+
+        with pytest.raises(LCDResponseError):
+            await terra.tendermint.syncing()
+        assert terra.endpoints.endpoints[0].healthy
+        await terra.close()
+
+
+async def test_health_checks():
+    with aioresponses() as mocked:
+        mocked.get("https://a" + SYNCING, payload={"syncing": True})
+        mocked.get("https://b" + SYNCING, payload={"syncing": False})
+        mocked.get("https://c" + SYNCING, payload={"syncing": False})
+        for url, network in [("a", "pisco-1"), ("b", "pisco-1"), ("c", "phoenix-1")]:
+            mocked.get(
+                f"https://{url}" + NODE_INFO,
+                payload={"default_node_info": {"network": network}},
+            )
+        terra = AsyncLCDClient(
+            url=["https://a", "https://b", "https://c"], chain_id="pisco-1"
+        )
+
+        await terra.check_endpoints()
+        a, b, c = terra.endpoints
+        assert [node.passed_health_check for node in terra.endpoints] == [
+            False,
+            True,
+            False,
+        ]
+        assert terra.endpoints.ranked() == [b]
+
+        # a request the node still answers does not undo its failed check
+        terra.endpoints.record_success(c, 0.01)
+        assert terra.endpoints.select() is b
+        await terra.close()
+
+
+async def test_malformed_health_check_fails_the_node():
+    with aioresponses() as mocked:
+        for url in ("a", "b"):
+            mocked.get(f"https://{url}" + SYNCING, payload={"syncing": False})
+        mocked.get("https://a" + NODE_INFO, payload={"node_info": {}})
+        mocked.get(
+            "https://b" + NODE_INFO,
+            payload={"default_node_info": {"network": "pisco-1"}},
+        )
+        terra = AsyncLCDClient(url=["https://a", "https://b"], chain_id="pisco-1")
+
+        await terra.check_endpoints()
+        assert [node.passed_health_check for node in terra.endpoints] == [False, True]
+        await terra.close()
+
+
+def test_hedge_delay_follows_observed_percentile():
+    pool = EndpointPool(["https://a"])
+    node = pool.select()
+    hedge = HedgeOptions(percentile=0.9, min_samples=10)
+    for latency in range(9):
+        pool.record_success(node, latency / 100)
+    assert hedge.delay_for(node) is None
+
+    pool.record_success(node, 0.09)
+    assert hedge.delay_for(node) == 0.09
+    assert HedgeOptions(delay=0.5).delay_for(node) == 0.5
+
+
+async def test_hedged_get_takes_fastest_answer():
+    async def slow(url, **kwargs):
+        await asyncio.sleep(1)
+        return CallbackResult(payload={"syncing": True})
+
+    with aioresponses() as mocked:
+        mocked.get("https://a" + SYNCING, callback=slow)
+        mocked.get("https://b" + SYNCING, payload={"syncing": False})
+        terra = AsyncLCDClient(
+            url=["https://a", "https://b"],
+            chain_id="pisco-1",
+            hedge=HedgeOptions(delay=0.05),
+        )
+
+        start = asyncio.get_event_loop().time()
+        assert await terra.tendermint.syncing() is False
+        assert asyncio.get_event_loop().time() - start < 0.5
+        await terra.close()
+
+
+async def test_posts_are_not_hedged():
+    async def slow(url, **kwargs):
+        await asyncio.sleep(0.2)
+        return CallbackResult(payload={"tx_response": {"txhash": "A"}})
+
+    with aioresponses() as mocked:
+        mocked.post("https://a/cosmos/tx/v1beta1/txs", callback=slow)
+        terra = AsyncLCDClient(
+            url=["https://a", "https://b"],
+            chain_id="pisco-1",
+            hedge=HedgeOptions(delay=0.01),
+        )
+
+        res = await terra._post("/cosmos/tx/v1beta1/txs", {"mode": "x"})
+        assert res["tx_response"]["txhash"] == "A"
+        await terra.close()
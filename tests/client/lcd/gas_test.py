@@ -0,0 +1,89 @@
+from aioresponses import aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient
+from terra_sdk.client.lcd.api.tx import CreateTxOptions
+from terra_sdk.client.lcd.gas import GasModel
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.wasm import MsgExecuteContract
+
+SENDER = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+CONTRACT = "terra1nc5tatafv6eyq7llkr2gv50ff9e22mnf70qgjlv737ktmt4eswrquka9l6"
+
+
+def execute(msg):
+    return MsgExecuteContract(SENDER, CONTRACT, msg)
+
+
+def test_groups_contract_executions_by_contract_and_action():
+    key = GasModel.key
+    assert key([execute({"swap": {"amount": "1"}})]) == key(
+        [execute('{"swap": {"amount": "2"}}')]
+    )
+    assert key([execute({"swap": {}})]) != key([execute({"provide_liquidity": {}})])
+    assert key([MsgSend(SENDER, CONTRACT, Coins(uluna=1))]) == (
+        "/cosmos.bank.v1beta1.MsgSend",
+    )
+
+
+def test_predicts_only_stable_groups():
+    model = GasModel(min_samples=3, max_deviation=0.05, margin=0.1)
+    swap = [execute({"swap": {}})]
+    claim = [execute({"claim": {}})]
+
+    for gas_used in (100000, 101000):
+        model.record(swap, gas_used)
+        model.record(claim, gas_used)
+    assert model.predict(swap) is None
+
+    model.record(swap, 99000)
+    model.record(claim, 300000)
+    assert model.predict(swap) == 111100
+    assert model.predict(claim) is None
+    assert (model.hits, model.misses) == (1, 2)
+
+    model.forget(swap)
+    assert model.predict(swap) is None
+
+
+def test_simulates_again_after_refresh_interval():
+    model = GasModel(min_samples=1, refresh_interval=2)
+    msgs = [execute({"swap": {}})]
+    model.record(msgs, 100000)
+
+    assert [model.predict(msgs) is None for _ in range(4)] == [
+        False,
+        False,
+        True,
+        False,
+    ]
+
+
+async def test_estimate_fee_skips_simulation_for_learned_transactions():
+    terra = AsyncLCDClient(
+        url="https://lcd.test",
+        chain_id="pisco-1",
+        gas_model=GasModel(min_samples=2),
+    )
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://lcd.test/cosmos/tx/v1beta1/simulate",
+            payload={"gas_info": {"gas_used": "100000"}, "result": {}},
+            repeat=True,
+        )
+        fees = [
+            await terra.tx.estimate_fee(
+                [],
+                CreateTxOptions(
+                    msgs=[execute({"swap": {"amount": str(i)}})],
+                    gas_prices="0.15uluna",
+                    gas_adjustment=2,
+                ),
+            )
+            for i in range(5)
+        ]
+        simulations = sum(len(calls) for calls in mocked.requests.values())
+
+    assert simulations == 2
+    assert [fee.gas_limit for fee in fees] == [200000] * 2 + [220000] * 3
+    await terra.close()
@@ -1,7 +1,15 @@
-import asynctest
-from aioresponses import aioresponses
+import asyncio
+import time
+from asyncio import run_coroutine_threadsafe
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
 
 from terra_sdk.client.lcd import AsyncLCDClient, LCDClient
+from terra_sdk.client.lcd.api.tx import CreateTxOptions
+from terra_sdk.client.lcd.cache import ResponseCache
+from terra_sdk.util.loop import get_loop_thread
 
 """
 class TestDoSessionGet(asynctest.TestCase):
@@ -36,3 +44,231 @@ class TestDoSessionGet(asynctest.TestCase):
 if __name__ == "__main__":
     asynctest.main()
 """
+
+
+SYNCING_URL = "https://lcd.test/cosmos/base/tendermint/v1beta1/syncing"
+
+
+def test_sync_client_reuses_session():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, payload={"syncing": False}, repeat=True)
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        assert terra.tendermint.syncing() is False
+        session = terra.session
+        assert terra.tendermint.syncing() is False
+        assert terra.session is session
+
+        terra.close()
+        assert session.closed
+
+
+def test_sync_client_context_manager():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, payload={"syncing": True}, repeat=True)
+        with LCDClient(url="https://lcd.test", chain_id="pisco-1") as terra:
+            assert terra.tendermint.syncing() is True
+        assert terra.session.closed
+
+        # a closed client transparently opens a new session
+        assert terra.tendermint.syncing() is True
+        assert not terra.session.closed
+        terra.close()
+
+
+def test_sync_client_closes_from_the_loop_thread():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, payload={"syncing": False}, repeat=True)
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+        assert terra.tendermint.syncing() is False
+        session = terra.session
+
+        async def close_on_loop():
+            # a synchronous call from a coroutine running on the loop thread
+            await terra.close()
+
+        loop = get_loop_thread().loop
+        run_coroutine_threadsafe(close_on_loop(), loop).result(timeout=1)
+        assert session.closed
+
+        # the session is closed even if the returned task is not awaited
+        assert terra.tendermint.syncing() is False
+        session = terra.session
+        loop.call_soon_threadsafe(terra.close)
+        run_coroutine_threadsafe(asyncio.sleep(0.01), loop).result(timeout=1)
+        assert session.closed
+
+
+def test_sync_client_runs_requests_from_threads_concurrently():
+    async def slow(url, **kwargs):
+        await asyncio.sleep(0.2)
+        return CallbackResult(payload={"syncing": False})
+
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, callback=slow, repeat=True)
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: terra.tendermint.syncing(), range(8)))
+        assert results == [False] * 8
+        assert time.monotonic() - start < 1
+        terra.close()
+
+
+def test_sync_client_nested_api_calls():
+    with aioresponses() as mocked:
+        mocked.post(
+            "https://lcd.test/cosmos/tx/v1beta1/simulate",
+            payload={"gas_info": {"gas_used": "100000"}, "result": {}},
+        )
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        # estimate_fee calls the synchronous estimate_gas from the event loop
+        fee = terra.tx.estimate_fee(
+            [], CreateTxOptions(msgs=[], gas_prices="0.15uluna", gas_adjustment=2)
+        )
+        assert fee.gas_limit == 200000
+        assert str(fee.amount) == "30000uluna"
+        terra.close()
+
+
+def test_sync_client_at_height():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, payload={"syncing": False}, repeat=True)
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+        pinned = terra.at_height(100)
+
+        assert pinned.tendermint.syncing() is False
+        assert pinned.session is terra.session
+        assert terra.height is None and pinned.tendermint._c is pinned
+        request = list(mocked.requests.values())[0][0]
+        assert request.kwargs["headers"] == {"x-cosmos-block-height": "100"}
+        terra.close()
+
+
+async def test_pinned_queries_send_height_and_are_cached_forever():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, payload={"syncing": False}, repeat=True)
+        cache = ResponseCache(route_ttls={"/cosmos/base/*": 0})
+        terra = AsyncLCDClient(url="https://lcd.test", chain_id="pisco-1", cache=cache)
+
+        await terra.tendermint.syncing()
+        assert len(cache) == 0 and terra.height is None
+        pinned = terra.at_height(100)
+        await pinned.tendermint.syncing()
+        await pinned.tendermint.syncing()
+        assert len(cache) == 1 and cache.hits == 1
+
+        latest, at_height = list(mocked.requests.values())[0]
+        assert latest.kwargs["headers"] is None
+        assert at_height.kwargs["headers"] == {"x-cosmos-block-height": "100"}
+        with pytest.raises(ValueError):
+            terra.at_height(0)
+        await terra.close()
+
+
+async def test_identical_queries_in_flight_are_coalesced():
+    async def slow(url, **kwargs):
+        await asyncio.sleep(0.05)
+        return CallbackResult(payload={"syncing": False})
+
+    with aioresponses() as mocked:
+        mocked.get(SYNCING_URL, callback=slow, repeat=True)
+        terra = AsyncLCDClient(
+            url="https://lcd.test", chain_id="pisco-1", coalesce=True
+        )
+
+        results = await asyncio.gather(*[terra.tendermint.syncing() for _ in range(50)])
+        assert results == [False] * 50
+        assert len(list(mocked.requests.values())[0]) == 1
+        assert terra._in_flight == {}
+
+        # a finished request is not reused
+        await terra.tendermint.syncing()
+        assert len(list(mocked.requests.values())[0]) == 2
+        await terra.close()
+
+
+CONTRACT = "terra1nc5tatafv6eyq7llkr2gv50ff9e22mnf70qgjlv737ktmt4eswrquka9l6"
+PROPOSAL = {
+    "proposal_id": "1",
+    "content": {
+        "@type": "/cosmos.gov.v1beta1.TextProposal",
+        "title": "title",
+        "description": "description",
+    },
+    "status": "PROPOSAL_STATUS_DEPOSIT_PERIOD",
+    "final_tally_result": {
+        "yes": "0",
+        "abstain": "0",
+        "no": "0",
+        "no_with_veto": "0",
+    },
+    "submit_time": "2022-06-01T00:00:00Z",
+    "deposit_end_time": "2022-06-03T00:00:00Z",
+    "total_deposit": [{"denom": "uluna", "amount": "10"}],
+    "voting_start_time": "0001-01-01T00:00:00Z",
+    "voting_end_time": "0001-01-01T00:00:00Z",
+}
+
+
+def test_sync_client_awaits_nested_contract_history():
+    with aioresponses() as mocked:
+        mocked.get(
+            f"https://lcd.test/cosmwasm/wasm/v1/contract/{CONTRACT}",
+            payload={
+                "address": CONTRACT,
+                "contract_info": {"code_id": "1", "creator": CONTRACT, "label": "l"},
+            },
+        )
+        mocked.get(
+            f"https://lcd.test/cosmwasm/wasm/v1/contract/{CONTRACT}/history",
+            payload={
+                "entries": [
+                    {
+                        "operation": "CONTRACT_CODE_HISTORY_OPERATION_TYPE_INIT",
+                        "code_id": "1",
+                        "updated": None,
+                        "msg": {"count": 0},
+                    }
+                ]
+            },
+        )
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        info = terra.wasm.contract_info(CONTRACT)
+        terra.close()
+
+    assert info["init_msg"] == {"count": 0}
+    assert info["code_id"] == 1
+
+
+@pytest.mark.parametrize(
+    "method, url, payload",
+    [
+        (
+            "deposits",
+            "https://lcd.test/cosmos/gov/v1beta1/proposals/1/deposits",
+            {"deposits": [{"proposal_id": "1", "depositor": CONTRACT, "amount": []}]},
+        ),
+        (
+            "votes",
+            "https://lcd.test/cosmos/gov/v1beta1/proposals/1/votes",
+            {"votes": [], "pagination": {"total": "0"}},
+        ),
+    ],
+)
+def test_sync_client_awaits_nested_proposal(method, url, payload):
+    with aioresponses() as mocked:
+        mocked.get(
+            "https://lcd.test/cosmos/gov/v1beta1/proposals/1",
+            payload={"proposal": PROPOSAL},
+        )
+        mocked.get(url, payload=payload)
+        terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        result = getattr(terra.gov, method)(1)
+        terra.close()
+
+    assert result
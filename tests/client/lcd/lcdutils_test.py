@@ -1,3 +1,7 @@
+import re
+
+from aioresponses import CallbackResult, aioresponses
+
 from terra_sdk.client.lcd import LCDClient
 
 terra = LCDClient(
@@ -10,3 +14,81 @@ def test_validators_with_voting_power():
     validators_with_voting_power = terra.utils.validators_with_voting_power()
     print(validators_with_voting_power)
     assert validators_with_voting_power is not None
+
+
+def validator(n):
+    return {
+        "operator_address": f"terravaloper{n}",
+        "consensus_pubkey": {
+            "@type": "/cosmos.crypto.ed25519.PubKey",
+            "key": f"key{n}",
+        },
+        "jailed": False,
+        "status": "BOND_STATUS_BONDED",
+        "tokens": "1",
+        "delegator_shares": "1",
+        "description": {"moniker": str(n)},
+        "unbonding_height": "0",
+        "unbonding_time": "1970-01-01T00:00:00Z",
+        "commission": {
+            "commission_rates": {
+                "rate": "0.1",
+                "max_rate": "0.2",
+                "max_change_rate": "0.01",
+            },
+            "update_time": "2022-05-28T00:00:00Z",
+        },
+        "min_self_delegation": "1",
+    }
+
+
+def delegate(n):
+    return {
+        "pub_key": {"key": f"key{n}"},
+        "voting_power": str(n),
+        "proposer_priority": "0",
+    }
+
+
+def test_voting_power_joins_all_pages_at_one_height():
+    validator_sets = re.compile(
+        r"https://lcd\.test/cosmos/base/tendermint/v1beta1/validatorsets/.*"
+    )
+    validators = re.compile(r"https://lcd\.test/cosmos/staking/v1beta1/validators.*")
+
+    def validator_set_page(url, **kwargs):
+        offset = int(url.query.get("pagination.offset", 0))
+        return CallbackResult(
+            payload={
+                "block_height": "100",
+                "validators": [delegate(offset), delegate(offset + 1)],
+                "pagination": {"next_key": "x" if offset == 0 else None, "total": "4"},
+            }
+        )
+
+    def validators_page(url, **kwargs):
+        assert kwargs["headers"] == {"x-cosmos-block-height": "100"}
+        offset = int(url.query.get("pagination.offset", 0))
+        return CallbackResult(
+            payload={
+                "validators": [validator(offset), validator(offset + 1)],
+                "pagination": {"next_key": "y" if offset < 4 else None, "total": "6"},
+            }
+        )
+
+    with aioresponses() as mocked:
+        mocked.get(validator_sets, callback=validator_set_page, repeat=True)
+        mocked.get(validators, callback=validators_page, repeat=True)
+        lcd = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        res = lcd.utils.validators_with_voting_power()
+        assert sorted(res) == [f"terravaloper{n}" for n in range(4)]
+        assert res["terravaloper3"]["voting_power"] == 3
+        assert [url.path for _, url in mocked.requests][0].endswith("/latest")
+
+        # a second call within the same block is served from the cache
+        calls = sum(len(c) for c in mocked.requests.values())
+        assert lcd.utils.validators_with_voting_power() is res
+        assert sum(len(c) for c in mocked.requests.values()) == calls + 1
+        assert lcd.utils.validators_with_voting_power(100) is res
+        lcd.close()
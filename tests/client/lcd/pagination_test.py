@@ -0,0 +1,104 @@
+import asyncio
+import re
+
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient, PaginationOptions
+from terra_sdk.client.lcd.pagination import fetch_all, paginate
+
+SIGNING_INFOS = "https://lcd.test/cosmos/slashing/v1beta1/signing_infos"
+
+
+def page(n, next_key):
+    return {
+        "info": [
+            {
+                "address": f"terravalcons{n}",
+                "start_height": "0",
+                "index_offset": "0",
+                "jailed_until": "1970-01-01T00:00:00Z",
+                "tombstoned": False,
+                "missed_blocks_counter": "0",
+            }
+        ],
+        "pagination": {"next_key": next_key, "total": "0"},
+    }
+
+
+async def test_paginate_follows_next_key():
+    with aioresponses() as mocked:
+        mocked.get(SIGNING_INFOS + "?pagination.limit=1", payload=page(0, "a"))
+        mocked.get(
+            SIGNING_INFOS + "?pagination.key=a&pagination.limit=1", payload=page(1, "b")
+        )
+        mocked.get(
+            SIGNING_INFOS + "?pagination.key=b&pagination.limit=1",
+            payload=page(2, None),
+        )
+        terra = AsyncLCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        infos = [
+            info["address"]
+            async for info in paginate(
+                terra.slashing.signing_infos, params=PaginationOptions(limit=1)
+            )
+        ]
+        assert infos == ["terravalcons0", "terravalcons1", "terravalcons2"]
+        await terra.close()
+
+
+async def test_paginate_prefetches_next_page():
+    requested = []
+
+    def respond(n, next_key):
+        async def callback(url, **kwargs):
+            requested.append(n)
+            return CallbackResult(payload=page(n, next_key))
+
+        return callback
+
+    with aioresponses() as mocked:
+        mocked.get(SIGNING_INFOS, callback=respond(0, "a"))
+        mocked.get(SIGNING_INFOS + "?pagination.key=a", callback=respond(1, None))
+        terra = AsyncLCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        pages = paginate(terra.slashing.signing_infos)
+        assert (await pages.__anext__())["address"] == "terravalcons0"
+        await asyncio.sleep(0.01)
+        assert requested == [0, 1]
+        await pages.aclose()
+        await terra.close()
+
+
+async def test_fetch_all_fetches_offset_windows_in_parallel():
+    requests = []
+
+    async def callback(url, **kwargs):
+        query = dict(url.query)
+        requests.append(query)
+        offset = int(query.get("pagination.offset", 0))
+        body = page(offset, "more" if offset + 2 < 5 else None)
+        body["info"] = body["info"] * min(2, 5 - offset)
+        body["pagination"]["total"] = "5" if "pagination.count_total" in query else "0"
+        await asyncio.sleep(0.01)
+        return CallbackResult(payload=body)
+
+    with aioresponses() as mocked:
+        mocked.get(
+            re.compile(re.escape(SIGNING_INFOS) + ".*"), callback=callback, repeat=True
+        )
+        terra = AsyncLCDClient(url="https://lcd.test", chain_id="pisco-1")
+
+        infos = await fetch_all(
+            terra.slashing.signing_infos, params=PaginationOptions(limit=2)
+        )
+        assert [info["address"] for info in infos] == [
+            "terravalcons0",
+            "terravalcons0",
+            "terravalcons2",
+            "terravalcons2",
+            "terravalcons4",
+        ]
+        assert requests[0]["pagination.count_total"] == "true"
+        assert sorted(r.get("pagination.offset") for r in requests[1:]) == ["2", "4"]
+        await terra.close()
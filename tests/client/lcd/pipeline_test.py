@@ -0,0 +1,186 @@
+import asyncio
+import base64
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient, TxPipeline
+from terra_sdk.client.lcd.api.tx import CreateTxOptions
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.tx import Tx, TxInfo
+from terra_sdk.exceptions import TxRejectedError
+from terra_sdk.key.mnemonic import MnemonicKey
+from terra_sdk.util.hash import hash_amino
+
+SIMULATE = "/cosmos/tx/v1beta1/simulate"
+BROADCAST = "/cosmos/tx/v1beta1/txs"
+
+
+class FakeNode:
+    """Accepts transactions in sequence order and puts them in the mempool of
+    ``chain``."""
+
+    def __init__(self, key, chain, sequence=10, reject=(), include=True):
+        self.key = key
+        self.chain = chain
+        self.sequence = sequence
+        self.reject = reject
+        self.include = include
+        self.broadcast_sequences = []
+        self.simulated_sequences = []
+
+    def mock(self, mocked):
+        url = self.chain.url
+        mocked.get(
+            f"{url}/cosmos/auth/v1beta1/accounts/{self.key.acc_address}",
+            payload={
+                "account": {
+                    "@type": "/cosmos.auth.v1beta1.BaseAccount",
+                    "address": self.key.acc_address,
+                    "pub_key": None,
+                    "account_number": "5",
+                    "sequence": str(self.sequence),
+                }
+            },
+            repeat=True,
+        )
+        mocked.post(url + SIMULATE, callback=self.simulate, repeat=True)
+        mocked.post(url + BROADCAST, callback=self.broadcast, repeat=True)
+        self.chain.mock(mocked)
+
+    def simulate(self, url, **kwargs):
+        tx = Tx.from_bytes(base64.b64decode(kwargs["json"]["tx_bytes"]))
+        self.simulated_sequences.append(tx.auth_info.signer_infos[0].sequence)
+        return CallbackResult(
+            payload={"gas_info": {"gas_used": "100000"}, "result": {}}
+        )
+
+    def broadcast(self, url, **kwargs):
+        tx_bytes = kwargs["json"]["tx_bytes"]
+        tx = Tx.from_bytes(base64.b64decode(tx_bytes))
+        sequence = tx.auth_info.signer_infos[0].sequence
+        self.broadcast_sequences.append(sequence)
+        txhash = hash_amino(tx_bytes).upper()
+        if sequence != self.sequence:
+            return CallbackResult(
+                payload={
+                    "tx_response": {
+                        "txhash": txhash,
+                        "code": 32,
+                        "codespace": "sdk",
+                        "raw_log": f"account sequence mismatch, expected {self.sequence}, "
+                        f"got {sequence}: incorrect account sequence",
+                    }
+                }
+            )
+        if tx.body.memo in self.reject:
+            return CallbackResult(
+                payload={
+                    "tx_response": {
+                        "txhash": txhash,
+                        "code": 13,
+                        "codespace": "sdk",
+                        "raw_log": "insufficient fee",
+                    }
+                }
+            )
+        self.sequence += 1
+        if self.include:
+            self.chain.mempool.append(tx_bytes)
+        return CallbackResult(
+            payload={"tx_response": {"txhash": txhash, "code": 0, "raw_log": "[]"}}
+        )
+
+
+def send(key):
+    return MsgSend(key.acc_address, key.acc_address, Coins(uluna=1))
+
+
+async def test_pipeline_broadcasts_in_sequence_and_tracks_inclusion(fake_chain):
+    key = MnemonicKey(mnemonic=fake_chain.mnemonic)
+    node = FakeNode(key, fake_chain)
+    terra = AsyncLCDClient(
+        url=fake_chain.url, chain_id="pisco-1", gas_prices="0.15uluna"
+    )
+    wallet = terra.wallet(key, manage_sequence=True)
+
+    with aioresponses() as mocked:
+        node.mock(mocked)
+        # another process sent a transaction in the meantime
+        wallet.sequence_manager.sync(5, 9)
+
+        async with TxPipeline(wallet, poll_interval=0.01) as pipeline:
+            futures = await pipeline.feed([send(key)] for _ in range(4))
+        infos = await asyncio.gather(*futures)
+
+    assert all(isinstance(info, TxInfo) for info in infos)
+    assert len({info.txhash for info in infos}) == 4
+    assert node.broadcast_sequences == [9, 10, 11, 12, 13]
+    assert set(node.simulated_sequences) <= {9, 10, 11, 12, 13}
+    assert pipeline.pending == []
+    await terra.close()
+
+
+async def test_pipeline_reports_rejected_and_unconfirmed_transactions(fake_chain):
+    key = MnemonicKey(mnemonic=fake_chain.mnemonic)
+    node = FakeNode(key, fake_chain, reject={"rejected"}, include=False)
+    terra = AsyncLCDClient(
+        url=fake_chain.url, chain_id="pisco-1", gas_prices="0.15uluna"
+    )
+    wallet = terra.wallet(key, manage_sequence=True)
+
+    with aioresponses() as mocked:
+        node.mock(mocked)
+
+        pipeline = TxPipeline(wallet, poll_interval=0.01, confirm_timeout=0.05)
+        rejected = await pipeline.submit(
+            CreateTxOptions(msgs=[send(key)], memo="rejected")
+        )
+        unconfirmed = await pipeline.submit([send(key)])
+        await pipeline.join()
+        await pipeline.close()
+
+    with pytest.raises(TxRejectedError):
+        rejected.result()
+    with pytest.raises(asyncio.TimeoutError):
+        unconfirmed.result()
+    # the rejected transaction did not use up its sequence
+    assert node.broadcast_sequences == [10, 10]
+    await terra.close()
+
+
+async def test_pipeline_drains_transactions_not_broadcast_yet(fake_chain):
+    key = MnemonicKey(mnemonic=fake_chain.mnemonic)
+    terra = AsyncLCDClient(
+        url=fake_chain.url, chain_id="pisco-1", gas_prices="0.15uluna"
+    )
+    wallet = terra.wallet(key, manage_sequence=True)
+    wallet.sequence_manager.sync(5, 10)
+    simulating = asyncio.Event()
+
+    async def simulate(url, **kwargs):
+        simulating.set()
+        await asyncio.Event().wait()
+
+    with aioresponses() as mocked:
+        mocked.post(fake_chain.url + SIMULATE, callback=simulate, repeat=True)
+        pipeline = TxPipeline(wallet, concurrency=1)
+        futures = await pipeline.feed([send(key)] for _ in range(3))
+        await simulating.wait()
+
+        assert pipeline.drain() == futures[1:]
+        await asyncio.sleep(0)
+        assert all(future.cancelled() for future in futures[1:])
+        assert not futures[0].done()
+        assert pipeline.drain() == []
+        await pipeline.close()
+
+    await terra.close()
+
+
+async def test_pipeline_needs_managed_sequence(fake_chain):
+    terra = AsyncLCDClient(url=fake_chain.url, chain_id="pisco-1")
+    with pytest.raises(ValueError):
+        TxPipeline(terra.wallet(MnemonicKey(mnemonic=fake_chain.mnemonic)))
+    await terra.close()
@@ -0,0 +1,66 @@
+import asyncio
+
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient
+from terra_sdk.client.lcd.ratelimit import RateLimiter, TokenBucket
+
+SYNCING = "/cosmos/base/tendermint/v1beta1/syncing"
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert 0.09 < bucket.reserve() <= 0.1
+    assert 0.19 < bucket.reserve() <= 0.2
+
+
+async def test_max_in_flight():
+    in_flight = 0
+    peak = 0
+
+    async def slow(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return CallbackResult(payload={"syncing": False})
+
+    with aioresponses() as mocked:
+        mocked.get("https://a" + SYNCING, callback=slow, repeat=True)
+        terra = AsyncLCDClient(
+            url="https://a",
+            chain_id="pisco-1",
+            rate_limit=RateLimiter(max_in_flight=3),
+        )
+
+        await asyncio.gather(*[terra.tendermint.syncing() for _ in range(12)])
+        assert peak == 3
+        await terra.close()
+
+
+async def test_max_in_flight_is_per_endpoint():
+    limiter = RateLimiter(max_in_flight=1)
+    a, b = limiter.semaphore("https://a"), limiter.semaphore("https://b")
+    assert a is not b
+
+    async with limiter.limit("https://a"):
+        assert a.locked()
+        assert not b.locked()
+        async with limiter.limit("https://b"):
+            assert b.locked()
+
+
+async def test_requests_per_second_is_per_endpoint():
+    limiter = RateLimiter(requests_per_second=20, burst=1)
+    with aioresponses() as mocked:
+        mocked.get("https://a" + SYNCING, payload={"syncing": False}, repeat=True)
+        terra = AsyncLCDClient(url="https://a", chain_id="pisco-1", rate_limit=limiter)
+
+        start = asyncio.get_event_loop().time()
+        await asyncio.gather(*[terra.tendermint.syncing() for _ in range(5)])
+        assert asyncio.get_event_loop().time() - start >= 0.19
+        assert limiter.bucket("https://a") is not limiter.bucket("https://b")
+        await terra.close()
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient
+from terra_sdk.client.lcd.endpoints import EndpointPool
+from terra_sdk.client.lcd.retry import RetryPolicy
+from terra_sdk.exceptions import LCDResponseError, LCDUnavailableError
+
+SYNCING = "https://a/cosmos/base/tendermint/v1beta1/syncing"
+BROADCAST = "https://a/cosmos/tx/v1beta1/txs"
+
+
+def test_backoff_is_jittered_and_bounded():
+    policy = RetryPolicy(backoff_base=1, backoff_max=4)
+    for attempt in range(1, 10):
+        delay = policy.backoff(attempt)
+        assert 0 <= delay <= min(4, 2 ** (attempt - 1))
+
+
+async def test_queries_are_retried():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING, status=503, body="{}")
+        mocked.get(SYNCING, status=502, body="{}")
+        mocked.get(SYNCING, payload={"syncing": False})
+        terra = AsyncLCDClient(
+            url="https://a",
+            chain_id="pisco-1",
+            retry_policy=RetryPolicy(max_attempts=3, backoff_base=0.001),
+        )
+
+        assert await terra.tendermint.syncing() is False
+        await terra.close()
+
+
+async def test_queries_give_up_after_max_attempts():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING, status=503, body="{}", repeat=True)
+        terra = AsyncLCDClient(
+            url="https://a",
+            chain_id="pisco-1",
+            retry_policy=RetryPolicy(max_attempts=2, backoff_base=0.001),
+        )
+
+        with pytest.raises(LCDResponseError):
+            await terra.tendermint.syncing()
+        assert len(list(mocked.requests.values())[0]) == 2
+        await terra.close()
+
+
+async def test_broadcasts_are_not_retried_on_server_errors():
+    with aioresponses() as mocked:
+        mocked.post(BROADCAST, status=503, body='{"message": "down"}')
+        mocked.post(BROADCAST, payload={"tx_response": {}})
+        terra = AsyncLCDClient(
+            url="https://a",
+            chain_id="pisco-1",
+            retry_policy=RetryPolicy(max_broadcast_attempts=3, backoff_base=0.001),
+        )
+
+        with pytest.raises(LCDResponseError):
+            await terra._post("/cosmos/tx/v1beta1/txs", {"mode": "x"})
+        await terra.close()
+
+
+async def test_broadcasts_are_retried_when_throttled():
+    with aioresponses() as mocked:
+        mocked.post(BROADCAST, status=429, body='{"message": "slow down"}')
+        mocked.post(BROADCAST, payload={"tx_response": {"txhash": "A"}})
+        terra = AsyncLCDClient(
+            url="https://a",
+            chain_id="pisco-1",
+            retry_policy=RetryPolicy(max_broadcast_attempts=2, backoff_base=0.001),
+        )
+
+        res = await terra._post("/cosmos/tx/v1beta1/txs", {"mode": "x"})
+        assert res["tx_response"]["txhash"] == "A"
+        await terra.close()
+
+
+async def test_circuit_breaker_opens_after_consecutive_failures():
+    with aioresponses() as mocked:
+        mocked.get(SYNCING, status=500, body="{}", repeat=True)
+        terra = AsyncLCDClient(
+            url=EndpointPool(["https://a"], failure_threshold=2, cooldown=60),
+            chain_id="pisco-1",
+        )
+
+        for _ in range(2):
+            with pytest.raises(LCDResponseError):
+                await terra.tendermint.syncing()
+        assert terra.endpoints.endpoints[0].circuit_open
+
+        with pytest.raises(LCDUnavailableError):
+            await terra.tendermint.syncing()
+        assert len(list(mocked.requests.values())[0]) == 2
+
+        # after the cooldown a trial request is let through
+        terra.endpoints.endpoints[0].open_until = 0
+        with pytest.raises(LCDResponseError):
+            await terra.tendermint.syncing()
+        assert terra.endpoints.endpoints[0].circuit_open
+        await terra.close()
+
+
+async def test_half_open_circuit_lets_one_trial_through():
+    with aioresponses() as mocked:
+        calls = []
+
+        async def slow(url, **kwargs):
+            calls.append(url)
+            await asyncio.sleep(0.05)
+            return CallbackResult(payload={"syncing": False})
+
+        mocked.get(SYNCING, callback=slow, repeat=True)
+        terra = AsyncLCDClient(
+            url=EndpointPool(["https://a"], failure_threshold=2, cooldown=60),
+            chain_id="pisco-1",
+        )
+        node = terra.endpoints.endpoints[0]
+        node.failures, node.open_until = 2, 0
+
+        results = await asyncio.gather(
+            *(terra.tendermint.syncing() for _ in range(5)), return_exceptions=True
+        )
+        assert len(calls) == 1
+        assert results.count(False) == 1
+        assert all(
+            isinstance(r, LCDUnavailableError) for r in results if r is not False
+        )
+
+        # the trial succeeded and closed the circuit
+        assert not node.circuit_open
+        await terra.close()
@@ -0,0 +1,132 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aioresponses import aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient
+from terra_sdk.client.lcd.api.tx import CreateTxOptions
+from terra_sdk.client.lcd.sequence import SequenceManager, is_sequence_mismatch
+from terra_sdk.core import Coins
+from terra_sdk.core.broadcast import SyncTxBroadcastResult
+from terra_sdk.core.fee import Fee
+from terra_sdk.key.mnemonic import MnemonicKey
+
+MNEMONIC = (
+    "notice oak worry limit wrap speak medal online prefer cluster roof addict wrist "
+    "behave treat actual wasp year salad speed social layer crew genius"
+)
+
+MISMATCH = SyncTxBroadcastResult(
+    txhash="AB",
+    raw_log="account sequence mismatch, expected 12, got 10: incorrect account sequence",
+    code=32,
+    codespace="sdk",
+)
+
+
+def test_hands_out_consecutive_sequences_across_threads():
+    manager = SequenceManager()
+    assert manager.take() is None
+
+    manager.sync(5, 100)
+    manager.sync(6, 0)  # a slower concurrent sync does not override
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reserved = list(pool.map(lambda _: manager.take(), range(200)))
+
+    assert {account_number for account_number, _ in reserved} == {5}
+    assert sorted(sequence for _, sequence in reserved) == list(range(100, 300))
+
+
+def test_resyncs_on_rejected_broadcast():
+    manager = SequenceManager()
+    manager.sync(5, 10)
+    manager.take()
+
+    assert is_sequence_mismatch(MISMATCH)
+    assert manager.observe(MISMATCH)
+    assert manager.take() == (5, 12)
+
+    accepted = SyncTxBroadcastResult(txhash="CD", raw_log="[]", code=0)
+    assert not is_sequence_mismatch(accepted)
+    assert not manager.observe(accepted)
+    assert manager.take() == (5, 13)
+
+    # other check failures keep the local sequence, giving back the unused one
+    # when no later sequence was handed out
+    rejected = SyncTxBroadcastResult(txhash="EF", raw_log="insufficient fee", code=13)
+    assert not manager.observe(rejected, 13)
+    assert manager.take() == (5, 13)
+    manager.take()
+    assert not manager.observe(rejected, 13)
+    assert manager.take() == (5, 15)
+    assert not manager.observe(rejected)
+    assert manager.synced
+
+    # a mismatch error that does not tell the expected sequence fetches it again
+    assert manager.observe(
+        SyncTxBroadcastResult(txhash="EF", raw_log="[]", code=32, codespace="sdk")
+    )
+    assert not manager.synced
+    assert manager.account_number == 5
+
+
+def test_release_gives_back_only_the_last_sequence():
+    manager = SequenceManager()
+    manager.sync(5, 10)
+    _, first = manager.take()
+    _, second = manager.take()
+
+    manager.release(second)
+    assert manager.take() == (5, second)
+    manager.release(first)
+    assert not manager.synced
+
+
+@pytest.mark.asyncio
+async def test_wallet_signs_back_to_back_with_one_account_query():
+    key = MnemonicKey(mnemonic=MNEMONIC)
+    terra = AsyncLCDClient(url="https://lcd.test", chain_id="pisco-1")
+    wallet = terra.wallet(key, manage_sequence=True)
+    account_url = f"https://lcd.test/cosmos/auth/v1beta1/accounts/{key.acc_address}"
+    broadcast_url = "https://lcd.test/cosmos/tx/v1beta1/txs"
+
+    with aioresponses() as mocked:
+        mocked.get(
+            account_url,
+            payload={
+                "account": {
+                    "@type": "/cosmos.auth.v1beta1.BaseAccount",
+                    "address": key.acc_address,
+                    "pub_key": None,
+                    "account_number": "5",
+                    "sequence": "10",
+                }
+            },
+        )
+        mocked.post(
+            broadcast_url,
+            payload={
+                "tx_response": {
+                    "txhash": MISMATCH.txhash,
+                    "raw_log": MISMATCH.raw_log,
+                    "code": MISMATCH.code,
+                    "codespace": MISMATCH.codespace,
+                }
+            },
+        )
+
+        options = CreateTxOptions(msgs=[], fee=Fee(200000, Coins("30000uluna")))
+
+        txs = [await wallet.create_and_sign_tx(options) for _ in range(3)]
+        assert [tx.auth_info.signer_infos[0].sequence for tx in txs] == [10, 11, 12]
+        assert options.sequence is None and options.account_number is None
+
+        res = await wallet.broadcast_sync(txs[0])
+        assert res.code == 32
+        resigned = await wallet.create_and_sign_tx(options)
+        assert resigned.auth_info.signer_infos[0].sequence == 12
+
+        requests = [key for key in mocked.requests if key[0] == "GET"]
+        assert len(mocked.requests[requests[0]]) == 1
+
+    await terra.close()
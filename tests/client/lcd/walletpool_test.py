@@ -0,0 +1,190 @@
+import asyncio
+import base64
+import re
+from collections import defaultdict
+
+import pytest
+from aioresponses import CallbackResult, aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient, WalletPool
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.tx import Tx
+from terra_sdk.util.hash import hash_amino
+
+GRANTER = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+ACCOUNT = re.compile(r"^.*/cosmos/auth/v1beta1/accounts/\w+$")
+SIMULATE = "/cosmos/tx/v1beta1/simulate"
+BROADCAST = "/cosmos/tx/v1beta1/txs"
+
+
+class FakeNode:
+    """Keeps a sequence per account and puts accepted transactions in the mempool of
+    ``chain``, except those of ``dropped`` accounts. The node never answers the
+    broadcasts of ``held`` accounts after their first one."""
+
+    def __init__(self, chain, dropped=(), held=()):
+        self.chain = chain
+        self.sequences = defaultdict(int)
+        self.dropped = dropped
+        self.held = held
+        self.sent = []
+
+    def mock(self, mocked):
+        mocked.get(ACCOUNT, callback=self.account, repeat=True)
+        mocked.post(
+            self.chain.url + SIMULATE,
+            payload={"gas_info": {"gas_used": "100000"}, "result": {}},
+            repeat=True,
+        )
+        mocked.post(self.chain.url + BROADCAST, callback=self.broadcast, repeat=True)
+        self.chain.mock(mocked)
+
+    def account(self, url, **kwargs):
+        address = url.path.rsplit("/", 1)[-1]
+        return CallbackResult(
+            payload={
+                "account": {
+                    "@type": "/cosmos.auth.v1beta1.BaseAccount",
+                    "address": address,
+                    "pub_key": None,
+                    "account_number": "1",
+                    "sequence": str(self.sequences[address]),
+                }
+            }
+        )
+
+    async def broadcast(self, url, **kwargs):
+        tx_bytes = kwargs["json"]["tx_bytes"]
+        tx = Tx.from_bytes(base64.b64decode(tx_bytes))
+        sender = tx.body.messages[0].from_address
+        sequence = tx.auth_info.signer_infos[0].sequence
+        if sender in self.held and self.sequences[sender] > 0:
+            await asyncio.Event().wait()
+        if sequence != self.sequences[sender]:
+            raise AssertionError("transactions are broadcast in sequence order")
+        self.sequences[sender] += 1
+        self.sent.append((sender, sequence, tx.auth_info.fee.granter))
+        if sender not in self.dropped:
+            self.chain.mempool.append(tx_bytes)
+        return CallbackResult(
+            payload={
+                "tx_response": {
+                    "txhash": hash_amino(tx_bytes).upper(),
+                    "code": 0,
+                    "raw_log": "[]",
+                }
+            }
+        )
+
+
+def payout(sender):
+    return [MsgSend(sender, GRANTER, Coins(uluna=1))]
+
+
+async def test_pool_spreads_transactions_over_accounts(fake_chain):
+    node = FakeNode(fake_chain)
+    terra = AsyncLCDClient(
+        url=fake_chain.url, chain_id="pisco-1", gas_prices="0.15uluna"
+    )
+
+    with aioresponses() as mocked:
+        node.mock(mocked)
+        pool = WalletPool.from_mnemonic(
+            terra,
+            fake_chain.mnemonic,
+            count=3,
+            fee_granter=GRANTER,
+            max_in_flight=2,
+            poll_interval=0.01,
+        )
+        async with pool:
+            futures = await pool.feed(payout for _ in range(12))
+        infos = await asyncio.gather(*futures)
+
+    addresses = [wallet.key.acc_address for wallet in pool.wallets]
+    assert len(set(addresses)) == 3
+    assert len({info.txhash for info in infos}) == 12
+    assert {sender for sender, _, _ in node.sent} == set(addresses)
+    assert all(granter == GRANTER for _, _, granter in node.sent)
+    for address in addresses:
+        sequences = [seq for sender, seq, _ in node.sent if sender == address]
+        assert sequences == list(range(len(sequences)))
+    await terra.close()
+
+
+async def test_pool_moves_work_off_stuck_accounts(fake_chain):
+    terra = AsyncLCDClient(
+        url=fake_chain.url, chain_id="pisco-1", gas_prices="0.15uluna"
+    )
+    pool = WalletPool.from_mnemonic(
+        terra,
+        fake_chain.mnemonic,
+        count=2,
+        max_in_flight=1,
+        cooldown=60,
+        poll_interval=0.01,
+        confirm_timeout=0.1,
+    )
+    stuck = pool.wallets[0].key.acc_address
+    node = FakeNode(fake_chain, dropped={stuck})
+
+    with aioresponses() as mocked:
+        node.mock(mocked)
+        first = await pool.submit(payout)
+        with pytest.raises(asyncio.TimeoutError):
+            await first
+        assert [wallet.key.acc_address for wallet in pool.stuck] == [stuck]
+
+        futures = await pool.feed(payout for _ in range(3))
+        await asyncio.gather(*futures)
+        await pool.close()
+
+    senders = [sender for sender, _, _ in node.sent]
+    assert senders[0] == stuck
+    assert stuck not in senders[1:]
+    await terra.close()
+
+
+async def test_pool_resubmits_transactions_queued_on_stuck_accounts(fake_chain):
+    terra = AsyncLCDClient(
+        url=fake_chain.url, chain_id="pisco-1", gas_prices="0.15uluna"
+    )
+    pool = WalletPool.from_mnemonic(
+        terra,
+        fake_chain.mnemonic,
+        count=2,
+        max_in_flight=3,
+        cooldown=60,
+        poll_interval=0.01,
+        confirm_timeout=0.2,
+    )
+    stuck, healthy = [wallet.key.acc_address for wallet in pool.wallets]
+    node = FakeNode(fake_chain, dropped={stuck}, held={stuck})
+
+    with aioresponses() as mocked:
+        node.mock(mocked)
+        futures = await pool.feed(payout for _ in range(6))
+        # the first transaction of the stuck account times out, the second one is
+        # being broadcast, and the third is still queued behind it
+        done, pending = await asyncio.wait(futures, timeout=1)
+        await pool.close()
+
+    assert len(pending) == 1
+    assert sum(isinstance(f.exception(), asyncio.TimeoutError) for f in done) == 1
+    infos = [f.result() for f in done if f.exception() is None]
+    assert len(infos) == 4
+    assert {info.tx.body.messages[0].from_address for info in infos} == {healthy}
+    await terra.close()
+
+
+async def test_pool_needs_transactions_built_for_the_sender(fake_chain):
+    terra = AsyncLCDClient(url=fake_chain.url, chain_id="pisco-1")
+    pool = WalletPool.from_mnemonic(terra, fake_chain.mnemonic, count=2)
+    sender = pool.wallets[0].key.acc_address
+
+    # fixed messages name one sender, but the pool may pick another account
+    with pytest.raises(TypeError):
+        await pool.submit(payout(sender))
+    await pool.close()
+    await terra.close()
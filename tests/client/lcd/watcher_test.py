@@ -0,0 +1,94 @@
+import asyncio
+import base64
+
+import pytest
+from aioresponses import aioresponses
+
+from terra_sdk.client.lcd import AsyncLCDClient
+from terra_sdk.client.lcd.watcher import ConfirmationWatcher
+from terra_sdk.core import Coins
+from terra_sdk.core.fee import Fee
+from terra_sdk.core.tx import AuthInfo, Tx, TxBody
+from terra_sdk.util.hash import hash_amino
+
+
+def make_tx(memo):
+    tx = Tx(TxBody([], memo, 0), AuthInfo([], Fee(0, Coins())), [])
+    return base64.b64encode(bytes(tx.to_proto())).decode()
+
+
+async def test_watcher_searches_only_blocks_with_watched_transactions(fake_chain):
+    a, b, c, other = make_tx("a"), make_tx("b"), make_tx("c"), make_tx("other")
+    fake_chain.plan([[], [a, other], [other], [b, c]])
+    terra = AsyncLCDClient(url=fake_chain.url, chain_id="pisco-1")
+    watcher = ConfirmationWatcher(terra, poll_interval=0.01)
+
+    with aioresponses() as mocked:
+        fake_chain.mock(mocked)
+        infos = await asyncio.gather(
+            *[watcher.watch(hash_amino(tx).lower()) for tx in (a, b, c)]
+        )
+
+    assert [info.tx.body.memo for info in infos] == ["a", "b", "c"]
+    assert [info.height for info in infos] == [101, 103, 103]
+    assert fake_chain.searched == [101, 103]
+    assert watcher.pending == []
+    await watcher.close()
+    await terra.close()
+
+
+async def test_watcher_finds_transactions_included_before_they_are_watched(
+    fake_chain,
+):
+    a = make_tx("a")
+    fake_chain.plan([[], [a], []])
+    terra = AsyncLCDClient(url=fake_chain.url, chain_id="pisco-1")
+    watcher = ConfirmationWatcher(terra, poll_interval=0.01)
+
+    with aioresponses() as mocked:
+        fake_chain.mock(mocked)
+        waiting = watcher.watch(hash_amino(make_tx("never")))
+        while fake_chain.height < 101:
+            await asyncio.sleep(0.01)
+        info = await asyncio.wait_for(watcher.watch(hash_amino(a)), 1)
+        assert info.height == 101
+        assert not waiting.done()
+        await watcher.close()
+
+    assert waiting.cancelled()
+    await terra.close()
+
+
+async def test_watcher_looks_back_when_polling_starts(fake_chain, caplog):
+    a = make_tx("a")
+    fake_chain.plan([[a], [], [], []])
+    fake_chain.height = 101
+    terra = AsyncLCDClient(url=fake_chain.url, chain_id="pisco-1")
+    watcher = ConfirmationWatcher(terra, poll_interval=0.01, lookback_blocks=3)
+
+    with aioresponses() as mocked:
+        mocked.get(fake_chain.latest_block_url, status=500)
+        fake_chain.mock(mocked)
+        info = await asyncio.wait_for(watcher.watch(hash_amino(a)), 1)
+
+    assert info.height == 100
+    assert fake_chain.searched == [100]
+    assert "polling for confirmations failed" in caplog.text
+    await watcher.close()
+    await terra.close()
+
+
+async def test_watcher_times_out_after_timeout_height(fake_chain):
+    terra = AsyncLCDClient(url=fake_chain.url, chain_id="pisco-1")
+    watcher = ConfirmationWatcher(terra, poll_interval=0.01)
+
+    with aioresponses() as mocked:
+        fake_chain.mock(mocked)
+        with pytest.raises(asyncio.TimeoutError):
+            await watcher.watch(hash_amino(make_tx("late")), timeout_height=102)
+        assert fake_chain.height == 102
+        with pytest.raises(asyncio.TimeoutError):
+            await watcher.watch(hash_amino(make_tx("late")), timeout=0.05)
+
+    await watcher.close()
+    await terra.close()
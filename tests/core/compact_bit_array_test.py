@@ -0,0 +1,25 @@
+import random
+
+from terra_sdk.core.compact_bit_array import CompactBitArray, _popcount_bytes
+
+
+def test_num_true_bits_before():
+    rng = random.Random(0)
+    for bits in (1, 7, 8, 9, 64, 300):
+        array = CompactBitArray.from_bits(bits)
+        set_bits = {i for i in range(bits) if rng.random() < 0.5}
+        for i in set_bits:
+            array.set_index(i, True)
+
+        for index in range(bits + 2):
+            assert array.num_true_bits_before(index) == len(
+                [i for i in set_bits if i < index]
+            )
+        assert array.num_true_bits() == len(set_bits)
+        assert array.true_indices() == sorted(set_bits)
+
+
+def test_popcount_bytes():
+    rng = random.Random(0)
+    for n in [0, 1, 255, 256] + [rng.getrandbits(bits) for bits in (7, 64, 1000)]:
+        assert _popcount_bytes(n) == bin(n).count("1")
@@ -0,0 +1,59 @@
+import pytest
+
+from terra_sdk.core import LegacyAminoMultisigPublicKey, SignatureV2
+from terra_sdk.core.multisig import MultiSignature
+from terra_sdk.core.public_key import SimplePublicKey, encode_uvarint
+from terra_sdk.core.signature_v2 import Descriptor
+from terra_sdk.core.signature_v2 import Single as SingleDescriptor
+from terra_sdk.core.tx import SignMode
+
+
+def public_key(i):
+    return SimplePublicKey(bytes([2]) + i.to_bytes(32, "big"))
+
+
+def signature(i):
+    return SignatureV2(
+        public_key(i),
+        Descriptor(
+            single=SingleDescriptor(
+                SignMode.SIGN_MODE_LEGACY_AMINO_JSON, i.to_bytes(64, "big")
+            )
+        ),
+        0,
+    )
+
+
+def test_encode_uvarint():
+    assert encode_uvarint(0) == [0]
+    assert encode_uvarint(127) == [127]
+    assert encode_uvarint(128) == [0x80, 0x01]
+    assert encode_uvarint("300") == [0xAC, 0x02]
+    assert bytes(encode_uvarint(2**64 - 1)) == b"\xff" * 9 + b"\x01"
+    with pytest.raises(ValueError):
+        encode_uvarint(-1)
+
+
+def test_collects_signatures_of_large_multisig():
+    pubkey = LegacyAminoMultisigPublicKey(150, [public_key(i) for i in range(200)])
+    assert pubkey.address().startswith("terra1")
+
+    signers = [17, 3, 150, 199, 0, 64, 3]
+    one_by_one = MultiSignature(pubkey)
+    for i in signers:
+        one_by_one.append_signature_from_pubkey(signature(i).data, public_key(i))
+    batch = MultiSignature(pubkey)
+    batch.append_signature_v2s([signature(i) for i in signers[:3]])
+    batch.append_signature_v2s([signature(i) for i in signers[3:]])
+
+    assert batch.to_signature_descriptor() == one_by_one.to_signature_descriptor()
+    assert batch.bitarray.true_indices() == sorted(set(signers))
+    assert [s.single.signature for s in batch.signatures] == [
+        signature(i).data.single.signature for i in sorted(set(signers))
+    ]
+
+
+def test_rejects_signatures_of_other_keys():
+    multisig = MultiSignature(LegacyAminoMultisigPublicKey(1, [public_key(1)]))
+    with pytest.raises(ValueError):
+        multisig.append_signature_v2s([signature(2)])
@@ -139,3 +139,9 @@ def test_modulo():
     assert (Dec(3) % Dec(2)) == 1
     assert (Dec(2) % Dec(1)) == 0
     assert (Dec("32") % Dec("1")) == 0
+
+
+def test_from_proto():
+    assert Dec.from_proto("100000000000000000") == Dec("0.1")
+    assert Dec.from_proto("0.100000000000000000") == Dec("0.1")
+    assert Dec.from_proto("") == Dec(0)
@@ -0,0 +1,61 @@
+import base64
+
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.fee import Fee
+from terra_sdk.core.tx import AuthInfo, Tx, TxBody
+from terra_sdk.util.hash import hash_amino, hash_bytes
+
+ADDRESS = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+
+
+def make_tx():
+    send = MsgSend(ADDRESS, ADDRESS, Coins(uluna=1))
+    return Tx(TxBody([send], "memo", 0), AuthInfo([], Fee(200000, Coins(uluna=1))), [])
+
+
+def test_to_bytes_matches_proto_encoding():
+    tx = make_tx()
+    tx.signatures.append(b"signature")
+    assert tx.to_bytes() == bytes(tx.to_proto())
+    assert tx.body.to_bytes() == bytes(tx.body.to_proto())
+    assert tx.auth_info.to_bytes() == bytes(tx.auth_info.to_proto())
+    assert Tx.from_bytes(tx.to_bytes()).to_bytes() == tx.to_bytes()
+
+
+def test_to_bytes_follows_changes_made_in_place():
+    tx = make_tx()
+    encoded = tx.to_bytes()
+
+    tx.body.messages[0].amount = Coins(uluna=2)
+    assert tx.to_bytes() == bytes(tx.to_proto()) != encoded
+
+    tx.auth_info.fee.gas_limit = 300000
+    assert tx.to_bytes() == bytes(tx.to_proto())
+
+
+def test_to_bytes_is_reused_until_a_finalized_tx_changes():
+    tx = make_tx()
+    assert tx.finalize() is tx
+    encoded = tx.to_bytes()
+    assert tx.to_bytes() is encoded
+
+    tx.signatures.append(b"signature")
+    assert tx.to_bytes() == bytes(tx.to_proto()) != encoded
+
+    body = tx.body.to_bytes()
+    tx.body.memo = "other"
+    assert tx.body.to_bytes() != body
+    tx.body.messages.append(MsgSend(ADDRESS, ADDRESS, Coins(uluna=2)))
+    assert tx.to_bytes() == bytes(tx.to_proto())
+
+    tx.auth_info.fee = Fee(300000, Coins(uluna=2))
+    assert tx.to_bytes() == bytes(tx.to_proto())
+
+    tx.body = TxBody([MsgSend(ADDRESS, ADDRESS, Coins(uluna=3))], "memo", 0)
+    assert tx.to_bytes() == bytes(tx.to_proto())
+
+
+def test_hash_bytes_matches_hash_amino():
+    tx_bytes = make_tx().to_bytes()
+    assert hash_bytes(tx_bytes) == hash_amino(base64.b64encode(tx_bytes))
@@ -78,3 +78,29 @@ def test_signature():
         sigBytes2
         == b"4Udg3FbCLAVd5vxrI5EY5Dv6A9DXKarRzD8bamE36qsH1JoelXbmf1pg0GRG4CkxySfAlDfHdCsK8FOGv9fCNA=="
     )
+
+
+def test_create_and_sign_share_messages():
+    terra = LCDClient(url="https://lcd.test", chain_id="pisco-1")
+    mk = MnemonicKey()
+    send = MsgSend(mk.acc_address, mk.acc_address, Coins(uluna=1))
+    options = CreateTxOptions(msgs=[send], fee=Fee(200000, Coins(uluna=30000)))
+
+    tx = terra.tx.create(
+        [SignerOptions(mk.acc_address, sequence=0, public_key=mk.public_key)], options
+    )
+    assert tx.body.messages[0] is send
+
+    sign_doc = SignDoc(
+        chain_id="pisco-1",
+        account_number=1,
+        sequence=0,
+        auth_info=tx.auth_info,
+        tx_body=tx.body,
+    )
+    signer_infos = sign_doc.auth_info.signer_infos
+    signature = mk.create_signature(sign_doc)
+    assert sign_doc.auth_info.signer_infos is signer_infos
+    assert signer_infos == []
+    assert signature.sequence == 0
+    terra.close()
@@ -0,0 +1,63 @@
+import hashlib
+import pickle
+
+import pytest
+from ecdsa import SECP256k1, SigningKey
+from ecdsa.util import sigencode_string_canonize
+
+from terra_sdk.key.mnemonic import MnemonicKey
+from terra_sdk.key.raw import RawKey
+from terra_sdk.key.secp256k1 import load_signer, verify
+
+PRIVATE_KEY = bytes.fromhex(
+    "9b2f8a6e43c1bd3e1d2ae1c2b1f5bc22e9b8cb0e9d3a0c4e3f4f3b52e1a2c3d4"
+)
+PUBLIC_KEY = bytes.fromhex(
+    "028c3d24c309aa85d5a0d6ef5d7fa242177c1040966e76c81a3d3575f023281791"
+)
+# RFC 6979 signature of b"payload", as signed by libsecp256k1
+SIGNATURE = bytes.fromhex(
+    "aa986857fed0ef0e480d46d8b230e0f13b111805a15a377c04bb25ebfc65507e"
+    "010bdd2afeecd380378cd83c00280fd94768a64a1579a5d9c392730063ea01ce"
+)
+
+
+def reference_signature(private_key, payload):
+    return SigningKey.from_string(private_key, curve=SECP256k1).sign_deterministic(
+        payload, hashfunc=hashlib.sha256, sigencode=sigencode_string_canonize
+    )
+
+
+@pytest.mark.parametrize("backend", ["ecdsa", "coincurve"])
+def test_backends_produce_canonical_signatures(backend):
+    if backend == "coincurve":
+        pytest.importorskip("coincurve")
+    key = RawKey(PRIVATE_KEY, backend)
+    for i in range(20):
+        payload = b"payload %d" % i
+        assert key.sign(payload) == reference_signature(PRIVATE_KEY, payload)
+    assert key.public_key == RawKey(PRIVATE_KEY, "ecdsa").public_key
+
+
+@pytest.mark.parametrize("backend", ["ecdsa", "coincurve"])
+def test_backends_match_test_vector(backend):
+    if backend == "coincurve":
+        pytest.importorskip("coincurve")
+    signer = load_signer(PRIVATE_KEY, backend)
+    assert signer.public_key == PUBLIC_KEY
+    assert signer.sign(b"payload") == SIGNATURE
+    assert verify(PUBLIC_KEY, b"payload", SIGNATURE, backend)
+    assert not verify(PUBLIC_KEY, b"other payload", SIGNATURE, backend)
+
+
+def test_key_is_parsed_again_after_pickling():
+    key = MnemonicKey(backend="ecdsa")
+    loaded = pickle.loads(pickle.dumps(key))
+    assert loaded._signer is None
+    assert loaded.sign(b"payload") == key.sign(b"payload")
+    assert loaded.acc_address == key.acc_address
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        load_signer(PRIVATE_KEY, "openssl")
@@ -0,0 +1,53 @@
+import pytest
+
+from terra_sdk.core import Coins
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.fee import Fee
+from terra_sdk.core.tx import AuthInfo, SignMode, Tx, TxBody
+from terra_sdk.key.key import SignOptions
+from terra_sdk.key.mnemonic import MnemonicKey
+
+MNEMONIC = (
+    "notice oak worry limit wrap speak medal online prefer cluster roof addict wrist "
+    "behave treat actual wasp year salad speed social layer crew genius"
+)
+
+
+def unsigned_txs(key, count):
+    return [
+        Tx(
+            TxBody([MsgSend(key.acc_address, key.acc_address, Coins(uluna=i + 1))]),
+            AuthInfo([], Fee(200000, Coins(uluna=30000))),
+            [],
+        )
+        for i in range(count)
+    ]
+
+
+def test_sign_txs_in_worker_processes():
+    key = MnemonicKey(MNEMONIC)
+    txs = unsigned_txs(key, 10)
+    options = SignOptions(
+        account_number=7,
+        sequence=3,
+        sign_mode=SignMode.SIGN_MODE_DIRECT,
+        chain_id="pisco-1",
+    )
+
+    signed = key.sign_txs(txs, options, max_workers=2)
+
+    expected = [
+        key.sign_tx(tx, SignOptions(7, 3 + i, SignMode.SIGN_MODE_DIRECT, "pisco-1"))
+        for i, tx in enumerate(txs)
+    ]
+    assert [tx.to_bytes() for tx in signed] == [tx.to_bytes() for tx in expected]
+    assert [tx.auth_info.signer_infos[0].sequence for tx in signed] == list(
+        range(3, 13)
+    )
+
+
+def test_sign_txs_needs_options_per_transaction():
+    key = MnemonicKey(MNEMONIC)
+    options = SignOptions(7, 3, SignMode.SIGN_MODE_DIRECT, "pisco-1")
+    with pytest.raises(ValueError):
+        key.sign_txs(unsigned_txs(key, 2), [options])
@@ -0,0 +1,111 @@
+import pytest
+from betterproto import encode_varint
+from terra_proto.cosmos.tx.v1beta1 import SignDoc as SignDoc_pb
+from terra_proto.cosmos.tx.v1beta1 import TxRaw as TxRaw_pb
+
+from terra_sdk.core import Coins, SignatureV2, SignDoc
+from terra_sdk.core.bank import MsgSend
+from terra_sdk.core.fee import Fee
+from terra_sdk.core.multisig import MultiSignature
+from terra_sdk.core.public_key import LegacyAminoMultisigPublicKey
+from terra_sdk.core.tx import AuthInfo, SignMode, Tx, TxBody
+from terra_sdk.key.key import SignOptions
+from terra_sdk.key.mnemonic import MnemonicKey
+from terra_sdk.key.verifier import verify_tx, verify_txs
+
+MNEMONIC = (
+    "notice oak worry limit wrap speak medal online prefer cluster roof addict wrist "
+    "behave treat actual wasp year salad speed social layer crew genius"
+)
+RECIPIENT = "terra1x46rqay4d3cssq8gxxvqz8xt6nwlz4td20k38v"
+
+
+def unsigned_tx(sender, memo="memo"):
+    return Tx(
+        TxBody([MsgSend(sender, RECIPIENT, Coins(uluna=1))], memo),
+        AuthInfo([], Fee(200000, Coins(uluna=30000))),
+        [],
+    )
+
+
+def received(tx):
+    return Tx.from_bytes(tx.to_bytes())
+
+
+def non_critical_field(number, value):
+    # a varint field the chain accepts in a tx body even if it does not know it
+    return encode_varint(number << 3) + encode_varint(value)
+
+
+@pytest.mark.parametrize(
+    "sign_mode", [SignMode.SIGN_MODE_DIRECT, SignMode.SIGN_MODE_LEGACY_AMINO_JSON]
+)
+def test_verify_tx(sign_mode):
+    key = MnemonicKey(MNEMONIC)
+    tx = key.sign_tx(
+        unsigned_tx(key.acc_address), SignOptions(5, 3, sign_mode, "pisco-1")
+    )
+
+    assert verify_tx(tx.to_bytes(), "pisco-1", 5)
+    assert verify_tx(received(tx), "pisco-1", 5)
+    assert not verify_tx(tx.to_bytes(), "phoenix-1", 5)
+    assert not verify_tx(tx.to_bytes(), "pisco-1", 6)
+
+    tampered = received(tx)
+    tampered.body.memo = "other"
+    assert not verify_tx(tampered.to_bytes(), "pisco-1", 5)
+    assert not verify_tx(tampered, "pisco-1", 5)
+
+
+def test_verify_tx_checks_the_received_bytes():
+    key = MnemonicKey(MNEMONIC)
+    tx = key.sign_tx(
+        unsigned_tx(key.acc_address),
+        SignOptions(5, 3, SignMode.SIGN_MODE_DIRECT, "pisco-1"),
+    )
+    # another encoder may add fields this SDK drops when decoding
+    body_bytes = tx.body.to_bytes() + non_critical_field(1025, 1)
+    auth_info_bytes = tx.auth_info.to_bytes()
+    signature = key.sign(bytes(SignDoc_pb(body_bytes, auth_info_bytes, "pisco-1", 5)))
+    raw = bytes(TxRaw_pb(body_bytes, auth_info_bytes, [signature]))
+
+    assert verify_tx(raw, "pisco-1", 5)
+    assert not verify_tx(Tx.from_bytes(raw), "pisco-1", 5)
+
+
+def test_verify_multisig_tx():
+    keys = [MnemonicKey(MNEMONIC, index=i) for i in range(3)]
+    multisig_pubkey = LegacyAminoMultisigPublicKey(2, [k.public_key for k in keys])
+    tx = unsigned_tx(multisig_pubkey.address())
+    doc = SignDoc("pisco-1", 5, 0, tx.auth_info, tx.body)
+
+    def signed_by(*signers):
+        multisig = MultiSignature(multisig_pubkey)
+        multisig.append_signature_v2s([k.create_signature_amino(doc) for k in signers])
+        signed = unsigned_tx(multisig_pubkey.address())
+        signed.append_signatures(
+            [SignatureV2(multisig_pubkey, multisig.to_signature_descriptor(), 0)]
+        )
+        return received(signed)
+
+    assert verify_tx(signed_by(keys[2], keys[0]), "pisco-1", 5)
+    assert not verify_tx(signed_by(keys[1]), "pisco-1", 5)
+
+
+def test_verify_txs_in_worker_processes():
+    key = MnemonicKey(MNEMONIC)
+    options = SignOptions(5, 0, SignMode.SIGN_MODE_DIRECT, "pisco-1")
+    txs = key.sign_txs(
+        [unsigned_tx(key.acc_address, str(i)) for i in range(6)], options
+    )
+    txs[4].body.memo = "tampered"
+
+    received = [tx.to_bytes() for tx in txs]
+    assert verify_txs(received, "pisco-1", [5] * 6, max_workers=2) == [
+        True,
+        True,
+        True,
+        True,
+        False,
+        True,
+    ]